@@ -16,12 +16,18 @@ def _is_browser() -> bool:
     return sys.platform == "emscripten"
 
 
-def _log(msg: str) -> None:
-    """Log message - print for browser (shows in console), logging for desktop."""
+def _log(level: int, msg: str, *args: object) -> None:
+    """Log message - print for browser (shows in console), logging for desktop.
+
+    ``msg % args`` is only built if ``level`` is enabled for this module, so
+    pass response bodies as arguments at DEBUG rather than formatting them.
+    """
+    if not logger.isEnabledFor(level):
+        return
     if _is_browser():
-        print(f"[API] {msg}")
+        print(f"[API] {msg % args if args else msg}")
     else:
-        logger.info(msg)
+        logger.log(level, msg, *args)
 
 
 def _get_api_base_url() -> str:
@@ -43,7 +49,10 @@ class APIClient:
     def __init__(self):
         self._token: Optional[str] = None
         _log(
-            f"APIClient initialized, is_browser={_is_browser()}, base_url={_get_api_base_url()}"
+            logging.INFO,
+            "APIClient initialized, is_browser=%s, base_url=%s",
+            _is_browser(),
+            _get_api_base_url(),
         )
 
     async def _fetch_json(
@@ -52,7 +61,7 @@ class APIClient:
         """Make HTTP request and return JSON response."""
         base_url = _get_api_base_url()
         url = f"{base_url}{path}"
-        _log(f"API request: {method} {url}")
+        _log(logging.DEBUG, "API request: %s %s", method, url)
 
         if _is_browser():
             return await self._browser_fetch(method, url, data)
@@ -85,14 +94,14 @@ class APIClient:
                 xhr.send()
 
             if xhr.status >= 400:
-                _log(f"Browser fetch failed with status {xhr.status}")
+                _log(logging.WARNING, "Browser fetch failed with status %s", xhr.status)
                 return {}
 
             # Parse JSON response
             response_text = xhr.responseText
             return json.loads(response_text) if response_text else {}
         except Exception as e:
-            _log(f"Browser fetch error: {e}")
+            _log(logging.WARNING, "Browser fetch error: %s", e)
             return {}
 
     async def _desktop_fetch(
@@ -110,10 +119,15 @@ class APIClient:
                 if method == "GET":
                     async with session.get(url, headers=headers) as response:
                         if response.status != 200:
-                            _log(f"GET {url} failed with status {response.status}")
+                            _log(
+                                logging.WARNING,
+                                "GET %s failed with status %s",
+                                url,
+                                response.status,
+                            )
                             return {}
                         result = await response.json()
-                        _log(f"GET {url} success: {result}")
+                        _log(logging.DEBUG, "GET %s success: %s", url, result)
                         return result
                 elif method == "POST":
                     async with session.post(
@@ -122,14 +136,18 @@ class APIClient:
                         if response.status not in (200, 201):
                             text = await response.text()
                             _log(
-                                f"POST {url} failed with status {response.status}: {text}"
+                                logging.WARNING,
+                                "POST %s failed with status %s: %s",
+                                url,
+                                response.status,
+                                text,
                             )
                             return {}
                         result = await response.json()
-                        _log(f"POST {url} success: {result}")
+                        _log(logging.DEBUG, "POST %s success: %s", url, result)
                         return result
             except aiohttp.ClientError as e:
-                _log(f"HTTP client error for {method} {url}: {e}")
+                _log(logging.WARNING, "HTTP client error for %s %s: %s", method, url, e)
                 return {}
 
         return {}
@@ -139,9 +157,9 @@ class APIClient:
         result = await self._fetch_json("POST", "/tokens")
         token = result.get("token")
         if token:
-            _log("Got submission token")
+            _log(logging.DEBUG, "Got submission token")
         else:
-            _log("Failed to get submission token")
+            _log(logging.WARNING, "Failed to get submission token")
         return token
 
     async def get_highest_score(self) -> int:
@@ -154,10 +172,10 @@ class APIClient:
 
     async def get_top_scores(self, limit: int = 10) -> list[HighScore]:
         """Retrieve top N scores."""
-        _log(f"Fetching top {limit} scores")
+        _log(logging.DEBUG, "Fetching top %d scores", limit)
         result = await self._fetch_json("GET", f"/scores?limit={limit}")
         scores = result.get("scores", [])
-        _log(f"Got {len(scores)} scores")
+        _log(logging.DEBUG, "Got %d scores", len(scores))
         return [
             HighScore(
                 id=s.get("id", 0),
@@ -182,12 +200,12 @@ class APIClient:
 
     async def save_score(self, player_name: str, score: int) -> Optional[int]:
         """Submit a new high score. Returns the new row ID or None on failure."""
-        _log(f"Saving score: player={player_name}, score={score}")
+        _log(logging.INFO, "Saving score: player=%s, score=%d", player_name, score)
 
         # Get a token first
         self._token = await self._get_token()
         if not self._token:
-            _log("Cannot save score: failed to get token")
+            _log(logging.WARNING, "Cannot save score: failed to get token")
             return None
 
         result = await self._fetch_json(
@@ -199,7 +217,7 @@ class APIClient:
 
         row_id = result.get("id")
         if row_id:
-            _log(f"Score saved successfully with id={row_id}")
+            _log(logging.INFO, "Score saved successfully with id=%s", row_id)
         else:
-            _log(f"Failed to save score: {result}")
+            _log(logging.WARNING, "Failed to save score: %s", result)
         return row_id
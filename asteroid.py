@@ -3,10 +3,20 @@ from typing import override
 
 import pygame
 from circleshape import CircleShape
-from constants import ASTEROID_MIN_RADIUS, LINE_WIDTH
+from constants import (
+    ASTEROID_MIN_RADIUS,
+    DEBRIS_LIFETIME,
+    DEBRIS_PARTICLES,
+    DEBRIS_SPEED,
+    LINE_WIDTH,
+)
+from particles import ParticleSystem
 
 
 class Asteroid(CircleShape):
+    # Set alongside containers; debris is emitted here when asteroids split
+    particles: ParticleSystem | None = None
+
     def __init__(self, x: float, y: float, radius: float) -> None:
         super().__init__(x, y, radius)
 
@@ -20,15 +30,33 @@ class Asteroid(CircleShape):
         return round(self.radius / ASTEROID_MIN_RADIUS)
 
     @override
-    def draw(self, screen: pygame.Surface) -> None:
-        pygame.draw.circle(screen, "white", self.position, self.radius, LINE_WIDTH)
+    def draw(self, screen: pygame.Surface, scale: float = 1.0) -> None:
+        pygame.draw.circle(
+            screen,
+            "white",
+            self.position * scale,
+            self.radius * scale,
+            max(1, round(LINE_WIDTH * scale)),
+        )
 
     @override
     def update(self, dt: float) -> None:
-        self.position += self.velocity * dt
+        self.previous_position.update(self.position)
+        step = self.velocity * dt
+        self.position += step
+        self.travel = step.length()
 
     def split(self) -> None:
         self.kill()
+        if self.particles is not None:
+            self.particles.emit(
+                ParticleSystem.DEBRIS,
+                self.position,
+                self.velocity,
+                DEBRIS_PARTICLES * self.get_kind(),
+                DEBRIS_SPEED,
+                DEBRIS_LIFETIME,
+            )
         if self.radius <= ASTEROID_MIN_RADIUS:
             return
         else:
@@ -0,0 +1,349 @@
+"""Micro-benchmarks for the game loop's hot paths, run headless.
+
+Times PlayingState.update and PlayingState.render with 10/100/1000
+asteroids and shots (rendering also at the lowest dynamic resolution),
+bulk CircleShape.collide_with and sweep_collides_with, Asteroid.split
+cascades, AsteroidField.update, HUD.render and a full particle budget.
+Scenes are seeded so runs are comparable. As with timeit, the best of
+several samples is the figure compared, since noise only ever adds time.
+Results can be saved as JSON and compared against a baseline; the run
+fails if any case is slower than the baseline by more than
+``--threshold``.
+
+Usage (from the repository root):
+    uv run python -m benchmarks.hot_paths [--output results.json]
+        [--baseline baseline.json] [--threshold 0.15] [--filter update]
+"""
+
+import argparse
+import asyncio
+import gc
+import inspect
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+import pygame
+
+from asteroid import Asteroid
+from asteroidfield import AsteroidField
+from circleshape import CircleShape
+from constants import (
+    ASTEROID_KINDS,
+    ASTEROID_MIN_RADIUS,
+    DEBRIS_LIFETIME,
+    PLAYER_SHOOT_SPEED,
+    SCREEN_HEIGHT,
+    SCREEN_WIDTH,
+)
+from particles import ParticleSystem
+from shot import Shot
+from states import PlayingState
+from ui.hud import HUD
+
+DT = 1 / 60
+SCENE_SIZES = (10, 100, 1000)
+
+
+@dataclass(frozen=True)
+class Case:
+    """``setup`` builds fresh state and returns the callable to time.
+
+    A sample repeatedly calls ``setup`` (untimed) and then the returned
+    callable ``number`` times, until ``min_time`` seconds have been timed;
+    the sample is the mean time per call.
+    """
+
+    name: str
+    setup: Callable[[], Callable[[], object]]
+    number: int
+
+
+def _playing_scene(entities: int) -> PlayingState:
+    """A PlayingState with ``entities`` asteroids and as many shots in flight."""
+    rng = random.Random(entities)
+    random.seed(entities)
+    state = PlayingState(game=None)
+    state._reset_game_session()
+    # Deaths would end the session partway through a sample
+    state.player.start_invincibility(duration=float("inf"))
+    for _ in range(entities):
+        asteroid = Asteroid(
+            rng.uniform(0, SCREEN_WIDTH),
+            rng.uniform(0, SCREEN_HEIGHT),
+            ASTEROID_MIN_RADIUS * rng.randint(1, ASTEROID_KINDS),
+        )
+        asteroid.velocity = pygame.Vector2(0, rng.uniform(40, 100)).rotate(
+            rng.uniform(0, 360)
+        )
+        shot = Shot(rng.uniform(0, SCREEN_WIDTH), rng.uniform(0, SCREEN_HEIGHT))
+        shot.velocity = pygame.Vector2(0, 500).rotate(rng.uniform(0, 360))
+    return state
+
+
+def _playing_update(entities: int) -> Callable[[], object]:
+    state = _playing_scene(entities)
+    return lambda: state.update(DT)
+
+
+def _playing_render(entities: int) -> Callable[[], object]:
+    state = _playing_scene(entities)
+    surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    return lambda: state.render(surface)
+
+
+def _playing_render_lowest_scale(entities: int) -> Callable[[], object]:
+    state = _playing_scene(entities)
+    state.resolution.level = len(state.resolution.levels) - 1
+    surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    return lambda: state.render(surface)
+
+
+def _circle_pairs() -> list[tuple[CircleShape, CircleShape]]:
+    rng = random.Random(0)
+    return [
+        (
+            CircleShape(rng.uniform(0, SCREEN_WIDTH), rng.uniform(0, SCREEN_HEIGHT), 5),
+            CircleShape(
+                rng.uniform(0, SCREEN_WIDTH), rng.uniform(0, SCREEN_HEIGHT), 60
+            ),
+        )
+        for _ in range(10_000)
+    ]
+
+
+def _collide_with() -> Callable[[], object]:
+    pairs = _circle_pairs()
+
+    def run() -> None:
+        for a, b in pairs:
+            a.collide_with(b)
+
+    return run
+
+
+def _sweep_collides_with() -> Callable[[], object]:
+    pairs = _circle_pairs()
+    rng = random.Random(1)
+    # Move each small shape one frame at shot speed, the large one not at all
+    for a, _ in pairs:
+        step = pygame.Vector2(0, PLAYER_SHOOT_SPEED * DT).rotate(rng.uniform(0, 360))
+        a.previous_position = a.position - step
+        a.travel = step.length()
+
+    def run() -> None:
+        for a, b in pairs:
+            a.sweep_collides_with(b)
+
+    return run
+
+
+def _split_cascade() -> Callable[[], object]:
+    """Split 100 large asteroids all the way down to nothing."""
+    random.seed(0)
+    group = pygame.sprite.Group()
+    Asteroid.containers = (group,)
+    for i in range(100):
+        asteroid = Asteroid(i * 10.0, 360.0, ASTEROID_MIN_RADIUS * ASTEROID_KINDS)
+        asteroid.velocity = pygame.Vector2(0, 80)
+
+    def run() -> None:
+        while group:
+            for asteroid in list(group):
+                asteroid.split()
+
+    return run
+
+
+def _asteroid_field_update() -> Callable[[], object]:
+    random.seed(0)
+    spawned = pygame.sprite.Group()
+    Asteroid.containers = (spawned,)
+    AsteroidField.containers = ()
+    field = AsteroidField()
+    return lambda: field.update(DT)
+
+
+def _full_particles() -> ParticleSystem:
+    random.seed(0)
+    particles = ParticleSystem()
+    rng = random.Random(0)
+    for _ in range(particles.capacity // 8):
+        particles.emit(
+            ParticleSystem.DEBRIS,
+            pygame.Vector2(rng.uniform(0, SCREEN_WIDTH), rng.uniform(0, SCREEN_HEIGHT)),
+            pygame.Vector2(0, 0),
+            8,
+            120,
+            # Long enough that none expire during a sample
+            DEBRIS_LIFETIME * 100,
+        )
+    return particles
+
+
+def _particles_update() -> Callable[[], object]:
+    particles = _full_particles()
+    return lambda: particles.update(DT)
+
+
+def _particles_draw() -> Callable[[], object]:
+    particles = _full_particles()
+    surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    return lambda: particles.draw(surface)
+
+
+def _hud_render() -> Callable[[], object]:
+    hud = HUD()
+    surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    return lambda: hud.render(surface, 123_450, 3)
+
+
+CASES = [
+    *(
+        Case(f"playing_update_{n}", lambda n=n: _playing_update(n), 10)
+        for n in SCENE_SIZES
+    ),
+    *(
+        Case(f"playing_render_{n}", lambda n=n: _playing_render(n), 10)
+        for n in SCENE_SIZES
+    ),
+    Case(
+        "playing_render_1000_lowest_scale",
+        lambda: _playing_render_lowest_scale(1000),
+        10,
+    ),
+    Case("collide_with_10k", _collide_with, 1),
+    Case("sweep_collides_with_10k", _sweep_collides_with, 1),
+    Case("asteroid_split_cascade_100", _split_cascade, 1),
+    Case("asteroid_field_update", _asteroid_field_update, 600),
+    Case("hud_render", _hud_render, 200),
+    Case("particles_update_full", _particles_update, 100),
+    Case("particles_draw_full", _particles_draw, 100),
+]
+
+
+async def _sample(case: Case, min_time: float) -> float:
+    elapsed, calls = 0.0, 0
+    while elapsed < min_time:
+        run = case.setup()
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            for _ in range(case.number):
+                result = run()
+                if inspect.isawaitable(result):
+                    await result
+            elapsed += time.perf_counter() - start
+        finally:
+            gc.enable()
+        calls += case.number
+    return elapsed / calls
+
+
+async def measure(
+    cases: list[Case], samples: int, min_time: float
+) -> dict[str, dict[str, float]]:
+    results = {}
+    for case in cases:
+        await _sample(case, min_time)  # warm-up
+        times = [await _sample(case, min_time) for _ in range(samples)]
+        results[case.name] = {
+            "best_us": round(min(times) * 1e6, 2),
+            "median_us": round(statistics.median(times) * 1e6, 2),
+            "samples": samples,
+        }
+        print(
+            f"{case.name:>28}: {results[case.name]['best_us']:12.1f} us "
+            f"(median {results[case.name]['median_us']:.1f})"
+        )
+    return results
+
+
+def compare(
+    results: dict[str, dict[str, float]],
+    baseline: dict[str, dict[str, float]],
+    threshold: float,
+) -> list[str]:
+    """Print the change against ``baseline``; return the cases that regressed."""
+    regressions = []
+    print(f"\n{'case':>28}  {'baseline':>12}  {'current':>12}  change")
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            print(f"{name:>28}  {'-':>12}  {current['best_us']:12.1f}  new")
+            continue
+        ratio = current["best_us"] / previous["best_us"]
+        flag = ""
+        if ratio > 1 + threshold:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(
+            f"{name:>28}  {previous['best_us']:12.1f}  "
+            f"{current['best_us']:12.1f}  {ratio - 1:+7.1%}{flag}"
+        )
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--samples", type=int, default=7)
+    parser.add_argument(
+        "--min-time", type=float, default=0.05, help="seconds timed per sample"
+    )
+    parser.add_argument("--filter", help="only run cases whose name contains this")
+    parser.add_argument("--output", type=Path, help="write results as JSON")
+    parser.add_argument("--baseline", type=Path, help="results JSON to compare to")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.15,
+        help="fail if a case is this fraction slower than the baseline",
+    )
+    args = parser.parse_args()
+
+    # Headless: no window, no audio device
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    pygame.init()
+    # Player.update reads the keyboard, which needs a display
+    pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    cases = [c for c in CASES if args.filter is None or args.filter in c.name]
+    results = asyncio.run(measure(cases, args.samples, args.min_time))
+    pygame.quit()
+
+    if args.output:
+        args.output.write_text(
+            json.dumps(
+                {
+                    "python": platform.python_version(),
+                    "pygame": pygame.version.ver,
+                    "machine": platform.machine(),
+                    "results": results,
+                },
+                indent=2,
+            )
+        )
+        print(f"Results written to {args.output}")
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text())["results"]
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(
+                f"\n{len(regressions)} case(s) more than {args.threshold:.0%} "
+                f"slower than {args.baseline}: {', '.join(regressions)}"
+            )
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
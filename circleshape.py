@@ -11,11 +11,14 @@ class CircleShape(pygame.sprite.Sprite):
             super().__init__()
 
         self.position = pygame.Vector2(x, y)
+        # Where the last update() moved from and how far, for swept checks
+        self.previous_position = pygame.Vector2(x, y)
+        self.travel = 0.0
         self.velocity = pygame.Vector2(0, 0)
         self.radius = radius
 
-    def draw(self, screen: pygame.Surface) -> None:
-        # must override
+    def draw(self, screen: pygame.Surface, scale: float = 1.0) -> None:
+        # must override; scale maps logical coordinates onto the screen
         pass
 
     def update(self, dt: float) -> None:
@@ -30,3 +33,25 @@ class CircleShape(pygame.sprite.Sprite):
             return False
         else:
             return True
+
+    def sweep_collides_with(self, other: "CircleShape") -> bool:
+        """Like collide_with, but also catches contacts between two frames.
+
+        Both shapes are taken to have moved in a straight line from their
+        previous_position. The closest approach along that relative path is
+        checked, so a fast, small shape cannot pass through another without
+        touching it at either frame's position.
+        """
+        sum_radius = self.radius + other.radius
+        # Too far apart to have met however they moved; most pairs stop here
+        reach = sum_radius + self.travel + other.travel
+        if self.position.distance_squared_to(other.position) > reach * reach:
+            return False
+
+        start = self.previous_position - other.previous_position
+        motion = self.position - other.position - start
+        length_squared = motion.length_squared()
+        if length_squared > 0:
+            t = min(max(-start.dot(motion) / length_squared, 0.0), 1.0)
+            start += motion * t
+        return start.length_squared() <= sum_radius * sum_radius
@@ -31,3 +31,26 @@ FONT_SIZE_LARGE = 72
 FONT_SIZE_MEDIUM = 48
 FONT_SIZE_SMALL = 32
 HUD_MARGIN = 20
+
+# Particles
+PARTICLE_BUDGET = 512  # live particles; the oldest are replaced beyond this
+PARTICLE_SIZE = 2  # pixels
+PARTICLE_FADE_STEPS = 4
+DEBRIS_PARTICLES = 8  # per asteroid kind (size) on split
+DEBRIS_SPEED = 120
+DEBRIS_LIFETIME = 0.8  # seconds
+EXHAUST_PARTICLES_PER_SECOND = 90
+EXHAUST_SPEED = 80
+EXHAUST_SPREAD = 40  # degrees
+EXHAUST_LIFETIME = 0.35  # seconds
+
+# Dynamic resolution
+FRAME_BUDGET_MS = 1000 / 60
+RENDER_SCALE_LEVELS = (1.0, 0.75, 0.5)  # playfield resolution, as a screen fraction
+RENDER_SCALE_DOWN_FRAMES = 5  # frames over budget before dropping a level
+RENDER_SCALE_UP_FRAMES = 180  # frames with ample headroom before raising one
+
+# Frame pacing
+FPS = 60
+IDLE_TICK_RATE = 10  # updates per second while an idle-aware screen is unchanged
+IDLE_POLL_SECONDS = 1 / FPS  # how often an idle loop checks for input
@@ -1,10 +1,17 @@
 import asyncio
 import sys
+import time
 
 import pygame
 
 from api_client import APIClient
-from constants import SCREEN_HEIGHT, SCREEN_WIDTH
+from constants import (
+    FPS,
+    IDLE_POLL_SECONDS,
+    IDLE_TICK_RATE,
+    SCREEN_HEIGHT,
+    SCREEN_WIDTH,
+)
 from score_repository import ScoreRepository
 from states import (
     BaseState,
@@ -44,6 +51,9 @@ class Game:
 
         self.current_state_type = GameStateType.MAIN_MENU
         self._initial_enter_done = False
+        # Set after an idle wait or a state change, whose time should not
+        # reach the next update() as one long step
+        self._clamp_next_dt = False
 
     @property
     def current_state(self) -> BaseState:
@@ -64,6 +74,8 @@ class Game:
             pass
         else:
             await self.current_state.enter()
+        self.current_state.dirty = True
+        self._clamp_next_dt = True
 
     async def run(self):
         """Main game loop."""
@@ -73,25 +85,62 @@ class Game:
             self._initial_enter_done = True
 
         while True:
-            dt = self.clock.tick(60) / 1000.0
+            waited = []
+            if not self.current_state.dirty:
+                # Nothing changed since the last frame: idle until input
+                waited = await self._wait_for_events()
+                self._clamp_next_dt = True
+
+            dt = self.clock.tick(FPS) / 1000.0
 
-            for event in pygame.event.get():
+            for event in waited + pygame.event.get():
                 if event.type == pygame.QUIT:
                     self._quit()
+                if event.type in (pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE):
+                    self.current_state.dirty = True
 
                 new_state = await self.current_state.handle_event(event)
                 if new_state:
                     await self.change_state(new_state)
 
+            if self._clamp_next_dt:
+                dt = min(dt, 1.0 / FPS)
+                self._clamp_next_dt = False
+
+            # Time only update and render, not the idle wait or the yields
+            work_start = time.perf_counter()
             new_state = await self.current_state.update(dt)
             if new_state:
                 await self.change_state(new_state)
 
-            await self.current_state.render(self.screen)
-            pygame.display.flip()
+            state = self.current_state
+            if state.dirty:
+                await state.render(self.screen)
+                pygame.display.flip()
+                if state.idle_aware:
+                    state.dirty = False
+            state.record_frame_time((time.perf_counter() - work_start) * 1000.0)
 
             await asyncio.sleep(0)
 
+    async def _wait_for_events(self) -> list[pygame.event.Event]:
+        """Return the first events to arrive, waiting at most one idle tick.
+
+        On desktop this blocks in pygame.event.wait. The browser build polls
+        with asyncio.sleep instead, so it keeps yielding to the page.
+        """
+        timeout = 1000 // IDLE_TICK_RATE
+        if sys.platform != "emscripten":
+            event = pygame.event.wait(timeout)
+            return [] if event.type == pygame.NOEVENT else [event]
+
+        deadline = pygame.time.get_ticks() + timeout
+        while True:
+            events = pygame.event.get()
+            if events or pygame.time.get_ticks() >= deadline:
+                return events
+            await asyncio.sleep(IDLE_POLL_SECONDS)
+
     def _quit(self) -> None:
         """Clean shutdown."""
         pygame.quit()
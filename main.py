@@ -1,13 +1,45 @@
 import asyncio
+import atexit
 import logging
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener
 
 from game import Game
 
-# Configure logging for the game client
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
-)
+LOG_FORMAT = "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
+# Per-module levels; api_client logs full response bodies at DEBUG
+LOG_LEVELS = {"api_client": logging.INFO}
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """Leave formatting to the listener thread; the queue never leaves the process."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def configure_logging() -> None:
+    """Configure logging for the game client.
+
+    On desktop, records are formatted and written by a background thread so
+    the game loop only enqueues them. The browser build has no threads, so
+    there they are written directly.
+    """
+    if sys.platform == "emscripten":
+        logging.basicConfig(level=logging.INFO, format=LOG_FORMAT)
+    else:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter(LOG_FORMAT))
+        records: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        listener = QueueListener(records, handler)
+        root = logging.getLogger()
+        root.setLevel(logging.INFO)
+        root.addHandler(_DeferredQueueHandler(records))
+        listener.start()
+        atexit.register(listener.stop)
+    for name, level in LOG_LEVELS.items():
+        logging.getLogger(name).setLevel(level)
 
 
 async def main() -> None:
@@ -15,4 +47,5 @@ async def main() -> None:
     await game.run()
 
 
+configure_logging()
 asyncio.run(main())
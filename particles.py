@@ -0,0 +1,125 @@
+import math
+import random
+
+import pygame
+
+from constants import PARTICLE_BUDGET, PARTICLE_FADE_STEPS, PARTICLE_SIZE
+
+
+class ParticleSystem:
+    """Fixed-budget particles stored as preallocated parallel arrays.
+
+    Particles are not sprites. Each attribute lives in its own list of
+    ``capacity`` slots, used as a ring buffer: emitting writes at the head,
+    so once the budget is reached the oldest particles are overwritten
+    first instead of the frame getting slower. All particles are advanced
+    in one pass and drawn with a single ``Surface.blits`` call from a few
+    prerendered dots.
+    """
+
+    # Particle kinds: index into COLORS
+    DEBRIS = 0
+    EXHAUST = 1
+    COLORS = ((220, 220, 220), (255, 150, 40))
+
+    def __init__(self, capacity: int = PARTICLE_BUDGET) -> None:
+        self.capacity = capacity
+        self._x = [0.0] * capacity
+        self._y = [0.0] * capacity
+        self._vx = [0.0] * capacity
+        self._vy = [0.0] * capacity
+        self._life = [0.0] * capacity  # seconds left; <= 0 is a free slot
+        self._fade = [0.0] * capacity  # fade steps per second of life
+        self._kind = [0] * capacity
+        self._head = 0
+        self._live = 0
+        # One dot per kind and brightness step, dimmest first
+        self._dots = [
+            [
+                self._dot(tuple(c * (step + 1) // PARTICLE_FADE_STEPS for c in color))
+                for step in range(PARTICLE_FADE_STEPS)
+            ]
+            for color in self.COLORS
+        ]
+
+    @staticmethod
+    def _dot(color: tuple[int, ...]) -> pygame.Surface:
+        dot = pygame.Surface((PARTICLE_SIZE, PARTICLE_SIZE))
+        dot.fill(color)
+        return dot
+
+    def __len__(self) -> int:
+        return self._live
+
+    def emit(
+        self,
+        kind: int,
+        position: pygame.Vector2,
+        velocity: pygame.Vector2,
+        count: int,
+        speed: float,
+        lifetime: float,
+        spread: float = 360.0,
+    ) -> None:
+        """Emit ``count`` particles around ``velocity``'s direction.
+
+        Each particle gets ``velocity`` plus a random kick of up to ``speed``
+        within ``spread`` degrees, and lives for up to ``lifetime`` seconds.
+        """
+        if count <= 0:
+            return
+        base_angle = math.degrees(math.atan2(velocity.y, velocity.x))
+        half_spread = spread / 2
+        for _ in range(min(count, self.capacity)):
+            i = self._head
+            self._head = (i + 1) % self.capacity
+            if self._life[i] <= 0:
+                self._live += 1
+            angle = math.radians(base_angle + random.uniform(-half_spread, half_spread))
+            kick = random.uniform(0.3, 1.0) * speed
+            life = random.uniform(0.5, 1.0) * lifetime
+            self._x[i] = position.x
+            self._y[i] = position.y
+            self._vx[i] = velocity.x + math.cos(angle) * kick
+            self._vy[i] = velocity.y + math.sin(angle) * kick
+            self._life[i] = life
+            # Just under STEPS, so a fresh particle maps to the brightest dot
+            self._fade[i] = (PARTICLE_FADE_STEPS - 1e-3) / life
+            self._kind[i] = kind
+
+    def update(self, dt: float) -> None:
+        """Age and move every live particle."""
+        if not self._live:
+            return
+        x, y, vx, vy, life = self._x, self._y, self._vx, self._vy, self._life
+        live = 0
+        for i in range(self.capacity):
+            remaining = life[i]
+            if remaining > 0:
+                remaining -= dt
+                life[i] = remaining
+                if remaining > 0:
+                    x[i] += vx[i] * dt
+                    y[i] += vy[i] * dt
+                    live += 1
+        self._live = live
+
+    def draw(self, screen: pygame.Surface, scale: float = 1.0) -> None:
+        """Draw all live particles in one batched blit, positions times ``scale``."""
+        if not self._live:
+            return
+        x, y, life, fade, kind = self._x, self._y, self._life, self._fade, self._kind
+        dots = self._dots
+        screen.blits(
+            [
+                (dots[kind[i]][int(life[i] * fade[i])], (x[i] * scale, y[i] * scale))
+                for i in range(self.capacity)
+                if life[i] > 0
+            ],
+            doreturn=False,
+        )
+
+    def clear(self) -> None:
+        for i in range(self.capacity):
+            self._life[i] = 0.0
+        self._live = 0
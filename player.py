@@ -3,6 +3,10 @@ import pygame
 from circleshape import CircleShape
 from constants import (
     BLINK_INTERVAL,
+    EXHAUST_LIFETIME,
+    EXHAUST_PARTICLES_PER_SECOND,
+    EXHAUST_SPEED,
+    EXHAUST_SPREAD,
     INVINCIBILITY_DURATION,
     LINE_WIDTH,
     PLAYER_RADIUS,
@@ -11,10 +15,14 @@ from constants import (
     PLAYER_SPEED,
     PLAYER_TURN_SPEED,
 )
+from particles import ParticleSystem
 from shot import Shot
 
 
 class Player(CircleShape):
+    # Set alongside containers; exhaust is emitted here while thrusting
+    particles: ParticleSystem | None = None
+
     def __init__(self, x: float, y: float) -> None:
         super().__init__(x, y, PLAYER_RADIUS)
         self.x = x
@@ -29,6 +37,9 @@ class Player(CircleShape):
         self.blink_timer = 0.0
         self.visible = True
 
+        # Fractional exhaust particles carried over between frames
+        self.exhaust_backlog = 0.0
+
     # in the Player class
     def triangle(self) -> list[pygame.Vector2]:
         forward = pygame.Vector2(0, 1).rotate(self.rotation)
@@ -39,10 +50,15 @@ class Player(CircleShape):
         return [a, b, c]
 
     @override
-    def draw(self, screen: pygame.Surface) -> None:
+    def draw(self, screen: pygame.Surface, scale: float = 1.0) -> None:
         # Only draw if visible (for blinking effect during invincibility)
         if self.visible:
-            pygame.draw.polygon(screen, "white", self.triangle(), LINE_WIDTH)
+            pygame.draw.polygon(
+                screen,
+                "white",
+                [point * scale for point in self.triangle()],
+                max(1, round(LINE_WIDTH * scale)),
+            )
 
     def rotate(self, dt: float) -> None:
         self.rotation += PLAYER_TURN_SPEED * dt
@@ -90,6 +106,27 @@ class Player(CircleShape):
         rotated_vector = unit_vector.rotate(self.rotation)
         rotated_with_speed_vector = rotated_vector * PLAYER_SPEED * dt
         self.position += rotated_with_speed_vector
+        if self.particles is not None:
+            self._emit_exhaust(rotated_vector, dt)
+
+    def _emit_exhaust(self, forward: pygame.Vector2, dt: float) -> None:
+        """Emit exhaust opposite the direction of travel, at a steady rate."""
+        self.exhaust_backlog += abs(dt) * EXHAUST_PARTICLES_PER_SECOND
+        count = int(self.exhaust_backlog)
+        if count == 0:
+            return
+        self.exhaust_backlog -= count
+        # Reversing (negative dt) blows the exhaust out of the nose
+        backward = -forward if dt > 0 else forward
+        self.particles.emit(
+            ParticleSystem.EXHAUST,
+            self.position + backward * self.radius,
+            backward * EXHAUST_SPEED,
+            count,
+            EXHAUST_SPEED / 2,
+            EXHAUST_LIFETIME,
+            EXHAUST_SPREAD,
+        )
 
     def shoot(self) -> None:
         if self.timer > 0:
@@ -0,0 +1,76 @@
+import pygame
+
+from constants import (
+    FRAME_BUDGET_MS,
+    RENDER_SCALE_DOWN_FRAMES,
+    RENDER_SCALE_LEVELS,
+    RENDER_SCALE_UP_FRAMES,
+    SCREEN_HEIGHT,
+    SCREEN_WIDTH,
+)
+
+
+class ResolutionScaler:
+    """Picks the resolution the playfield is drawn at from measured frame times.
+
+    Drawing happens on an internal surface at ``scale`` times the logical
+    SCREEN_WIDTH x SCREEN_HEIGHT, which ``present`` stretches onto the
+    display. Game logic never sees this: objects keep logical coordinates
+    and are multiplied by ``scale`` only when drawn. The scaler steps down a
+    level after a few frames over budget, but steps back up only after a
+    long stretch with plenty of headroom, so it does not oscillate.
+    """
+
+    def __init__(self, levels: tuple[float, ...] = RENDER_SCALE_LEVELS) -> None:
+        self.levels = levels
+        self.level = 0
+        self._average_ms: float | None = None
+        self._frames_over = 0
+        self._frames_under = 0
+        self._surfaces: dict[int, pygame.Surface] = {}
+
+    @property
+    def scale(self) -> float:
+        return self.levels[self.level]
+
+    def record(self, work_ms: float) -> None:
+        """Feed the time the last frame's update and render took."""
+        if self._average_ms is None:
+            self._average_ms = work_ms
+        else:
+            self._average_ms += (work_ms - self._average_ms) * 0.2
+
+        if self._average_ms > FRAME_BUDGET_MS * 0.9:
+            self._frames_over += 1
+            self._frames_under = 0
+            if self._frames_over >= RENDER_SCALE_DOWN_FRAMES:
+                self._step(1)
+        elif self._average_ms < FRAME_BUDGET_MS * 0.5:
+            self._frames_under += 1
+            self._frames_over = 0
+            if self._frames_under >= RENDER_SCALE_UP_FRAMES:
+                self._step(-1)
+        else:
+            self._frames_over = self._frames_under = 0
+
+    def _step(self, direction: int) -> None:
+        self.level = min(max(self.level + direction, 0), len(self.levels) - 1)
+        # Measure the new level from scratch
+        self._average_ms = None
+        self._frames_over = self._frames_under = 0
+
+    def target(self, screen: pygame.Surface) -> pygame.Surface:
+        """The surface to draw the playfield on this frame."""
+        scale = self.scale
+        if scale == 1.0:
+            return screen
+        surface = self._surfaces.get(self.level)
+        if surface is None:
+            size = (round(SCREEN_WIDTH * scale), round(SCREEN_HEIGHT * scale))
+            surface = self._surfaces[self.level] = pygame.Surface(size)
+        return surface
+
+    def present(self, target: pygame.Surface, screen: pygame.Surface) -> None:
+        """Stretch ``target`` over ``screen``, unless they are the same surface."""
+        if target is not screen:
+            pygame.transform.scale(target, screen.get_size(), screen)
@@ -0,0 +1,114 @@
+"""Event-loop latency benchmark for the score data layer.
+
+Runs the same mix of leaderboard reads, rank checks and score inserts twice:
+once calling ScoreRepository directly on the event loop (the old behaviour)
+and once through AsyncScoreRepository and its WAL connection pool. A probe
+coroutine stands in for an unrelated cheap request and records how long it
+waits to be scheduled.
+
+Usage (from the server directory):
+    uv run python -m benchmarks.concurrency [--rows 200000] [--clients 32]
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import tempfile
+import time
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+
+from database import ConnectionPool, DatabaseSettings, Migrator
+from database.repositories import AsyncScoreRepository, ScoreRepository
+
+
+def _seed(pool: ConnectionPool, rows: int) -> None:
+    with pool.writer() as connection:
+        Migrator(connection).run_migrations()
+        connection.executemany(
+            "INSERT INTO high_scores (player_name, score) VALUES (?, ?)",
+            ((f"P{i % 1000}", random.randint(0, 1_000_000)) for i in range(rows)),
+        )
+        connection.commit()
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+async def _run_mode(
+    name: str,
+    repository_call: Callable[[str, tuple], Awaitable[object]],
+    clients: int,
+    ops_per_client: int,
+) -> None:
+    probe_delays: list[float] = []
+    done = asyncio.Event()
+
+    async def probe() -> None:
+        while not done.is_set():
+            start = time.perf_counter()
+            await asyncio.sleep(0.001)
+            probe_delays.append(time.perf_counter() - start - 0.001)
+
+    async def client(seed: int) -> None:
+        rng = random.Random(seed)
+        for _ in range(ops_per_client):
+            roll = rng.random()
+            if roll < 0.8:
+                await repository_call("get_top_scores", (100,))
+            elif roll < 0.9:
+                await repository_call("is_high_score", (rng.randint(1, 1000),))
+            else:
+                await repository_call("save_score", ("Bench", rng.randint(0, 10_000)))
+
+    probe_task = asyncio.create_task(probe())
+    start = time.perf_counter()
+    await asyncio.gather(*(client(i) for i in range(clients)))
+    elapsed = time.perf_counter() - start
+    done.set()
+    await probe_task
+
+    total_ops = clients * ops_per_client
+    print(
+        f"{name:>9}: {total_ops / elapsed:8.0f} ops/s | probe delay "
+        f"p50={statistics.median(probe_delays) * 1000:6.2f}ms "
+        f"p99={_percentile(probe_delays, 0.99) * 1000:6.2f}ms "
+        f"max={max(probe_delays) * 1000:6.2f}ms"
+    )
+
+
+async def main(rows: int, clients: int, ops_per_client: int, workers: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        pool = ConnectionPool(
+            Path(tmp) / "bench.db", DatabaseSettings(read_connections=workers)
+        )
+        _seed(pool, rows)
+
+        inline = ScoreRepository(pool.writer_connection)
+
+        async def inline_call(method: str, args: tuple) -> object:
+            return getattr(inline, method)(*args)
+
+        await _run_mode("inline", inline_call, clients, ops_per_client)
+
+        threaded = AsyncScoreRepository(pool)
+
+        async def threaded_call(method: str, args: tuple) -> object:
+            return await getattr(threaded, method)(*args)
+
+        await _run_mode("threaded", threaded_call, clients, ops_per_client)
+        threaded.close()
+        pool.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--clients", type=int, default=32)
+    parser.add_argument("--ops", type=int, default=50)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.clients, args.ops, args.workers))
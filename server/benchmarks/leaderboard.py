@@ -0,0 +1,89 @@
+"""Requests/sec benchmark for GET /api/scores with and without the top-K cache.
+
+Drives the FastAPI app in-process through httpx's ASGI transport against a
+seeded temporary database, so the numbers isolate handler and data-layer
+cost from network and server overhead.
+
+Usage (from the server directory):
+    uv run python -m benchmarks.leaderboard [--rows 100000] [--requests 5000]
+"""
+
+import argparse
+import asyncio
+import logging
+import random
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+from database import ConnectionPool, Migrator
+from database.repositories import AsyncScoreRepository, LeaderboardCache
+
+import main
+
+
+def _seed(pool: ConnectionPool, rows: int) -> None:
+    with pool.writer() as connection:
+        Migrator(connection).run_migrations()
+        connection.executemany(
+            "INSERT INTO high_scores (player_name, score) VALUES (?, ?)",
+            ((f"P{i % 1000}", random.randint(0, 1_000_000)) for i in range(rows)),
+        )
+        connection.commit()
+
+
+async def _measure(
+    name: str, repository: AsyncScoreRepository, requests: int, concurrency: int
+) -> float:
+    main.score_repository = repository
+    await repository.warm_cache()
+    limits = [10, 25, 50, 100]
+    transport = httpx.ASGITransport(app=main.app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench"
+    ) as client:
+        remaining = iter(range(requests))
+
+        async def worker() -> None:
+            for i in remaining:
+                response = await client.get(
+                    "/api/scores", params={"limit": limits[i % len(limits)]}
+                )
+                response.raise_for_status()
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+
+    rate = requests / elapsed
+    print(f"{name:>9}: {rate:8.0f} req/s ({requests} requests in {elapsed:.2f}s)")
+    return rate
+
+
+async def run(rows: int, requests: int, concurrency: int) -> None:
+    # Per-request INFO lines would dominate the measurement
+    logging.getLogger("main").setLevel(logging.WARNING)
+    with tempfile.TemporaryDirectory() as tmp:
+        pool = ConnectionPool(Path(tmp) / "bench.db")
+        _seed(pool, rows)
+
+        uncached = AsyncScoreRepository(pool)
+        before = await _measure("uncached", uncached, requests, concurrency)
+        uncached.close()
+
+        cached = AsyncScoreRepository(pool, cache=LeaderboardCache(100))
+        after = await _measure("cached", cached, requests, concurrency)
+        cached.close()
+
+        pool.close()
+    print(f"  speedup: {after / before:.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    args = parser.parse_args()
+    asyncio.run(run(args.rows, args.requests, args.concurrency))
@@ -0,0 +1,286 @@
+"""Load test for the score API against a real uvicorn server.
+
+Starts uvicorn on a scratch database (or targets ``--url``), seeds it
+through the bulk import endpoint, then runs ``--concurrency`` virtual
+players for ``--duration`` seconds. Each player picks an action from a
+weighted mix: mint a token and submit a score, poll the leaderboard at
+several limits, check the rank around a score, page the leaderboard or
+look up a player. Throughput and p50/p95/p99 latency are reported per
+endpoint and can be saved as JSON to compare runs.
+
+Usage (from the server directory):
+    uv run python -m benchmarks.loadtest [--concurrency 64] [--duration 30]
+        [--seed-rows 100000] [--output results.json] [--url http://host:port]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import secrets
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from datetime import UTC, datetime
+from pathlib import Path
+
+import httpx
+
+SERVER_DIR = Path(__file__).parent.parent
+PLAYER_NAMES = [f"Load{i}" for i in range(500)]
+
+# (action, weight): roughly what a page of browsers generates between games
+MIX = (
+    ("submit", 15),
+    ("leaderboard", 55),
+    ("rank", 15),
+    ("page", 10),
+    ("player", 5),
+)
+
+
+class Recorder:
+    """Per-endpoint latency samples and error counts."""
+
+    def __init__(self) -> None:
+        self.latencies: dict[str, list[float]] = defaultdict(list)
+        self.errors: dict[str, int] = defaultdict(int)
+
+    async def request(
+        self, client: httpx.AsyncClient, endpoint: str, method: str, url: str, **kw
+    ) -> httpx.Response | None:
+        start = time.perf_counter()
+        try:
+            response = await client.request(method, url, **kw)
+        except httpx.HTTPError:
+            self.errors[endpoint] += 1
+            return None
+        self.latencies[endpoint].append(time.perf_counter() - start)
+        if response.status_code >= 400:
+            self.errors[endpoint] += 1
+        return response
+
+
+async def _player(
+    client: httpx.AsyncClient, recorder: Recorder, deadline: float, rng: random.Random
+) -> None:
+    actions = [action for action, _ in MIX]
+    weights = [weight for _, weight in MIX]
+    while time.perf_counter() < deadline:
+        action = rng.choices(actions, weights)[0]
+        if action == "submit":
+            response = await recorder.request(
+                client, "POST /api/tokens", "POST", "/api/tokens"
+            )
+            if response is None or response.status_code != 200:
+                continue
+            await recorder.request(
+                client,
+                "POST /api/scores",
+                "POST",
+                "/api/scores",
+                json={
+                    "player_name": rng.choice(PLAYER_NAMES),
+                    "score": rng.randint(0, 1_000_000),
+                },
+                headers={"Authorization": f"Bearer {response.json()['token']}"},
+            )
+        elif action == "leaderboard":
+            await recorder.request(
+                client,
+                "GET /api/scores",
+                "GET",
+                "/api/scores",
+                params={"limit": rng.choice((10, 10, 10, 25, 50, 100))},
+            )
+        elif action == "rank":
+            await recorder.request(
+                client,
+                "GET /api/leaderboard/around",
+                "GET",
+                "/api/leaderboard/around",
+                params={"score": rng.randint(0, 1_000_000), "radius": 5},
+            )
+        elif action == "page":
+            await recorder.request(
+                client,
+                "GET /api/leaderboard",
+                "GET",
+                "/api/leaderboard",
+                params={"limit": 25},
+            )
+        else:
+            await recorder.request(
+                client,
+                "GET /api/players/{name}",
+                "GET",
+                f"/api/players/{rng.choice(PLAYER_NAMES)}",
+            )
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+def summarize(recorder: Recorder, elapsed: float) -> dict[str, dict[str, float]]:
+    """Throughput and latency percentiles (in ms) per endpoint."""
+    summary = {}
+    for endpoint in sorted(recorder.latencies.keys() | recorder.errors.keys()):
+        samples = recorder.latencies.get(endpoint) or [0.0]
+        summary[endpoint] = {
+            "requests": len(recorder.latencies.get(endpoint, [])),
+            "errors": recorder.errors.get(endpoint, 0),
+            "rps": round(len(recorder.latencies.get(endpoint, [])) / elapsed, 1),
+            "p50_ms": round(_percentile(samples, 0.50) * 1000, 2),
+            "p95_ms": round(_percentile(samples, 0.95) * 1000, 2),
+            "p99_ms": round(_percentile(samples, 0.99) * 1000, 2),
+        }
+    return summary
+
+
+async def _wait_until_healthy(
+    client: httpx.AsyncClient, server: subprocess.Popen | None, timeout: float
+) -> None:
+    deadline = time.monotonic() + timeout
+    while True:
+        if server is not None and server.poll() is not None:
+            raise RuntimeError(f"server exited with status {server.returncode}")
+        try:
+            if (await client.get("/api/health")).status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        if time.monotonic() > deadline:
+            raise RuntimeError("server did not become healthy")
+        await asyncio.sleep(0.1)
+
+
+async def _seed(client: httpx.AsyncClient, rows: int, admin_token: str) -> None:
+    rng = random.Random(0)
+    body = b"".join(
+        json.dumps(
+            {"player_name": rng.choice(PLAYER_NAMES), "score": rng.randint(0, 10**6)}
+        ).encode()
+        + b"\n"
+        for _ in range(rows)
+    )
+    response = await client.post(
+        "/api/admin/scores/import",
+        content=body,
+        headers={"Authorization": f"Bearer {admin_token}"},
+        timeout=None,
+    )
+    response.raise_for_status()
+
+
+def _start_server(tmp: Path, admin_token: str) -> tuple[subprocess.Popen, str]:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    env = {
+        **os.environ,
+        "ASTEROIDS_DB_PATH": str(tmp / "loadtest.db"),
+        "ASTEROIDS_ADMIN_TOKEN": admin_token,
+        # Every virtual player shares one address
+        "ASTEROIDS_RATE_LIMIT_PER_MINUTE": "0",
+    }
+    server = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "main:app",
+            "--port",
+            str(port),
+            "--log-level",
+            "warning",
+            "--no-access-log",
+        ],
+        cwd=SERVER_DIR,
+        env=env,
+        stdout=subprocess.DEVNULL,
+    )
+    return server, f"http://127.0.0.1:{port}"
+
+
+async def run(args: argparse.Namespace) -> dict:
+    admin_token = secrets.token_urlsafe(16)
+    with tempfile.TemporaryDirectory() as tmp:
+        server = None
+        url = args.url
+        if url is None:
+            server, url = _start_server(Path(tmp), admin_token)
+        try:
+            limits = httpx.Limits(max_connections=args.concurrency)
+            async with httpx.AsyncClient(
+                base_url=url, limits=limits, timeout=30.0
+            ) as client:
+                await _wait_until_healthy(client, server, timeout=30.0)
+                if server is not None and args.seed_rows:
+                    await _seed(client, args.seed_rows, admin_token)
+
+                recorder = Recorder()
+                start = time.perf_counter()
+                deadline = start + args.duration
+                await asyncio.gather(
+                    *(
+                        _player(client, recorder, deadline, random.Random(i))
+                        for i in range(args.concurrency)
+                    )
+                )
+                elapsed = time.perf_counter() - start
+        finally:
+            if server is not None:
+                server.terminate()
+                server.wait(timeout=10)
+
+    endpoints = summarize(recorder, elapsed)
+    total = sum(e["requests"] for e in endpoints.values())
+    return {
+        "started_at": datetime.now(UTC).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "config": {
+            "url": args.url or "local",
+            "concurrency": args.concurrency,
+            "duration": args.duration,
+            "seed_rows": args.seed_rows if args.url is None else None,
+        },
+        "total": {"requests": total, "rps": round(total / elapsed, 1)},
+        "endpoints": endpoints,
+    }
+
+
+def _print(results: dict) -> None:
+    print(
+        f"{'endpoint':<28} {'reqs':>7} {'errs':>5} {'req/s':>8} "
+        f"{'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}"
+    )
+    for endpoint, row in results["endpoints"].items():
+        print(
+            f"{endpoint:<28} {row['requests']:>7} {row['errors']:>5} "
+            f"{row['rps']:>8.1f} {row['p50_ms']:>8.2f} {row['p95_ms']:>8.2f} "
+            f"{row['p99_ms']:>8.2f}"
+        )
+    total = results["total"]
+    print(f"{'total':<28} {total['requests']:>7} {'':>5} {total['rps']:>8.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--duration", type=float, default=30.0)
+    parser.add_argument("--seed-rows", type=int, default=100_000)
+    parser.add_argument("--url", help="target a running server instead")
+    parser.add_argument("--output", type=Path, help="write results as JSON")
+    args = parser.parse_args()
+    results = asyncio.run(run(args))
+    _print(results)
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+        print(f"Results written to {args.output}")
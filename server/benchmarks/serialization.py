@@ -0,0 +1,78 @@
+"""Micro-benchmark for encoding a limit=100 GET /api/scores response.
+
+Compares the original path (sqlite3.Row -> HighScore -> pydantic models ->
+JSONResponse) with the lean path (plain tuples -> orjson), both with and
+without the database fetch.
+
+Usage (from the server directory):
+    uv run python -m benchmarks.serialization [--number 2000]
+"""
+
+import argparse
+import random
+import tempfile
+import timeit
+from pathlib import Path
+
+from database import ConnectionPool, Migrator
+from database.repositories import HighScore, ScoreRepository
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from web import encode_score_rows
+
+from main import ScoreResponse, ScoresListResponse
+
+LIMIT = 100
+
+
+def _pydantic_body(scores: list[HighScore]) -> bytes:
+    model = ScoresListResponse(
+        scores=[
+            ScoreResponse(
+                id=s.id,
+                player_name=s.player_name,
+                score=s.score,
+                played_at=str(s.played_at) if s.played_at else "",
+            )
+            for s in scores
+        ]
+    )
+    return JSONResponse(content=jsonable_encoder(model)).body
+
+
+def run(number: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        pool = ConnectionPool(Path(tmp) / "bench.db")
+        with pool.writer() as connection:
+            Migrator(connection).run_migrations()
+            connection.executemany(
+                "INSERT INTO high_scores (player_name, score) VALUES (?, ?)",
+                ((f"Player{i}", random.randint(0, 100_000)) for i in range(10_000)),
+            )
+            connection.commit()
+
+        with pool.reader() as connection:
+            repository = ScoreRepository(connection)
+            scores = repository.get_top_scores(LIMIT)
+            rows = repository.get_top_score_rows(LIMIT)
+            cases = {
+                "encode pydantic": lambda: _pydantic_body(scores),
+                "encode orjson": lambda: encode_score_rows(rows),
+                "fetch+encode pydantic": lambda: _pydantic_body(
+                    repository.get_top_scores(LIMIT)
+                ),
+                "fetch+encode orjson": lambda: encode_score_rows(
+                    repository.get_top_score_rows(LIMIT)
+                ),
+            }
+            for name, case in cases.items():
+                seconds = min(timeit.repeat(case, number=number, repeat=3))
+                print(f"{name:>22}: {seconds / number * 1e6:8.1f} us/response")
+        pool.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=2000)
+    args = parser.parse_args()
+    run(args.number)
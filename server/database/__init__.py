@@ -1,2 +1,7 @@
+from .compaction import CompactionResult as CompactionResult
+from .compaction import CompactionSettings as CompactionSettings
+from .compaction import Compactor as Compactor
 from .connection import DatabaseConnection as DatabaseConnection
 from .migrator import Migrator as Migrator
+from .pool import ConnectionPool as ConnectionPool
+from .pool import DatabaseSettings as DatabaseSettings
@@ -0,0 +1,204 @@
+"""Retention and compaction for the high_scores table.
+
+Scores outside the all-time top N that are older than the retention window
+are appended to gzip-compressed NDJSON archives and removed from SQLite in
+small batches. player_best keeps the per-player aggregates, so stats still
+count archived games, and each player's best score is never archived, so
+player_best always points at a stored row. Freed pages are then returned to the filesystem with
+PRAGMA incremental_vacuum in bounded slices.
+
+Each batch and each vacuum slice holds the writer lock only briefly, so the
+job can run next to live traffic. It is scheduled by the server and can be
+run by hand (from the server directory):
+
+    uv run python -m database.compaction --keep-top 1000 --keep-days 30
+"""
+
+import argparse
+import gzip
+import logging
+import os
+import time
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import orjson
+
+from .connection import DatabaseConnection
+from .migrator import Migrator
+from .pool import ConnectionPool
+from .repositories import HighScore, ScoreRepository
+
+logger = logging.getLogger(__name__)
+
+# SQLite's auto_vacuum value for INCREMENTAL
+_AUTO_VACUUM_INCREMENTAL = 2
+
+
+@dataclass(frozen=True)
+class CompactionSettings:
+    """Retention policy and batch sizes for the compaction job."""
+
+    keep_top: int = 1000
+    keep_days: int = 30
+    batch_size: int = 2000  # rows scanned per writer transaction
+    vacuum_pages: int = 512  # pages released per incremental_vacuum slice
+    pause_seconds: float = 0.01  # yield to other writers between slices
+    archive_dir: Path = DatabaseConnection.DB_PATH.parent / "archive"
+    interval: float = 24 * 3600.0  # seconds between scheduled runs
+
+
+@dataclass
+class CompactionResult:
+    archived: int = 0
+    archive_path: Path | None = None
+    freed_pages: int = 0
+
+
+class Compactor:
+    """Archives old, low-ranked scores and vacuums the freed pages."""
+
+    def __init__(
+        self, pool: ConnectionPool, settings: CompactionSettings | None = None
+    ) -> None:
+        self.pool = pool
+        self.settings = settings or CompactionSettings()
+
+    def run(self, now: datetime | None = None) -> CompactionResult:
+        """Run one archive pass followed by a sliced incremental vacuum."""
+        now = now or datetime.now(UTC)
+        result = self.archive(now)
+        result.freed_pages = self.vacuum()
+        logger.info(
+            "Compaction archived %d scores, freed %d pages",
+            result.archived,
+            result.freed_pages,
+        )
+        return result
+
+    def archive(self, now: datetime) -> CompactionResult:
+        """Move archivable scores to a compressed NDJSON file, batch by batch."""
+        settings = self.settings
+        played_before = (now - timedelta(days=settings.keep_days)).strftime(
+            "%Y-%m-%d %H:%M:%S"
+        )
+        with self.pool.reader() as connection:
+            keep_from = ScoreRepository(connection).get_score_key_at_rank(
+                settings.keep_top
+            )
+        if keep_from is None:
+            # Fewer than keep_top scores exist; everything is kept
+            return CompactionResult()
+
+        result = CompactionResult()
+        archive_path = settings.archive_dir / (
+            f"high_scores-{now.strftime('%Y%m%dT%H%M%SZ')}.ndjson.gz"
+        )
+        after: tuple[str, int] | None = ("", 0)
+        while after is not None:
+            with self.pool.reader() as connection:
+                scores, after = ScoreRepository(connection).get_archivable_scores(
+                    after, played_before, keep_from, settings.batch_size
+                )
+            if scores:
+                # Durable in the archive before it leaves the database
+                self._append(archive_path, scores)
+                with self.pool.writer() as connection:
+                    ScoreRepository(connection).purge_scores(scores)
+                result.archived += len(scores)
+                result.archive_path = archive_path
+            time.sleep(settings.pause_seconds)
+        return result
+
+    def _append(self, archive_path: Path, scores: list[HighScore]) -> None:
+        archive_path.parent.mkdir(parents=True, exist_ok=True)
+        lines = b"".join(
+            orjson.dumps(
+                {
+                    "id": s.id,
+                    "player_name": s.player_name,
+                    "score": s.score,
+                    "played_at": str(s.played_at),
+                }
+            )
+            + b"\n"
+            for s in scores
+        )
+        # Each call appends a gzip member; concatenated members read as one stream
+        with open(archive_path, "ab") as f:
+            f.write(gzip.compress(lines))
+            f.flush()
+            os.fsync(f.fileno())
+
+    def vacuum(self) -> int:
+        """Release free pages in slices of ``vacuum_pages``. Returns pages freed."""
+        with self.pool.writer() as connection:
+            mode = connection.execute("PRAGMA auto_vacuum").fetchone()[0]
+        if mode != _AUTO_VACUUM_INCREMENTAL:
+            logger.warning(
+                "auto_vacuum is not INCREMENTAL; run with "
+                "--enable-incremental-vacuum once to convert the database"
+            )
+            return 0
+
+        freed = 0
+        while True:
+            with self.pool.writer() as connection:
+                free = connection.execute("PRAGMA freelist_count").fetchone()[0]
+                if free == 0:
+                    return freed
+                pages = min(free, self.settings.vacuum_pages)
+                connection.execute(f"PRAGMA incremental_vacuum({pages})").fetchall()
+            freed += pages
+            time.sleep(self.settings.pause_seconds)
+
+    def enable_incremental_vacuum(self) -> None:
+        """Switch an existing database to incremental auto_vacuum.
+
+        Requires a full VACUUM, which blocks writers for its duration, so it
+        is only done on request.
+        """
+        with self.pool.writer() as connection:
+            connection.execute("PRAGMA auto_vacuum = INCREMENTAL")
+            connection.execute("VACUUM")
+
+
+def main() -> None:
+    defaults = CompactionSettings()
+    parser = argparse.ArgumentParser(description="Archive and compact high_scores.")
+    parser.add_argument("--keep-top", type=int, default=defaults.keep_top)
+    parser.add_argument("--keep-days", type=int, default=defaults.keep_days)
+    parser.add_argument("--archive-dir", type=Path, default=defaults.archive_dir)
+    parser.add_argument(
+        "--enable-incremental-vacuum",
+        action="store_true",
+        help="convert an existing database to incremental auto_vacuum first",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+    )
+    database = DatabaseConnection()
+    Migrator(database.get_connection()).run_migrations()
+    compactor = Compactor(
+        database.get_pool(),
+        CompactionSettings(
+            keep_top=args.keep_top,
+            keep_days=args.keep_days,
+            archive_dir=args.archive_dir,
+        ),
+    )
+    if args.enable_incremental_vacuum:
+        compactor.enable_incremental_vacuum()
+    result = compactor.run()
+    if result.archive_path:
+        print(f"Archived {result.archived} scores to {result.archive_path}")
+    print(f"Freed {result.freed_pages} pages")
+    database.close()
+
+
+if __name__ == "__main__":
+    main()
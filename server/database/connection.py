@@ -2,30 +2,44 @@ import os
 import sqlite3
 from pathlib import Path
 
+from .pool import ConnectionPool, DatabaseSettings
+
 
 class DatabaseConnection:
-    """Singleton connection manager for SQLite database."""
+    """Singleton owner of the application's SQLite connection pool."""
 
     _instance: "DatabaseConnection | None" = None
     _SERVER_DIR = Path(__file__).parent.parent
-    DB_PATH = _SERVER_DIR / "data" / "asteroids.db"
+    # ASTEROIDS_DB_PATH points the server at another database, e.g. for load tests
+    DB_PATH = Path(
+        os.environ.get("ASTEROIDS_DB_PATH", _SERVER_DIR / "data" / "asteroids.db")
+    )
 
     def __new__(cls) -> "DatabaseConnection":
         if cls._instance is None:
             cls._instance = super().__new__(cls)
-            cls._instance._connection = None
+            cls._instance._pool = None
+            cls._instance.settings = DatabaseSettings()
         return cls._instance
 
+    def configure(self, settings: DatabaseSettings) -> None:
+        """Set pool size and pragmas. Must be called before the pool opens."""
+        if self._pool is not None:
+            raise RuntimeError("Database pool is already open")
+        self.settings = settings
+
+    def get_pool(self) -> ConnectionPool:
+        """Get or create the connection pool."""
+        if self._pool is None:
+            self._pool = ConnectionPool(self.DB_PATH, self.settings)
+        return self._pool
+
     def get_connection(self) -> sqlite3.Connection:
-        """Get or create database connection."""
-        if self._connection is None:
-            os.makedirs(self.DB_PATH.parent, exist_ok=True)
-            self._connection = sqlite3.connect(str(self.DB_PATH))
-            self._connection.row_factory = sqlite3.Row
-        return self._connection
+        """Get the pool's writer connection."""
+        return self.get_pool().writer_connection
 
     def close(self) -> None:
-        """Close the connection."""
-        if self._connection:
-            self._connection.close()
-            self._connection = None
+        """Close all pooled connections."""
+        if self._pool:
+            self._pool.close()
+            self._pool = None
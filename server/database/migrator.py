@@ -1,11 +1,54 @@
-import glob
-import os
+import hashlib
 import sqlite3
+from dataclasses import dataclass
 from pathlib import Path
 
 
+@dataclass(frozen=True, slots=True)
+class Migration:
+    version: str
+    description: str
+    sql: str
+    checksum: str
+
+
+def directory_fingerprint(directory: Path) -> int:
+    """Fingerprint the V*.sql files in ``directory`` without reading them.
+
+    Hashes each file's name, size and modification time, so any added,
+    removed or edited migration changes the result. Sized to fit SQLite's
+    32-bit ``user_version``.
+    """
+    digest = hashlib.sha256()
+    for path in sorted(directory.glob("V*.sql")):
+        stat = path.stat()
+        digest.update(f"{path.name}:{stat.st_size}:{stat.st_mtime_ns}\n".encode())
+    # 0 is what a new database reports, so never use it
+    return int.from_bytes(digest.digest()[:4], "big", signed=True) or 1
+
+
+def load_migrations(directory: Path) -> tuple[Migration, ...]:
+    """Read and checksum the V*.sql files in ``directory``, in version order."""
+    migrations = []
+    for path in sorted(directory.glob("V*.sql")):
+        version, _, description = path.stem.partition("__")
+        sql = path.read_text()
+        checksum = hashlib.sha256(sql.encode()).hexdigest()
+        migrations.append(Migration(version, description, sql, checksum))
+    return tuple(migrations)
+
+
 class Migrator:
-    """Runs SQL migrations in order based on version prefix."""
+    """Runs SQL migrations in order based on version prefix.
+
+    Pending migrations are applied in one transaction and their SHA-256
+    recorded in schema_version; a migration edited after it was applied is
+    an error. A fingerprint of the directory listing is stored in ``PRAGMA
+    user_version``, so an up-to-date database is recognised from a stat of
+    each file and one header read, without reading the migrations or
+    touching schema_version. A fresh checkout with new modification times
+    takes the full path once, which re-verifies the checksums.
+    """
 
     _SERVER_DIR = Path(__file__).parent.parent
     MIGRATIONS_DIR = _SERVER_DIR / "migrations"
@@ -15,23 +58,48 @@ class Migrator:
 
     def run_migrations(self) -> None:
         """Execute all pending migrations."""
-        self._ensure_schema_table()
-        applied = self._get_applied_versions()
-
-        migration_files = sorted(glob.glob(str(self.MIGRATIONS_DIR / "V*.sql")))
+        fingerprint = directory_fingerprint(self.MIGRATIONS_DIR)
+        if self.conn.execute("PRAGMA user_version").fetchone()[0] == fingerprint:
+            return
+        migrations = load_migrations(self.MIGRATIONS_DIR)
 
-        for filepath in migration_files:
-            filename = os.path.basename(filepath)
-            version = filename.split("__")[0]
-            description = (
-                filename.split("__")[1].replace(".sql", "") if "__" in filename else ""
-            )
+        # Explicit transaction control, so executescript() does not commit
+        # between migrations
+        previous_autocommit = self.conn.autocommit
+        self.conn.autocommit = True
+        try:
+            # IMMEDIATE: a second worker starting at the same time waits here,
+            # then sees this one's migrations as applied
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._migrate(migrations, fingerprint)
+            except BaseException:
+                self.conn.execute("ROLLBACK")
+                raise
+            self.conn.execute("COMMIT")
+        finally:
+            self.conn.autocommit = previous_autocommit
 
-            if version not in applied:
-                self._apply_migration(filepath, version, description)
+    def _migrate(self, migrations: tuple[Migration, ...], fingerprint: int) -> None:
+        self._ensure_schema_table()
+        applied = self._get_applied_checksums()
+        for migration in migrations:
+            if migration.version not in applied:
+                self._apply_migration(migration)
+            elif applied[migration.version] is None:
+                # Applied before checksums were recorded
+                self.conn.execute(
+                    "UPDATE schema_version SET checksum = ? WHERE version = ?",
+                    (migration.checksum, migration.version),
+                )
+            elif applied[migration.version] != migration.checksum:
+                raise RuntimeError(
+                    f"Migration {migration.version} was modified after it was applied"
+                )
+        self.conn.execute(f"PRAGMA user_version = {fingerprint}")
 
     def _ensure_schema_table(self) -> None:
-        """Create schema_version table if it doesn't exist."""
+        """Create schema_version if it doesn't exist, with a checksum column."""
         self.conn.execute("""
             CREATE TABLE IF NOT EXISTS schema_version (
                 version TEXT PRIMARY KEY,
@@ -39,21 +107,20 @@ class Migrator:
                 description TEXT
             )
         """)
-        self.conn.commit()
-
-    def _get_applied_versions(self) -> set[str]:
-        """Return set of already-applied migration versions."""
-        cursor = self.conn.execute("SELECT version FROM schema_version")
-        return {row[0] for row in cursor.fetchall()}
+        columns = self.conn.execute("PRAGMA table_info(schema_version)").fetchall()
+        if "checksum" not in {column[1] for column in columns}:
+            self.conn.execute("ALTER TABLE schema_version ADD COLUMN checksum TEXT")
 
-    def _apply_migration(self, filepath: str, version: str, description: str) -> None:
-        """Execute a single migration file."""
-        with open(filepath, "r") as f:
-            sql = f.read()
+    def _get_applied_checksums(self) -> dict[str, str | None]:
+        """Return applied migration versions and their recorded checksums."""
+        cursor = self.conn.execute("SELECT version, checksum FROM schema_version")
+        return {row[0]: row[1] for row in cursor.fetchall()}
 
-        self.conn.executescript(sql)
+    def _apply_migration(self, migration: Migration) -> None:
+        """Execute a single migration inside the open transaction."""
+        self.conn.executescript(migration.sql)
         self.conn.execute(
-            "INSERT INTO schema_version (version, description) VALUES (?, ?)",
-            (version, description),
+            "INSERT INTO schema_version (version, description, checksum)"
+            " VALUES (?, ?, ?)",
+            (migration.version, migration.description, migration.checksum),
         )
-        self.conn.commit()
@@ -0,0 +1,162 @@
+import os
+import queue
+import sqlite3
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+
+
+@dataclass(frozen=True)
+class DatabaseSettings:
+    """Connection pool size, SQLite pragmas and write batching."""
+
+    journal_mode: str = "WAL"
+    # Only takes effect on a new database; existing ones need a one-time VACUUM
+    auto_vacuum: str = "INCREMENTAL"
+    synchronous: str = "NORMAL"
+    cache_size: int = -16000  # negative values are KiB, i.e. ~16 MB per connection
+    mmap_size: int = 256 * 1024 * 1024
+    busy_timeout: int = 5000  # milliseconds
+    read_connections: int = 4
+    checkpoint_interval: float = 60.0  # seconds between periodic WAL checkpoints
+    # Group commit: buffer score inserts for up to write_batch_window seconds
+    # or write_batch_size rows, then commit them together. 1 disables batching.
+    write_batch_size: int = 1
+    write_batch_window: float = 0.005
+
+
+class ConnectionPool:
+    """One writer and N read-only connections to a single SQLite database.
+
+    In WAL mode readers see the last committed snapshot and never wait on the
+    writer, so leaderboard reads are not blocked by score inserts. Writes are
+    serialized through a lock around the single writer connection.
+    """
+
+    def __init__(self, db_path: Path, settings: DatabaseSettings | None = None):
+        self.db_path = db_path
+        self.settings = settings or DatabaseSettings()
+        self._writer: sqlite3.Connection | None = None
+        self._write_lock = threading.Lock()
+        self._open_lock = threading.Lock()
+        self._idle_readers: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue()
+        self._reader_count = 0
+
+    def _open(self, read_only: bool) -> sqlite3.Connection:
+        """Open a connection and apply the configured pragmas."""
+        if read_only:
+            connection = sqlite3.connect(
+                f"file:{self.db_path}?mode=ro", uri=True, check_same_thread=False
+            )
+            connection.execute("PRAGMA query_only = ON")
+        else:
+            os.makedirs(self.db_path.parent, exist_ok=True)
+            connection = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            connection.execute(f"PRAGMA auto_vacuum = {self.settings.auto_vacuum}")
+            connection.execute(f"PRAGMA journal_mode = {self.settings.journal_mode}")
+            connection.execute(f"PRAGMA synchronous = {self.settings.synchronous}")
+        connection.execute(f"PRAGMA busy_timeout = {int(self.settings.busy_timeout)}")
+        connection.execute(f"PRAGMA cache_size = {int(self.settings.cache_size)}")
+        connection.execute(f"PRAGMA mmap_size = {int(self.settings.mmap_size)}")
+        connection.row_factory = sqlite3.Row
+        return connection
+
+    @property
+    def writer_connection(self) -> sqlite3.Connection:
+        """The single read-write connection, opened on first use."""
+        return self._ensure_writer()
+
+    def _ensure_writer(self) -> sqlite3.Connection:
+        if self._writer is None:
+            with self._open_lock:
+                if self._writer is None:
+                    self._writer = self._open(read_only=False)
+        return self._writer
+
+    @contextmanager
+    def writer(self) -> Iterator[sqlite3.Connection]:
+        """Borrow the writer connection exclusively."""
+        connection = self.writer_connection
+        with self._write_lock:
+            yield connection
+
+    @contextmanager
+    def reader(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a read-only connection, waiting if all N are in use."""
+        connection = self._acquire_reader()
+        try:
+            yield connection
+        finally:
+            self._idle_readers.put(connection)
+
+    def _acquire_reader(self) -> sqlite3.Connection:
+        try:
+            return self._idle_readers.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._open_lock:
+            can_open = self._reader_count < self.settings.read_connections
+            if can_open:
+                self._reader_count += 1
+        if can_open:
+            # The writer must exist first so the database file and WAL exist
+            self._ensure_writer()
+            try:
+                return self._open(read_only=True)
+            except sqlite3.Error:
+                with self._open_lock:
+                    self._reader_count -= 1
+                raise
+
+        try:
+            return self._idle_readers.get(timeout=self.settings.busy_timeout / 1000)
+        except queue.Empty:
+            raise sqlite3.OperationalError("Timed out waiting for a read connection")
+
+    def health_check(self) -> bool:
+        """Ping the writer and every idle reader, replacing broken readers."""
+        try:
+            with self.writer() as connection:
+                connection.execute("SELECT 1").fetchone()
+        except sqlite3.Error:
+            return False
+
+        healthy = True
+        idle: list[sqlite3.Connection] = []
+        while True:
+            try:
+                idle.append(self._idle_readers.get_nowait())
+            except queue.Empty:
+                break
+        for connection in idle:
+            try:
+                connection.execute("SELECT 1").fetchone()
+                self._idle_readers.put(connection)
+            except sqlite3.Error:
+                healthy = False
+                connection.close()
+                with self._open_lock:
+                    self._reader_count -= 1
+        return healthy
+
+    def checkpoint(self, mode: str = "PASSIVE") -> tuple[int, int, int]:
+        """Run a WAL checkpoint. Returns (busy, log_frames, checkpointed)."""
+        with self.writer() as connection:
+            row = connection.execute(f"PRAGMA wal_checkpoint({mode})").fetchone()
+        return tuple(row)
+
+    def close(self) -> None:
+        """Close every connection owned by the pool."""
+        while True:
+            try:
+                self._idle_readers.get_nowait().close()
+            except queue.Empty:
+                break
+        self._reader_count = 0
+        if self._writer is not None:
+            with self._write_lock:
+                self._writer.close()
+                self._writer = None
@@ -1 +1,8 @@
-from .score_repository import ScoreRepository as ScoreRepository, HighScore as HighScore
+from .score_repository import (
+    ScoreRepository as ScoreRepository,
+    HighScore as HighScore,
+    PlayerStats as PlayerStats,
+    window_period_start as window_period_start,
+)
+from .leaderboard_cache import LeaderboardCache as LeaderboardCache
+from .async_score_repository import AsyncScoreRepository as AsyncScoreRepository
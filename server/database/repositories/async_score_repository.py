@@ -0,0 +1,262 @@
+import asyncio
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from ..pool import ConnectionPool
+from .leaderboard_cache import LeaderboardCache
+from .score_repository import HighScore, PlayerStats, ScoreRepository
+
+
+class AsyncScoreRepository:
+    """Async facade over ScoreRepository backed by a ConnectionPool.
+
+    Reads run on a thread pool sized to the pool's read connections and writes
+    on a single writer thread, so blocking queries never run on the event loop
+    and queued inserts never hold up leaderboard reads.
+
+    When ``write_batch_size`` > 1, save_score buffers inserts and commits them
+    in groups (see DatabaseSettings). Each caller still resolves only after
+    its own row has been committed.
+
+    With a LeaderboardCache, committed inserts are applied to the cache and
+    get_top_scores answers ``limit <= capacity`` from memory once warm.
+    ``cache_hits`` and ``cache_misses`` count top-score lookups.
+
+    ``observe_query(method, seconds)``, if given, is called from the worker
+    thread after every ScoreRepository call, including connection checkout.
+    """
+
+    def __init__(
+        self,
+        pool: ConnectionPool,
+        cache: LeaderboardCache | None = None,
+        observe_query: Callable[[str, float], None] | None = None,
+    ) -> None:
+        self.pool = pool
+        self.cache = cache
+        self.observe_query = observe_query
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._pending: list[tuple[str, int, asyncio.Future[HighScore]]] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._batch_tasks: set[asyncio.Task[None]] = set()
+        self._warming: asyncio.Task[None] | None = None
+        self._read_executor = ThreadPoolExecutor(
+            max_workers=pool.settings.read_connections,
+            thread_name_prefix="sqlite-read",
+        )
+        self._write_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="sqlite-write"
+        )
+
+    def _read(self, method: str, args: tuple[Any, ...]) -> Any:
+        start = time.perf_counter()
+        try:
+            with self.pool.reader() as connection:
+                return getattr(ScoreRepository(connection), method)(*args)
+        finally:
+            if self.observe_query is not None:
+                self.observe_query(method, time.perf_counter() - start)
+
+    def _write(self, method: str, args: tuple[Any, ...]) -> Any:
+        start = time.perf_counter()
+        try:
+            with self.pool.writer() as connection:
+                return getattr(ScoreRepository(connection), method)(*args)
+        finally:
+            if self.observe_query is not None:
+                self.observe_query(method, time.perf_counter() - start)
+
+    async def _run_read(self, method: str, *args: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._read_executor, self._read, method, args)
+
+    async def _run_write(self, method: str, *args: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._write_executor, self._write, method, args
+        )
+
+    async def save_score(self, player_name: str, score: int) -> int:
+        """Insert a new high score. Returns the new row ID."""
+        return (await self.add_score(player_name, score)).id
+
+    async def add_score(self, player_name: str, score: int) -> HighScore:
+        """Insert a new high score. Returns the stored row."""
+        settings = self.pool.settings
+        if settings.write_batch_size <= 1:
+            high_score = await self._run_write("add_score", player_name, score)
+            if self.cache is not None:
+                self.cache.add(high_score)
+            return high_score
+
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[HighScore] = loop.create_future()
+        self._pending.append((player_name, score, future))
+        if len(self._pending) >= settings.write_batch_size:
+            self._flush_pending()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(
+                settings.write_batch_window, self._flush_pending
+            )
+        return await future
+
+    def _flush_pending(self) -> None:
+        """Hand the buffered inserts to the writer thread as one batch."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.get_running_loop().create_task(self._commit_batch(batch))
+            self._batch_tasks.add(task)
+            task.add_done_callback(self._batch_tasks.discard)
+
+    async def _commit_batch(
+        self, batch: list[tuple[str, int, asyncio.Future[HighScore]]]
+    ) -> None:
+        entries = [(player_name, score) for player_name, score, _ in batch]
+        # Whatever the write raises is handed to every caller in the batch
+        (high_scores,) = await asyncio.gather(
+            self._run_write("save_scores", entries), return_exceptions=True
+        )
+        if isinstance(high_scores, BaseException):
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(high_scores)
+            return
+        for (_, _, future), high_score in zip(batch, high_scores):
+            if self.cache is not None:
+                self.cache.add(high_score)
+            if not future.done():
+                future.set_result(high_score)
+
+    async def get_top_scores(self, limit: int = 10) -> list[HighScore]:
+        """Retrieve top N scores, ordered by score descending."""
+        if self.cache is not None:
+            cached = self.cache.top(limit)
+            if cached is not None:
+                self.cache_hits += 1
+                return cached
+            self.cache_misses += 1
+            if limit <= self.cache.capacity:
+                await self.warm_cache()
+                cached = self.cache.top(limit)
+                if cached is not None:
+                    return cached
+        return await self._run_read("get_top_scores", limit)
+
+    async def get_top_score_rows(
+        self, limit: int = 10
+    ) -> list[tuple[int, str, int, str | None]]:
+        """Retrieve top N scores as plain tuples, bypassing the cache."""
+        return await self._run_read("get_top_score_rows", limit)
+
+    async def get_score_rows_after_id(
+        self, after_id: int, limit: int
+    ) -> list[tuple[int, str, int, str | None]]:
+        """Next ``limit`` rows by id as plain tuples, for bulk export."""
+        return await self._run_read("get_score_rows_after_id", after_id, limit)
+
+    async def get_scores_after(
+        self, limit: int, after: tuple[int, int] | None = None
+    ) -> list[HighScore]:
+        """Next ``limit`` scores in leaderboard order after a (score, id) key."""
+        return await self._run_read("get_scores_after", limit, after)
+
+    async def get_scores_around_rank(
+        self, rank: int, radius: int
+    ) -> tuple[int, list[HighScore]]:
+        """Scores within ``radius`` places of position ``rank``."""
+        return await self._run_read("get_scores_around_rank", rank, radius)
+
+    async def get_scores_around_score(
+        self, score: int, radius: int
+    ) -> tuple[int, list[HighScore]]:
+        """Scores within ``radius`` places of where ``score`` would rank."""
+        return await self._run_read("get_scores_around_score", score, radius)
+
+    async def get_window_top_scores(
+        self, kind: str, period_start: str, limit: int = 10
+    ) -> list[HighScore]:
+        """Top N scores of one period of a leaderboard window."""
+        return await self._run_read("get_window_top_scores", kind, period_start, limit)
+
+    async def get_player_stats(self, player_name: str) -> PlayerStats | None:
+        """Return a player's aggregates, or None if they have no scores."""
+        return await self._run_read("get_player_stats", player_name)
+
+    async def get_top_players(self, limit: int = 10) -> list[HighScore]:
+        """Top N players by personal best, one entry per player."""
+        return await self._run_read("get_top_players", limit)
+
+    async def get_cached_top_scores(
+        self, limit: int
+    ) -> tuple[list[HighScore], int] | None:
+        """Return top scores with the cache version they were read at.
+
+        Returns None when there is no cache or ``limit`` exceeds its capacity.
+        """
+        if self.cache is None:
+            return None
+        if limit > self.cache.capacity:
+            self.cache_misses += 1
+            return None
+        if self.cache.is_warm:
+            self.cache_hits += 1
+        else:
+            self.cache_misses += 1
+            await self.warm_cache()
+        scores = self.cache.top(limit)
+        if scores is None:
+            return None
+        return scores, self.cache.version
+
+    async def warm_cache(self) -> None:
+        """Load the top-K rows into the cache, e.g. at startup.
+
+        Concurrent callers share a single in-flight database read.
+        """
+        if self.cache is None:
+            return
+        if self._warming is None or self._warming.done():
+            self._warming = asyncio.get_running_loop().create_task(self._load_cache())
+        await asyncio.shield(self._warming)
+
+    async def _load_cache(self) -> None:
+        generation = self.cache.generation
+        scores = await self._run_read("get_top_scores", self.cache.capacity)
+        self.cache.load(scores, generation)
+
+    async def delete_score(self, score_id: int) -> bool:
+        """Delete a score by ID and invalidate the cache. Returns True if found."""
+        deleted = await self._run_write("delete_score", score_id)
+        if deleted and self.cache is not None:
+            self.cache.invalidate()
+        return deleted
+
+    async def import_scores(self, entries: list[tuple[str, int, str | None]]) -> int:
+        """Insert a batch of imported scores in one transaction.
+
+        Imported rows may land anywhere in the leaderboard, so the cache is
+        invalidated rather than updated row by row.
+        """
+        imported = await self._run_write("import_scores", entries)
+        if self.cache is not None:
+            self.cache.invalidate()
+        return imported
+
+    async def get_highest_score(self) -> int:
+        """Return the highest score, or 0 if no scores exist."""
+        return await self._run_read("get_highest_score")
+
+    async def is_high_score(self, score: int) -> bool:
+        """Check if score qualifies for top 10."""
+        return await self._run_read("is_high_score", score)
+
+    def close(self) -> None:
+        """Stop the worker threads. The pool itself is closed by its owner."""
+        self._read_executor.shutdown(wait=True)
+        self._write_executor.shutdown(wait=True)
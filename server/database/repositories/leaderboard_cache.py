@@ -0,0 +1,72 @@
+import bisect
+
+from .score_repository import HighScore
+
+
+class LeaderboardCache:
+    """Sorted in-memory copy of the top ``capacity`` high scores.
+
+    Entries follow the leaderboard query order (score descending, then id
+    ascending). The cache only answers while warm; ``invalidate()`` drops it
+    until the next ``load()``. Every mutation bumps ``generation`` so a load
+    that raced with an insert can be detected and discarded, while
+    ``version`` only changes when the cached rows themselves change.
+    """
+
+    def __init__(self, capacity: int = 100) -> None:
+        self.capacity = capacity
+        self.generation = 0
+        self.version = 0
+        self._keys: list[tuple[int, int]] = []
+        self._entries: list[HighScore] = []
+        self._warm = False
+
+    @property
+    def is_warm(self) -> bool:
+        return self._warm
+
+    def top(self, limit: int) -> list[HighScore] | None:
+        """Return the top ``limit`` scores, or None if the cache can't answer."""
+        if not self._warm or limit > self.capacity:
+            return None
+        return self._entries[:limit]
+
+    def load(self, scores: list[HighScore], generation: int) -> bool:
+        """Replace the contents with a fresh top-K read.
+
+        ``generation`` must be the value read before querying the database;
+        if anything changed since, the load is rejected and the cache stays cold.
+        """
+        if generation != self.generation:
+            return False
+        self._entries = list(scores[: self.capacity])
+        self._keys = [(-s.score, s.id) for s in self._entries]
+        self._warm = True
+        self.version += 1
+        return True
+
+    def add(self, score: HighScore) -> None:
+        """Record a committed insert, keeping only the top ``capacity``."""
+        self.generation += 1
+        if not self._warm:
+            return
+        key = (-score.score, score.id)
+        if len(self._keys) >= self.capacity and key > self._keys[-1]:
+            return
+        index = bisect.bisect(self._keys, key)
+        if index and self._keys[index - 1] == key:
+            return  # already present via a load that saw this commit
+        self._keys.insert(index, key)
+        self._entries.insert(index, score)
+        if len(self._keys) > self.capacity:
+            self._keys.pop()
+            self._entries.pop()
+        self.version += 1
+
+    def invalidate(self) -> None:
+        """Drop the cached rows, e.g. after scores were deleted or edited."""
+        self.generation += 1
+        self.version += 1
+        self._warm = False
+        self._keys = []
+        self._entries = []
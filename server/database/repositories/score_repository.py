@@ -1,9 +1,21 @@
 import sqlite3
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import date, datetime, timedelta
 
+# Rolled-up leaderboard windows kept in score_windows
+SCORE_WINDOWS = ("daily", "weekly")
 
-@dataclass
+
+def window_period_start(kind: str, played_on: date) -> str:
+    """Return the ISO date on which the ``kind`` window containing a day starts."""
+    if kind == "daily":
+        return played_on.isoformat()
+    if kind == "weekly":
+        return (played_on - timedelta(days=played_on.weekday())).isoformat()
+    raise ValueError(f"Unknown leaderboard window: {kind}")
+
+
+@dataclass(slots=True)
 class HighScore:
     id: int
     player_name: str
@@ -11,6 +23,17 @@ class HighScore:
     played_at: datetime
 
 
+@dataclass(slots=True)
+class PlayerStats:
+    player_name: str
+    games_played: int
+    total_score: int
+    best_score: int
+    best_score_id: int
+    best_played_at: datetime
+    last_played_at: datetime
+
+
 class ScoreRepository:
     """Data access for high scores table."""
 
@@ -19,18 +42,284 @@ class ScoreRepository:
 
     def save_score(self, player_name: str, score: int) -> int:
         """Insert a new high score. Returns the new row ID."""
+        return self.add_score(player_name, score).id
+
+    def add_score(self, player_name: str, score: int) -> HighScore:
+        """Insert a new high score. Returns the stored row."""
+        try:
+            high_score = self._insert(player_name, score)
+        except BaseException:
+            self.conn.rollback()
+            raise
+        self.conn.commit()
+        return high_score
+
+    def save_scores(self, entries: list[tuple[str, int]]) -> list[HighScore]:
+        """Insert several scores in one transaction. Returns the stored rows.
+
+        Either every row is committed or, on any error, none are, so a
+        failed batch never leaves rows pending on the shared connection.
+        """
+        try:
+            high_scores = [self._insert(*entry) for entry in entries]
+        except BaseException:
+            self.conn.rollback()
+            raise
+        self.conn.commit()
+        return high_scores
+
+    def import_scores(self, entries: list[tuple[str, int, str | None]]) -> int:
+        """Insert (player_name, score, played_at) rows in one transaction.
+
+        A None played_at defaults to now. Returns the number of rows inserted.
+        """
+        try:
+            for entry in entries:
+                self._insert(*entry)
+        except BaseException:
+            self.conn.rollback()
+            raise
+        self.conn.commit()
+        return len(entries)
+
+    def _insert(
+        self, player_name: str, score: int, played_at: str | None = None
+    ) -> HighScore:
+        if played_at is None:
+            row = self.conn.execute(
+                "INSERT INTO high_scores (player_name, score) VALUES (?, ?) "
+                "RETURNING id, played_at",
+                (player_name, score),
+            ).fetchone()
+        else:
+            row = self.conn.execute(
+                "INSERT INTO high_scores (player_name, score, played_at) "
+                "VALUES (?, ?, ?) RETURNING id, played_at",
+                (player_name, score, played_at),
+            ).fetchone()
+        high_score = HighScore(
+            id=row["id"],
+            player_name=player_name,
+            score=score,
+            played_at=row["played_at"],
+        )
+        self._record_windows(high_score)
+        self._record_player(high_score)
+        return high_score
+
+    def _record_player(self, high_score: HighScore) -> None:
+        """Fold a new score into the player's player_best aggregates."""
+        self.conn.execute(
+            """
+            INSERT INTO player_best (
+                player_name, best_score, best_score_id, best_played_at,
+                games_played, total_score, last_played_at
+            ) VALUES (?, ?, ?, ?, 1, ?, ?)
+            ON CONFLICT (player_name) DO UPDATE SET
+                games_played = games_played + 1,
+                total_score = total_score + excluded.total_score,
+                last_played_at = MAX(last_played_at, excluded.last_played_at),
+                best_score_id = CASE WHEN excluded.best_score > best_score
+                    THEN excluded.best_score_id ELSE best_score_id END,
+                best_played_at = CASE WHEN excluded.best_score > best_score
+                    THEN excluded.best_played_at ELSE best_played_at END,
+                best_score = MAX(best_score, excluded.best_score)
+            """,
+            (
+                high_score.player_name,
+                high_score.score,
+                high_score.id,
+                high_score.played_at,
+                high_score.score,
+                high_score.played_at,
+            ),
+        )
+
+    def _refresh_player(self, player_name: str, score: int) -> None:
+        """Take a deleted ``score`` out of the player's aggregates.
+
+        games_played and total_score are adjusted rather than recomputed from
+        high_scores, so archived games still count. The best and last played
+        fields are looked up again among the stored scores. A player's best
+        is never archived, so one is always there while any remain. A player
+        with no stored scores left is removed, archived games included.
+        """
+        best = self.conn.execute(
+            "SELECT id, score, played_at FROM high_scores WHERE player_name = ? "
+            "ORDER BY score DESC, id ASC LIMIT 1",
+            (player_name,),
+        ).fetchone()
+        if best is None:
+            self.conn.execute(
+                "DELETE FROM player_best WHERE player_name = ?", (player_name,)
+            )
+            return
+        self.conn.execute(
+            """
+            UPDATE player_best SET
+                best_score = ?, best_score_id = ?, best_played_at = ?,
+                games_played = games_played - 1,
+                total_score = total_score - ?,
+                last_played_at = (
+                    SELECT MAX(played_at) FROM high_scores WHERE player_name = ?
+                )
+            WHERE player_name = ?
+            """,
+            (
+                best["score"],
+                best["id"],
+                best["played_at"],
+                score,
+                player_name,
+                player_name,
+            ),
+        )
+
+    def _record_windows(self, high_score: HighScore) -> None:
+        """Add a new score to the rollup of every leaderboard window."""
+        self.conn.executemany(
+            "INSERT INTO score_windows (kind, period_start, score, score_id) "
+            "VALUES (?, ?, ?, ?)",
+            self._window_keys(high_score.score, high_score.id, high_score.played_at),
+        )
+
+    @staticmethod
+    def _window_keys(
+        score: int, score_id: int, played_at: datetime | str
+    ) -> list[tuple[str, str, int, int]]:
+        played_on = datetime.fromisoformat(str(played_at)).date()
+        return [
+            (kind, window_period_start(kind, played_on), score, score_id)
+            for kind in SCORE_WINDOWS
+        ]
+
+    def delete_score(self, score_id: int) -> bool:
+        """Delete a score by ID. Returns True if a row was removed."""
+        row = self.conn.execute(
+            "SELECT player_name, score, played_at FROM high_scores WHERE id = ?",
+            (score_id,),
+        ).fetchone()
+        if row is None:
+            return False
+        self.conn.executemany(
+            "DELETE FROM score_windows "
+            "WHERE kind = ? AND period_start = ? AND score = ? AND score_id = ?",
+            self._window_keys(row["score"], score_id, row["played_at"]),
+        )
+        self.conn.execute("DELETE FROM high_scores WHERE id = ?", (score_id,))
+        self._refresh_player(row["player_name"], row["score"])
+        self.conn.commit()
+        return True
+
+    def get_archivable_scores(
+        self,
+        after: tuple[str, int],
+        played_before: str,
+        keep_from: tuple[int, int] | None,
+        limit: int,
+    ) -> tuple[list[HighScore], tuple[str, int] | None]:
+        """Scan up to ``limit`` rows after ``after`` for scores to archive.
+
+        Rows played before ``played_before`` are visited in (played_at, id)
+        order, resuming after the (played_at, id) key ``after``. Archivable
+        scores are those ranked below ``keep_from``, the (score, id) of the
+        last kept top-N entry. A player's best, which player_best points at,
+        is never archivable. Returns the archivable rows and the key to
+        resume from, or None once every old row has been scanned.
+        """
         cursor = self.conn.execute(
-            "INSERT INTO high_scores (player_name, score) VALUES (?, ?)",
-            (player_name, score),
+            "SELECT id, player_name, score, played_at FROM high_scores AS h "
+            "WHERE played_at < ? AND (played_at, id) > (?, ?) "
+            "AND NOT EXISTS (SELECT 1 FROM player_best AS p "
+            "WHERE p.player_name = h.player_name AND p.best_score_id = h.id) "
+            "ORDER BY played_at ASC, id ASC LIMIT ?",
+            (played_before, *after, limit),
         )
+        rows = cursor.fetchall()
+        archivable = []
+        for row in rows:
+            kept = keep_from is not None and (
+                row["score"] > keep_from[0]
+                or (row["score"] == keep_from[0] and row["id"] <= keep_from[1])
+            )
+            if not kept:
+                archivable.append(self._to_high_score(row))
+        if len(rows) < limit:
+            return archivable, None
+        last = rows[-1]
+        return archivable, (str(last["played_at"]), last["id"])
+
+    def get_score_key_at_rank(self, rank: int) -> tuple[int, int] | None:
+        """(score, id) of the entry at leaderboard position ``rank``."""
+        row = self.conn.execute(
+            "SELECT score, id FROM high_scores "
+            "ORDER BY score DESC, id ASC LIMIT 1 OFFSET ?",
+            (rank - 1,),
+        ).fetchone()
+        return (row["score"], row["id"]) if row else None
+
+    def purge_scores(self, scores: list[HighScore]) -> None:
+        """Remove archived scores and their window rows in one transaction.
+
+        Unlike delete_score, player_best is left alone so player aggregates
+        still count archived games.
+        """
+        try:
+            self.conn.executemany(
+                "DELETE FROM score_windows "
+                "WHERE kind = ? AND period_start = ? AND score = ? AND score_id = ?",
+                [
+                    key
+                    for s in scores
+                    for key in self._window_keys(s.score, s.id, s.played_at)
+                ],
+            )
+            self.conn.executemany(
+                "DELETE FROM high_scores WHERE id = ?", [(s.id,) for s in scores]
+            )
+        except BaseException:
+            self.conn.rollback()
+            raise
         self.conn.commit()
-        return cursor.lastrowid
+
+    def get_player_stats(self, player_name: str) -> PlayerStats | None:
+        """Return a player's aggregates, or None if they have no scores."""
+        row = self.conn.execute(
+            "SELECT player_name, games_played, total_score, best_score, "
+            "best_score_id, best_played_at, last_played_at "
+            "FROM player_best WHERE player_name = ?",
+            (player_name,),
+        ).fetchone()
+        return PlayerStats(**dict(row)) if row else None
+
+    def get_top_players(self, limit: int = 10) -> list[HighScore]:
+        """Top N players by personal best, one entry per player."""
+        cursor = self.conn.execute(
+            "SELECT best_score_id AS id, player_name, best_score AS score, "
+            "best_played_at AS played_at FROM player_best "
+            "ORDER BY best_score DESC, best_score_id ASC LIMIT ?",
+            (limit,),
+        )
+        return [self._to_high_score(row) for row in cursor.fetchall()]
+
+    def get_window_top_scores(
+        self, kind: str, period_start: str, limit: int = 10
+    ) -> list[HighScore]:
+        """Top N scores of one period of a leaderboard window."""
+        cursor = self.conn.execute(
+            "SELECT h.id, h.player_name, h.score, h.played_at "
+            "FROM score_windows w JOIN high_scores h ON h.id = w.score_id "
+            "WHERE w.kind = ? AND w.period_start = ? "
+            "ORDER BY w.score DESC, w.score_id ASC LIMIT ?",
+            (kind, period_start, limit),
+        )
+        return [self._to_high_score(row) for row in cursor.fetchall()]
 
     def get_top_scores(self, limit: int = 10) -> list[HighScore]:
         """Retrieve top N scores, ordered by score descending."""
         cursor = self.conn.execute(
             "SELECT id, player_name, score, played_at FROM high_scores "
-            "ORDER BY score DESC LIMIT ?",
+            "ORDER BY score DESC, id ASC LIMIT ?",
             (limit,),
         )
         results = []
@@ -45,6 +334,138 @@ class ScoreRepository:
             )
         return results
 
+    def get_top_score_rows(
+        self, limit: int = 10
+    ) -> list[tuple[int, str, int, str | None]]:
+        """Top N scores as plain (id, player_name, score, played_at) tuples.
+
+        Skips sqlite3.Row and HighScore construction for callers that only
+        serialize the rows.
+        """
+        cursor = self.conn.cursor()
+        cursor.row_factory = None
+        cursor.execute(
+            "SELECT id, player_name, score, played_at FROM high_scores "
+            "ORDER BY score DESC, id ASC LIMIT ?",
+            (limit,),
+        )
+        return cursor.fetchall()
+
+    def get_score_rows_after_id(
+        self, after_id: int, limit: int
+    ) -> list[tuple[int, str, int, str | None]]:
+        """Next ``limit`` rows with id > ``after_id`` as plain tuples, by id."""
+        cursor = self.conn.cursor()
+        cursor.row_factory = None
+        cursor.execute(
+            "SELECT id, player_name, score, played_at FROM high_scores "
+            "WHERE id > ? ORDER BY id LIMIT ?",
+            (after_id, limit),
+        )
+        return cursor.fetchall()
+
+    def get_scores_after(
+        self, limit: int, after: tuple[int, int] | None = None
+    ) -> list[HighScore]:
+        """Next ``limit`` scores in leaderboard order after a (score, id) key.
+
+        A keyset seek on idx_high_scores_score_id, so the cost does not grow
+        with how deep into the leaderboard ``after`` points.
+        """
+        if after is None:
+            return self.get_top_scores(limit)
+        score, score_id = after
+        cursor = self.conn.execute(
+            "SELECT id, player_name, score, played_at FROM high_scores "
+            "WHERE score <= ? AND (score < ? OR id > ?) "
+            "ORDER BY score DESC, id ASC LIMIT ?",
+            (score, score, score_id, limit),
+        )
+        return [self._to_high_score(row) for row in cursor.fetchall()]
+
+    def get_scores_before(self, limit: int, before: tuple[int, int]) -> list[HighScore]:
+        """Up to ``limit`` scores ranked just above a (score, id) key."""
+        score, score_id = before
+        cursor = self.conn.execute(
+            "SELECT id, player_name, score, played_at FROM high_scores "
+            "WHERE score >= ? AND (score > ? OR id < ?) "
+            "ORDER BY score ASC, id DESC LIMIT ?",
+            (score, score, score_id, limit),
+        )
+        return [self._to_high_score(row) for row in reversed(cursor.fetchall())]
+
+    def count_scores_ahead(self, score: int, score_id: int) -> int:
+        """Number of scores ranked above (score, id)."""
+        cursor = self.conn.execute(
+            "SELECT COUNT(*) FROM high_scores "
+            "WHERE score >= ? AND (score > ? OR id < ?)",
+            (score, score, score_id),
+        )
+        return cursor.fetchone()[0]
+
+    def get_scores_around_rank(
+        self, rank: int, radius: int
+    ) -> tuple[int, list[HighScore]]:
+        """Scores within ``radius`` places of leaderboard position ``rank``.
+
+        Returns (rank of the first returned score, scores). Locating the
+        anchor walks the covering index up to ``rank``; the neighborhood
+        itself is fetched with keyset seeks.
+        """
+        cursor = self.conn.execute(
+            "SELECT id, player_name, score, played_at FROM high_scores "
+            "ORDER BY score DESC, id ASC LIMIT 1 OFFSET ?",
+            (rank - 1,),
+        )
+        row = cursor.fetchone()
+        if row is None:
+            return rank, []
+        return self._neighborhood(self._to_high_score(row), rank, radius)
+
+    def get_scores_around_score(
+        self, score: int, radius: int
+    ) -> tuple[int, list[HighScore]]:
+        """Scores within ``radius`` places of where ``score`` would rank.
+
+        Returns (rank of the first returned score, scores). Ranking the anchor
+        counts the index entries above it; the rows are fetched by keyset.
+        """
+        cursor = self.conn.execute(
+            "SELECT id, player_name, score, played_at FROM high_scores "
+            "WHERE score <= ? ORDER BY score DESC, id ASC LIMIT 1",
+            (score,),
+        )
+        row = cursor.fetchone()
+        if row is None:
+            # Lower than every stored score: anchor on the last entry
+            cursor = self.conn.execute(
+                "SELECT id, player_name, score, played_at FROM high_scores "
+                "ORDER BY score ASC, id DESC LIMIT 1"
+            )
+            row = cursor.fetchone()
+            if row is None:
+                return 1, []
+        anchor = self._to_high_score(row)
+        anchor_rank = self.count_scores_ahead(anchor.score, anchor.id) + 1
+        return self._neighborhood(anchor, anchor_rank, radius)
+
+    def _neighborhood(
+        self, anchor: HighScore, anchor_rank: int, radius: int
+    ) -> tuple[int, list[HighScore]]:
+        key = (anchor.score, anchor.id)
+        above = self.get_scores_before(radius, key)
+        below = self.get_scores_after(radius, key)
+        return anchor_rank - len(above), [*above, anchor, *below]
+
+    @staticmethod
+    def _to_high_score(row: sqlite3.Row) -> HighScore:
+        return HighScore(
+            id=row["id"],
+            player_name=row["player_name"],
+            score=row["score"],
+            played_at=row["played_at"],
+        )
+
     def get_highest_score(self) -> int:
         """Return the highest score, or 0 if no scores exist."""
         cursor = self.conn.execute("SELECT MAX(score) as max_score FROM high_scores")
@@ -1,37 +1,236 @@
+import asyncio
 import logging
+import os
 import secrets
 import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager, suppress
+from datetime import UTC, date, datetime
+from enum import Enum
 from pathlib import Path
-from typing import Optional
+from typing import Annotated, Optional
 
 import httpx
 from fastapi import FastAPI, HTTPException, Header, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, Response
-from pydantic import BaseModel
-
-from database import DatabaseConnection, Migrator
-from database.repositories import ScoreRepository
+from fastapi.responses import Response, StreamingResponse
+from pydantic import BaseModel, Field
+
+from database import (
+    CompactionSettings,
+    Compactor,
+    DatabaseConnection,
+    DatabaseSettings,
+    Migrator,
+)
+from database.repositories import (
+    AsyncScoreRepository,
+    HighScore,
+    LeaderboardCache,
+    window_period_start,
+)
+from web import (
+    METRICS_CONTENT_TYPE,
+    EXPORT_MEDIA_TYPES,
+    MAX_SQLITE_INTEGER,
+    ArchiveCache,
+    ArchiveProxy,
+    FastJSONResponse,
+    ImportRowError,
+    LeaderboardResponseCache,
+    MetricsRegistry,
+    RateLimitMiddleware,
+    RequestMetricsMiddleware,
+    SampleFilter,
+    StaticSite,
+    TokenBucketLimiter,
+    configure_logging,
+    decode_cursor,
+    encode_cursor,
+    encode_high_scores,
+    encode_score_rows,
+    etag_matches,
+    iter_export,
+    iter_import_rows,
+    parse_levels,
+)
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+# Records are formatted and written by a background thread, not the event
+# loop; lifespan sets this up. ASTEROIDS_LOG_LEVELS sets per-logger levels,
+# e.g. "main.requests=WARNING,database=DEBUG". Per-request lines go to
+# main.requests and uvicorn.access, of which one in REQUEST_LOG_SAMPLE_EVERY
+# is kept.
+LOG_LEVEL = os.environ.get("ASTEROIDS_LOG_LEVEL", "INFO").upper()
+LOG_LEVELS = parse_levels(os.environ.get("ASTEROIDS_LOG_LEVELS", ""))
+REQUEST_LOG_SAMPLE_EVERY = int(
+    os.environ.get("ASTEROIDS_REQUEST_LOG_SAMPLE_EVERY", "100")
 )
+UVICORN_LOGGERS = ("uvicorn", "uvicorn.access")
 logger = logging.getLogger(__name__)
+request_logger = logging.getLogger(f"{__name__}.requests")
+request_logger.addFilter(SampleFilter(REQUEST_LOG_SAMPLE_EVERY))
+access_log_sample = SampleFilter(REQUEST_LOG_SAMPLE_EVERY)
 logger.info("Server module loaded")
 
-# Initialize database
-db_connection = DatabaseConnection().get_connection()
-Migrator(db_connection).run_migrations()
-score_repository = ScoreRepository(db_connection)
+# Prometheus metrics, served at /metrics
+metrics = MetricsRegistry()
+request_seconds = metrics.histogram(
+    "asteroids_http_request_duration_seconds",
+    "HTTP request latency by route template, method and status.",
+    ("route", "method", "status"),
+)
+sqlite_query_seconds = metrics.histogram(
+    "asteroids_sqlite_query_duration_seconds",
+    "ScoreRepository call latency, including connection checkout.",
+    ("method",),
+)
+
+
+def observe_sqlite_query(method: str, seconds: float) -> None:
+    sqlite_query_seconds.labels(method).observe(seconds)
+
+
+# Group-commit score inserts so a burst of submissions shares one fsync
+SCORE_WRITE_BATCH_SIZE = 64
+SCORE_WRITE_BATCH_WINDOW_SECONDS = 0.002
+# Reads use the pool's read-only connections, writes the single writer.
+# The top LEADERBOARD_CACHE_SIZE scores are also kept in memory.
+LEADERBOARD_CACHE_SIZE = 100
+# Opened (and migrated) by lifespan, unless one was already put in place
+score_repository: AsyncScoreRepository | None = None
+# Encoded GET /api/scores bodies, rebuilt only when the leaderboard changes
+leaderboard_responses = LeaderboardResponseCache()
+# Old scores outside the top SCORE_RETENTION_KEEP_TOP are archived daily.
+# Must stay >= LEADERBOARD_CACHE_SIZE so compaction never touches cached rows.
+SCORE_RETENTION_KEEP_TOP = 1000
+SCORE_RETENTION_DAYS = 30
 
 # Token storage: token -> (created_at, used)
 tokens: dict[str, tuple[float, bool]] = {}
 TOKEN_EXPIRY_SECONDS = 3600  # 1 hour
 MAX_PLAYER_NAME_LENGTH = 20
 
-app = FastAPI(title="Asteroids API")
+# Per-client token buckets on the unauthenticated submission endpoints:
+# RATE_LIMIT_BURST requests at once, refilling at RATE_LIMIT_PER_MINUTE.
+# A rate of 0 disables limiting.
+RATE_LIMIT_PER_MINUTE = float(os.environ.get("ASTEROIDS_RATE_LIMIT_PER_MINUTE", "30"))
+RATE_LIMIT_BURST = int(os.environ.get("ASTEROIDS_RATE_LIMIT_BURST", "10"))
+rate_limiters: dict[tuple[str, str], TokenBucketLimiter] = (
+    {
+        route: TokenBucketLimiter(RATE_LIMIT_PER_MINUTE / 60, RATE_LIMIT_BURST)
+        for route in (("POST", "/api/tokens"), ("POST", "/api/scores"))
+    }
+    if RATE_LIMIT_PER_MINUTE > 0
+    else {}
+)
+
+# Proxy pygame-web archives from CDN, caching up to ARCHIVE_CACHE_MAX_BYTES
+# on disk. Point ASTEROIDS_ARCHIVE_UPSTREAM at a local mirror if needed.
+PYGAME_WEB_CDN = os.environ.get(
+    "ASTEROIDS_ARCHIVE_UPSTREAM", "https://pygame-web.github.io"
+)
+ARCHIVE_CACHE_DIR = DatabaseConnection.DB_PATH.parent / "archives-cache"
+ARCHIVE_CACHE_MAX_BYTES = 512 * 1024 * 1024
+# The disk cache is opened in lifespan, so importing main touches no files
+archive_proxy = ArchiveProxy(f"{PYGAME_WEB_CDN}/archives")
+
+# Bulk export/import is disabled unless an admin token is configured
+ADMIN_TOKEN = os.environ.get("ASTEROIDS_ADMIN_TOKEN")
+SCORE_EXPORT_BATCH_SIZE = 1000
+SCORE_IMPORT_BATCH_SIZE = 5000
+
+
+async def _checkpoint_periodically() -> None:
+    """Checkpoint the WAL in the background so it does not grow unbounded."""
+    while True:
+        pool = score_repository.pool
+        await asyncio.sleep(pool.settings.checkpoint_interval)
+        try:
+            await asyncio.to_thread(pool.checkpoint)
+        except Exception:
+            logger.exception("WAL checkpoint failed")
 
+
+async def _compact_periodically() -> None:
+    """Archive old scores and vacuum freed pages once per interval."""
+    settings = CompactionSettings(
+        keep_top=SCORE_RETENTION_KEEP_TOP, keep_days=SCORE_RETENTION_DAYS
+    )
+    while True:
+        await asyncio.sleep(settings.interval)
+        try:
+            await asyncio.to_thread(Compactor(score_repository.pool, settings).run)
+        except Exception:
+            logger.exception("Score compaction failed")
+
+
+def _open_score_repository() -> AsyncScoreRepository:
+    """Open the database pool, apply pending migrations and wrap the pool."""
+    database = DatabaseConnection()
+    database.configure(
+        DatabaseSettings(
+            write_batch_size=SCORE_WRITE_BATCH_SIZE,
+            write_batch_window=SCORE_WRITE_BATCH_WINDOW_SECONDS,
+        )
+    )
+    pool = database.get_pool()
+    with pool.writer() as connection:
+        Migrator(connection).run_migrations()
+    return AsyncScoreRepository(
+        pool,
+        cache=LeaderboardCache(LEADERBOARD_CACHE_SIZE),
+        observe_query=observe_sqlite_query,
+    )
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    global score_repository
+    configure_logging(LOG_LEVEL, LOG_LEVELS, adopt=UVICORN_LOGGERS)
+    # addFilter ignores a filter that is already installed
+    logging.getLogger("uvicorn.access").addFilter(access_log_sample)
+    owns_repository = score_repository is None
+    if owns_repository:
+        score_repository = await asyncio.to_thread(_open_score_repository)
+    await score_repository.warm_cache()
+    owns_archive_cache = archive_proxy.cache is None
+    if owns_archive_cache:
+        archive_proxy.cache = await asyncio.to_thread(
+            ArchiveCache, ARCHIVE_CACHE_DIR, ARCHIVE_CACHE_MAX_BYTES
+        )
+    await asyncio.to_thread(static_site.reload)
+    # Preallocate the common series so scrapes see every route from the start
+    for route in app.routes:
+        for method in getattr(route, "methods", None) or ():
+            request_seconds.labels(route.path, method, "200")
+    background = [
+        asyncio.create_task(_checkpoint_periodically()),
+        asyncio.create_task(_compact_periodically()),
+    ]
+    yield
+    for task in background:
+        task.cancel()
+    for task in background:
+        with suppress(asyncio.CancelledError):
+            await task
+    await archive_proxy.aclose()
+    if owns_archive_cache:
+        archive_proxy.cache.close()
+        archive_proxy.cache = None
+    if owns_repository:
+        score_repository.close()
+        score_repository = None
+        DatabaseConnection().close()
+
+
+app = FastAPI(
+    title="Asteroids API",
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse,
+)
+
+# Innermost, so 429s still get CORS headers and are counted in metrics
+app.add_middleware(RateLimitMiddleware, limits=rate_limiters)
 # CORS for local development
 app.add_middleware(
     CORSMiddleware,
@@ -40,6 +239,54 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(RequestMetricsMiddleware, histogram=request_seconds)
+
+
+def _cache_lookups() -> list[tuple[dict[str, str], float]]:
+    caches = {
+        "leaderboard": (score_repository.cache_hits, score_repository.cache_misses),
+        "leaderboard_response": (
+            leaderboard_responses.hits,
+            leaderboard_responses.misses,
+        ),
+    }
+    if archive_proxy.cache is not None:
+        caches["archives"] = (archive_proxy.cache.hits, archive_proxy.cache.misses)
+    return [
+        ({"cache": cache, "result": result}, count)
+        for cache, counts in caches.items()
+        for result, count in zip(("hit", "miss"), counts)
+    ]
+
+
+def _limiters() -> list[tuple[str, TokenBucketLimiter]]:
+    return [(path, limiter) for (_, path), limiter in rate_limiters.items()]
+
+
+metrics.callback(
+    "asteroids_tokens",
+    "Submission tokens currently stored.",
+    "gauge",
+    lambda: [({}, len(tokens))],
+)
+metrics.callback(
+    "asteroids_rate_limited_total",
+    "Requests rejected with 429, by path.",
+    "counter",
+    lambda: [({"path": path}, limiter.rejected) for path, limiter in _limiters()],
+)
+metrics.callback(
+    "asteroids_rate_limit_clients",
+    "Clients currently tracked by the rate limiter, by path.",
+    "gauge",
+    lambda: [({"path": path}, len(limiter)) for path, limiter in _limiters()],
+)
+metrics.callback(
+    "asteroids_cache_lookups_total",
+    "Cache lookups by cache and result.",
+    "counter",
+    _cache_lookups,
+)
 
 
 class TokenResponse(BaseModel):
@@ -48,7 +295,8 @@ class TokenResponse(BaseModel):
 
 class ScoreSubmission(BaseModel):
     player_name: str
-    score: int
+    # Larger values cannot be bound as SQLite integers
+    score: int = Field(le=MAX_SQLITE_INTEGER)
 
 
 class ScoreResponse(BaseModel):
@@ -66,6 +314,56 @@ class ScoreCreatedResponse(BaseModel):
     id: int
 
 
+class RankedScoreResponse(ScoreResponse):
+    rank: int
+
+
+class LeaderboardPageResponse(BaseModel):
+    scores: list[RankedScoreResponse]
+    next_cursor: str | None
+
+
+class LeaderboardAroundResponse(BaseModel):
+    scores: list[RankedScoreResponse]
+
+
+class LeaderboardWindow(str, Enum):
+    DAILY = "daily"
+    WEEKLY = "weekly"
+    ALL_TIME = "all-time"
+
+
+class WindowedScoresResponse(BaseModel):
+    window: LeaderboardWindow
+    period_start: str | None
+    scores: list[ScoreResponse]
+
+
+class PlayerStatsResponse(BaseModel):
+    player_name: str
+    games_played: int
+    total_score: int
+    average_score: float
+    best_score: int
+    best_score_id: int
+    best_played_at: str
+    last_played_at: str
+
+
+class ScoreTransferFormat(str, Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+class ScoreImportResponse(BaseModel):
+    imported: int
+
+
+class HealthResponse(BaseModel):
+    status: str
+    database: bool
+
+
 def _cleanup_expired_tokens() -> None:
     """Remove expired tokens."""
     now = time.time()
@@ -104,29 +402,46 @@ async def create_token() -> TokenResponse:
     _cleanup_expired_tokens()
     token = secrets.token_urlsafe(32)
     tokens[token] = (time.time(), False)
-    logger.info("Token created")
+    request_logger.info("token created")
     return TokenResponse(token=token)
 
 
 @app.get("/api/scores", response_model=ScoresListResponse)
 async def get_scores(
+    request: Request,
     limit: int = Query(default=10, ge=1, le=100),
-) -> ScoresListResponse:
-    """Get top scores."""
-    logger.info(f"GET /api/scores limit={limit}")
-    scores = score_repository.get_top_scores(limit)
-    logger.info(f"Returning {len(scores)} scores")
-    return ScoresListResponse(
-        scores=[
-            ScoreResponse(
-                id=s.id,
-                player_name=s.player_name,
-                score=s.score,
-                played_at=str(s.played_at) if s.played_at else "",
-            )
-            for s in scores
-        ]
+    per_player: bool = Query(default=False),
+) -> Response | ScoresListResponse:
+    """Get top scores.
+
+    Cacheable limits are served as pre-encoded JSON with a strong ETag, and
+    a matching If-None-Match gets an empty 304. With ``per_player`` each
+    player appears once, with their personal best.
+    """
+    # All paths encode rows directly with orjson instead of building
+    # ScoresListResponse, which still documents the shape in OpenAPI.
+    request_logger.info("get scores limit=%d per_player=%s", limit, per_player)
+    if per_player:
+        scores = await score_repository.get_top_players(limit)
+        return Response(
+            content=encode_high_scores(scores), media_type="application/json"
+        )
+
+    cached = await score_repository.get_cached_top_scores(limit)
+    if cached is None:
+        rows = await score_repository.get_top_score_rows(limit)
+        request_logger.debug("returning %d uncached scores", len(rows))
+        return Response(content=encode_score_rows(rows), media_type="application/json")
+
+    scores, version = cached
+    body, etag = leaderboard_responses.get(
+        limit, version, lambda: encode_high_scores(scores)
     )
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    request_logger.debug("returning %d cached scores", len(scores))
+    return Response(content=body, media_type="application/json", headers=headers)
 
 
 @app.post("/api/scores", response_model=ScoreCreatedResponse)
@@ -135,12 +450,14 @@ async def submit_score(
     authorization: Optional[str] = Header(default=None),
 ) -> ScoreCreatedResponse:
     """Submit a new high score. Requires a valid Bearer token."""
-    logger.info(
-        f"Score submission: player={submission.player_name}, score={submission.score}"
+    request_logger.info(
+        "score submission player=%r score=%d",
+        submission.player_name,
+        submission.score,
     )
 
     if not _validate_token(authorization):
-        logger.warning("Score submission rejected: invalid token")
+        logger.warning("score submission rejected: invalid token")
         raise HTTPException(status_code=401, detail="Invalid or expired token")
 
     if (
@@ -148,64 +465,255 @@ async def submit_score(
         or len(submission.player_name) > MAX_PLAYER_NAME_LENGTH
     ):
         logger.warning(
-            f"Score submission rejected: invalid player name '{submission.player_name}'"
+            "score submission rejected: invalid player name %r",
+            submission.player_name,
         )
         raise HTTPException(status_code=400, detail="Invalid player name")
 
     if submission.score < 0:
-        logger.warning(f"Score submission rejected: invalid score {submission.score}")
+        logger.warning("score submission rejected: invalid score %d", submission.score)
         raise HTTPException(status_code=400, detail="Invalid score")
 
-    row_id = score_repository.save_score(submission.player_name, submission.score)
+    row_id = await score_repository.save_score(submission.player_name, submission.score)
+    # Saved scores are logged in full; they are rate-limited per client
     logger.info(
-        f"Score saved: id={row_id}, player={submission.player_name}, score={submission.score}"
+        "score saved id=%d player=%r score=%d",
+        row_id,
+        submission.player_name,
+        submission.score,
     )
     return ScoreCreatedResponse(id=row_id)
 
 
-# Proxy pygame-web archives from CDN
-PYGAME_WEB_CDN = "https://pygame-web.github.io"
+def _ranked(scores: list[HighScore], first_rank: int) -> list[RankedScoreResponse]:
+    return [
+        RankedScoreResponse(
+            rank=first_rank + i,
+            id=s.id,
+            player_name=s.player_name,
+            score=s.score,
+            played_at=str(s.played_at) if s.played_at else "",
+        )
+        for i, s in enumerate(scores)
+    ]
+
+
+@app.get("/api/leaderboard", response_model=LeaderboardPageResponse)
+async def get_leaderboard_page(
+    limit: int = Query(default=25, ge=1, le=100),
+    cursor: str | None = Query(default=None),
+) -> LeaderboardPageResponse:
+    """Page through the full leaderboard using an opaque next_cursor."""
+    after = None
+    first_rank = 1
+    if cursor is not None:
+        try:
+            score, score_id, rank = decode_cursor(cursor)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        after = (score, score_id)
+        first_rank = rank + 1
+
+    # Fetch one extra row to learn whether another page exists
+    scores = await score_repository.get_scores_after(limit + 1, after)
+    next_cursor = None
+    if len(scores) > limit:
+        scores = scores[:limit]
+        last = scores[-1]
+        next_cursor = encode_cursor(last.score, last.id, first_rank + limit - 1)
+    return LeaderboardPageResponse(
+        scores=_ranked(scores, first_rank), next_cursor=next_cursor
+    )
+
+
+@app.get("/api/leaderboard/around", response_model=LeaderboardAroundResponse)
+async def get_leaderboard_around(
+    rank: int | None = Query(default=None, ge=1, le=MAX_SQLITE_INTEGER),
+    score: int | None = Query(default=None, ge=0, le=MAX_SQLITE_INTEGER),
+    radius: int = Query(default=5, ge=0, le=50),
+) -> LeaderboardAroundResponse:
+    """Get the scores around a leaderboard position or a score value.
+
+    Exactly one of ``rank`` or ``score`` must be given.
+    """
+    if (rank is None) == (score is None):
+        raise HTTPException(status_code=400, detail="Specify either rank or score")
+    if rank is not None:
+        first_rank, scores = await score_repository.get_scores_around_rank(rank, radius)
+    else:
+        first_rank, scores = await score_repository.get_scores_around_score(
+            score, radius
+        )
+    return LeaderboardAroundResponse(scores=_ranked(scores, first_rank))
+
+
+@app.get("/api/leaderboard/{window}", response_model=WindowedScoresResponse)
+async def get_windowed_leaderboard(
+    window: LeaderboardWindow,
+    limit: int = Query(default=10, ge=1, le=100),
+    period: Annotated[date | None, Query()] = None,
+) -> WindowedScoresResponse:
+    """Get top scores for a daily, weekly or all-time leaderboard.
+
+    ``period`` selects any day inside a past window; it defaults to today (UTC).
+    """
+    if window is LeaderboardWindow.ALL_TIME:
+        period_start = None
+        scores = await score_repository.get_top_scores(limit)
+    else:
+        day = period or datetime.now(UTC).date()
+        period_start = window_period_start(window.value, day)
+        scores = await score_repository.get_window_top_scores(
+            window.value, period_start, limit
+        )
+    return WindowedScoresResponse(
+        window=window,
+        period_start=period_start,
+        scores=[
+            ScoreResponse(
+                id=s.id,
+                player_name=s.player_name,
+                score=s.score,
+                played_at=str(s.played_at) if s.played_at else "",
+            )
+            for s in scores
+        ],
+    )
+
+
+@app.get("/api/players/{player_name}", response_model=PlayerStatsResponse)
+async def get_player_stats(player_name: str) -> PlayerStatsResponse:
+    """Get a player's games played, total, best and last played."""
+    stats = await score_repository.get_player_stats(player_name)
+    if stats is None:
+        raise HTTPException(status_code=404, detail="Player not found")
+    return PlayerStatsResponse(
+        player_name=stats.player_name,
+        games_played=stats.games_played,
+        total_score=stats.total_score,
+        average_score=stats.total_score / stats.games_played,
+        best_score=stats.best_score,
+        best_score_id=stats.best_score_id,
+        best_played_at=str(stats.best_played_at) if stats.best_played_at else "",
+        last_played_at=str(stats.last_played_at) if stats.last_played_at else "",
+    )
+
+
+def _require_admin(authorization: str | None) -> None:
+    """Raise 401 unless the Bearer token matches ADMIN_TOKEN."""
+    if (
+        not ADMIN_TOKEN
+        or not authorization
+        or not authorization.startswith("Bearer ")
+        or not secrets.compare_digest(authorization[7:], ADMIN_TOKEN)
+    ):
+        raise HTTPException(status_code=401, detail="Invalid admin token")
+
+
+@app.get("/api/admin/scores/export", response_class=StreamingResponse)
+async def export_scores(
+    format: Annotated[ScoreTransferFormat, Query()] = ScoreTransferFormat.NDJSON,
+    authorization: str | None = Header(default=None),
+) -> StreamingResponse:
+    """Stream every score as NDJSON or CSV, in id order. Requires the admin token."""
+    _require_admin(authorization)
+    logger.info("exporting scores format=%s", format.value)
+    return StreamingResponse(
+        iter_export(
+            score_repository.get_score_rows_after_id,
+            format.value,
+            SCORE_EXPORT_BATCH_SIZE,
+        ),
+        media_type=EXPORT_MEDIA_TYPES[format.value],
+        headers={
+            "Content-Disposition": (
+                f'attachment; filename="high_scores.{format.value}"'
+            )
+        },
+    )
+
+
+@app.post("/api/admin/scores/import", response_model=ScoreImportResponse)
+async def import_scores(
+    request: Request,
+    format: Annotated[ScoreTransferFormat, Query()] = ScoreTransferFormat.NDJSON,
+    authorization: str | None = Header(default=None),
+) -> ScoreImportResponse:
+    """Bulk-insert scores from an NDJSON or CSV body. Requires the admin token.
+
+    The body is read as a stream and committed in batches, so rows before a
+    rejected line stay imported; the error reports how many.
+    """
+    _require_admin(authorization)
+    imported = 0
+    batch: list[tuple[str, int, str | None]] = []
+    try:
+        async for row in iter_import_rows(
+            request.stream(), format.value, MAX_PLAYER_NAME_LENGTH
+        ):
+            batch.append(row)
+            if len(batch) >= SCORE_IMPORT_BATCH_SIZE:
+                imported += await score_repository.import_scores(batch)
+                batch = []
+    except ImportRowError as exc:
+        logger.warning("score import stopped after %d rows: %s", imported, exc)
+        raise HTTPException(
+            status_code=400, detail=f"{exc} ({imported} rows imported)"
+        ) from None
+    if batch:
+        imported += await score_repository.import_scores(batch)
+    logger.info("imported %d scores", imported)
+    return ScoreImportResponse(imported=imported)
+
+
+@app.get("/api/health", response_model=HealthResponse)
+async def health() -> HealthResponse:
+    """Report whether every pooled database connection responds."""
+    database_ok = await asyncio.to_thread(score_repository.pool.health_check)
+    return HealthResponse(
+        status="ok" if database_ok else "degraded", database=database_ok
+    )
+
+
+@app.get("/metrics", include_in_schema=False)
+async def get_metrics() -> Response:
+    """Prometheus text exposition of request, SQLite, token and cache metrics."""
+    return Response(content=metrics.render(), media_type=METRICS_CONTENT_TYPE)
 
 
 @app.get("/archives/{path:path}")
 async def proxy_pygame_archives(path: str, request: Request) -> Response:
     """Proxy requests to pygame-web CDN for WASM packages."""
-    cdn_url = f"{PYGAME_WEB_CDN}/archives/{path}"
-
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(cdn_url, follow_redirects=True)
-            return Response(
-                content=response.content,
-                status_code=response.status_code,
-                media_type=response.headers.get("content-type"),
-            )
-        except httpx.RequestError:
-            raise HTTPException(status_code=502, detail="Failed to fetch from CDN")
+    try:
+        return await archive_proxy.get(path, request.headers.get("if-none-match"))
+    except httpx.RequestError:
+        raise HTTPException(status_code=502, detail="Failed to fetch from CDN")
 
 
 # Serve static game files from root (must be last to not override API routes)
 STATIC_DIR = Path(__file__).parent / "static" / "game"
+# Indexed at startup; re-indexed when make deploy replaces the bundle
+static_site = StaticSite(STATIC_DIR)
 
 
 @app.get("/", response_model=None)
-async def root() -> FileResponse | dict[str, str]:
+async def root(request: Request) -> Response | dict[str, str]:
     """Serve game index."""
-    index_path = STATIC_DIR / "index.html"
-    if index_path.exists():
-        return FileResponse(index_path)
+    response = static_site.response("index.html", request.headers)
+    if response is not None:
+        return response
     return {"message": "Asteroids API. Game not built yet - run 'make deploy'"}
 
 
 # Serve other game static files (app.apk, favicon.png, etc.) from root
 @app.get("/{filename:path}")
-async def serve_game_files(filename: str) -> FileResponse:
+async def serve_game_files(filename: str, request: Request) -> Response:
     """Serve game static files."""
     # Don't serve if it's an API or archives route
     if filename.startswith("api/") or filename.startswith("archives/"):
         raise HTTPException(status_code=404)
 
-    file_path = STATIC_DIR / filename
-    if file_path.exists() and file_path.is_file():
-        return FileResponse(file_path)
+    response = static_site.response(filename, request.headers)
+    if response is not None:
+        return response
     raise HTTPException(status_code=404, detail="File not found")
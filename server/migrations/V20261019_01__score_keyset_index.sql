@@ -0,0 +1,6 @@
+-- Composite index matching the leaderboard order (score DESC, id ASC).
+-- Serves top-N queries and (score, id) keyset seeks for pagination, and
+-- supersedes the single-column score index.
+CREATE INDEX IF NOT EXISTS idx_high_scores_score_id ON high_scores(score DESC, id ASC);
+
+DROP INDEX IF EXISTS idx_high_scores_score;
@@ -0,0 +1,18 @@
+-- Rollup for time-windowed leaderboards. One row per score per window
+-- ('daily', 'weekly'), keyed so that the top scores of a period are a
+-- prefix scan of the primary key. Periods start at 00:00 UTC; weekly
+-- periods start on Monday. A new period is just a new key prefix.
+CREATE TABLE IF NOT EXISTS score_windows (
+    kind TEXT NOT NULL,
+    period_start TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    score_id INTEGER NOT NULL,
+    PRIMARY KEY (kind, period_start, score DESC, score_id)
+) WITHOUT ROWID;
+
+-- Backfill from existing scores
+INSERT OR IGNORE INTO score_windows (kind, period_start, score, score_id)
+SELECT 'daily', date(played_at), score, id FROM high_scores;
+
+INSERT OR IGNORE INTO score_windows (kind, period_start, score, score_id)
+SELECT 'weekly', date(played_at, 'weekday 0', '-6 days'), score, id FROM high_scores;
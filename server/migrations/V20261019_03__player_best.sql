@@ -0,0 +1,39 @@
+-- Per-player aggregates, kept current by an UPSERT on every score insert.
+-- best_score_id points at the player's earliest-submitted best score.
+CREATE TABLE IF NOT EXISTS player_best (
+    player_name TEXT PRIMARY KEY,
+    best_score INTEGER NOT NULL,
+    best_score_id INTEGER NOT NULL,
+    best_played_at TIMESTAMP,
+    games_played INTEGER NOT NULL,
+    total_score INTEGER NOT NULL,
+    last_played_at TIMESTAMP
+);
+
+-- One-entry-per-player leaderboard order
+CREATE INDEX IF NOT EXISTS idx_player_best_score ON player_best(best_score DESC, best_score_id ASC);
+
+-- Per-player lookups on the raw scores (recomputing a best after a delete)
+CREATE INDEX IF NOT EXISTS idx_high_scores_player ON high_scores(player_name, score DESC, id ASC);
+
+-- Backfill from existing scores
+INSERT OR IGNORE INTO player_best (
+    player_name, best_score, best_score_id, best_played_at,
+    games_played, total_score, last_played_at
+)
+SELECT best.player_name, best.score, best.id, best.played_at,
+       agg.games_played, agg.total_score, agg.last_played_at
+FROM (
+    SELECT player_name,
+           COUNT(*) AS games_played,
+           SUM(score) AS total_score,
+           MAX(played_at) AS last_played_at
+    FROM high_scores
+    GROUP BY player_name
+) AS agg
+JOIN high_scores AS best ON best.id = (
+    SELECT id FROM high_scores
+    WHERE player_name = agg.player_name
+    ORDER BY score DESC, id ASC
+    LIMIT 1
+);
@@ -0,0 +1,4 @@
+-- Index for scanning scores by age. The retention job walks it in
+-- (played_at, id) order and stops at the cutoff; imported scores can be
+-- older than rows with lower ids, so id order cannot be used for this.
+CREATE INDEX IF NOT EXISTS idx_high_scores_played_at ON high_scores(played_at);
@@ -1,49 +1,56 @@
 import os
-import sqlite3
 import tempfile
 from collections.abc import Generator
+from pathlib import Path
 
 import pytest
 from fastapi.testclient import TestClient
 
+from database import ConnectionPool, DatabaseSettings, Migrator
+
 
 @pytest.fixture
-def test_db() -> Generator[sqlite3.Connection, None, None]:
-    """Create a temporary test database."""
+def test_db() -> Generator[ConnectionPool, None, None]:
+    """Create a temporary test database and its connection pool."""
     fd, path = tempfile.mkstemp(suffix=".db")
     os.close(fd)
 
-    conn = sqlite3.connect(path, check_same_thread=False)
-    conn.row_factory = sqlite3.Row
+    pool = ConnectionPool(Path(path), DatabaseSettings(read_connections=2))
 
     # Create schema
-    conn.execute("""
-        CREATE TABLE IF NOT EXISTS high_scores (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            player_name TEXT NOT NULL,
-            score INTEGER NOT NULL,
-            played_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    """)
-    conn.commit()
+    with pool.writer() as conn:
+        Migrator(conn).run_migrations()
 
-    yield conn
+    yield pool
 
-    conn.close()
-    os.unlink(path)
+    pool.close()
+    for suffix in ("", "-wal", "-shm"):
+        if os.path.exists(path + suffix):
+            os.unlink(path + suffix)
 
 
 @pytest.fixture
-def client(test_db: sqlite3.Connection) -> Generator[TestClient, None, None]:
+def client(
+    test_db: ConnectionPool, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> Generator[TestClient, None, None]:
     """Create a test client with isolated database."""
     # Patch the database connection before importing app
     import main
-    from database.repositories import ScoreRepository
+
+    monkeypatch.setattr(main, "ARCHIVE_CACHE_DIR", tmp_path / "archives-cache")
+    from database.repositories import AsyncScoreRepository, LeaderboardCache
 
     # Replace the score repository with one using our test database
-    main.score_repository = ScoreRepository(test_db)
+    main.score_repository = AsyncScoreRepository(
+        test_db, cache=LeaderboardCache(main.LEADERBOARD_CACHE_SIZE)
+    )
+    main.leaderboard_responses.clear()
     # Clear any tokens from previous tests
     main.tokens.clear()
+    for limiter in main.rate_limiters.values():
+        limiter.clear()
 
     with TestClient(main.app) as client:
         yield client
+
+    main.score_repository.close()
@@ -1,7 +1,34 @@
 """Smoke tests for server API endpoints."""
 
+import base64
+import csv
+import io
+import json
+
+import pytest
+from database import ConnectionPool
 from fastapi.testclient import TestClient
 
+ADMIN_HEADERS = {"Authorization": "Bearer admin-secret"}
+
+
+def _seed_scores(pool: ConnectionPool, scores: list[int]) -> None:
+    with pool.writer() as conn:
+        conn.executemany(
+            "INSERT INTO high_scores (player_name, score) VALUES (?, ?)",
+            [(f"P{i}", score) for i, score in enumerate(scores)],
+        )
+        conn.commit()
+
+
+def _submit_score(client: TestClient, player_name: str, score: int) -> None:
+    token = client.post("/api/tokens").json()["token"]
+    client.post(
+        "/api/scores",
+        json={"player_name": player_name, "score": score},
+        headers={"Authorization": f"Bearer {token}"},
+    )
+
 
 class TestTokenEndpoint:
     """Tests for /api/tokens endpoint."""
@@ -102,6 +129,18 @@ class TestScoresEndpoint:
         )
         assert response.status_code == 400
 
+    def test_submit_score_rejects_oversized_score(self, client: TestClient) -> None:
+        """POST /api/scores should reject scores SQLite cannot store."""
+        token = client.post("/api/tokens").json()["token"]
+
+        response = client.post(
+            "/api/scores",
+            json={"player_name": "Test", "score": 2**70},
+            headers={"Authorization": f"Bearer {token}"},
+        )
+        assert response.status_code == 422
+        assert client.get("/api/scores").json()["scores"] == []
+
     def test_scores_persist_after_submission(self, client: TestClient) -> None:
         """Submitted scores should appear in GET /api/scores."""
         # Submit a score
@@ -120,6 +159,236 @@ class TestScoresEndpoint:
         assert data["scores"][0]["player_name"] == "HighScorer"
         assert data["scores"][0]["score"] == 5000
 
+    def test_get_scores_etag_revalidation(self, client: TestClient) -> None:
+        """GET /api/scores should answer a matching If-None-Match with 304."""
+        first = client.get("/api/scores")
+        etag = first.headers["etag"]
+
+        unchanged = client.get("/api/scores", headers={"If-None-Match": etag})
+        assert unchanged.status_code == 304
+        assert unchanged.content == b""
+
+        token = client.post("/api/tokens").json()["token"]
+        client.post(
+            "/api/scores",
+            json={"player_name": "NewLeader", "score": 42},
+            headers={"Authorization": f"Bearer {token}"},
+        )
+
+        changed = client.get("/api/scores", headers={"If-None-Match": etag})
+        assert changed.status_code == 200
+        assert changed.headers["etag"] != etag
+        assert changed.json()["scores"][0]["player_name"] == "NewLeader"
+
+
+class TestLeaderboardEndpoint:
+    """Tests for /api/leaderboard pagination endpoints."""
+
+    def test_pages_cover_leaderboard_in_order(
+        self, client: TestClient, test_db: ConnectionPool
+    ) -> None:
+        """Following next_cursor should visit every score once, in order."""
+        _seed_scores(test_db, [50, 70, 50, 10, 90, 70, 30])
+        seen = []
+        cursor = None
+        while True:
+            params = {"limit": 3} if cursor is None else {"limit": 3, "cursor": cursor}
+            data = client.get("/api/leaderboard", params=params).json()
+            seen.extend(data["scores"])
+            cursor = data["next_cursor"]
+            if cursor is None:
+                break
+
+        assert [s["score"] for s in seen] == [90, 70, 70, 50, 50, 30, 10]
+        assert [s["rank"] for s in seen] == list(range(1, 8))
+        assert len({s["id"] for s in seen}) == 7
+
+    def test_invalid_cursor_rejected(self, client: TestClient) -> None:
+        """A malformed cursor should return 400."""
+        response = client.get("/api/leaderboard", params={"cursor": "!!"})
+        assert response.status_code == 400
+
+    def test_out_of_range_values_rejected(self, client: TestClient) -> None:
+        """Numbers SQLite cannot bind should return 400/422, not 500."""
+        huge = 10**23
+        cursor = base64.urlsafe_b64encode(f"{huge}:1:1".encode()).decode()
+        response = client.get("/api/leaderboard", params={"cursor": cursor})
+        assert response.status_code == 400
+        for anchor in ("rank", "score"):
+            response = client.get("/api/leaderboard/around", params={anchor: huge})
+            assert response.status_code == 422
+
+    def test_around_rank(self, client: TestClient, test_db: ConnectionPool) -> None:
+        """Scores around a rank should be centered on that rank."""
+        _seed_scores(test_db, [100, 90, 80, 70, 60, 50])
+        response = client.get(
+            "/api/leaderboard/around", params={"rank": 3, "radius": 1}
+        )
+        data = response.json()
+        assert [(s["rank"], s["score"]) for s in data["scores"]] == [
+            (2, 90),
+            (3, 80),
+            (4, 70),
+        ]
+
+    def test_around_score(self, client: TestClient, test_db: ConnectionPool) -> None:
+        """Scores around a value should center on the first score not above it."""
+        _seed_scores(test_db, [100, 90, 80, 70, 60, 50])
+        response = client.get(
+            "/api/leaderboard/around", params={"score": 75, "radius": 2}
+        )
+        data = response.json()
+        assert [(s["rank"], s["score"]) for s in data["scores"]] == [
+            (2, 90),
+            (3, 80),
+            (4, 70),
+            (5, 60),
+            (6, 50),
+        ]
+
+    def test_around_requires_one_anchor(self, client: TestClient) -> None:
+        """Giving both or neither of rank and score should return 400."""
+        assert client.get("/api/leaderboard/around").status_code == 400
+        response = client.get("/api/leaderboard/around", params={"rank": 1, "score": 1})
+        assert response.status_code == 400
+
+
+class TestWindowedLeaderboardEndpoint:
+    """Tests for /api/leaderboard/{window}."""
+
+    def test_new_scores_appear_in_current_windows(self, client: TestClient) -> None:
+        """Submitted scores should be ranked on today's daily and weekly boards."""
+        _submit_score(client, "Low", 10)
+        _submit_score(client, "High", 20)
+        for window in ("daily", "weekly", "all-time"):
+            data = client.get(f"/api/leaderboard/{window}").json()
+            assert [s["player_name"] for s in data["scores"]] == ["High", "Low"]
+
+    def test_past_period_is_separate(self, client: TestClient) -> None:
+        """Scores from today should not appear in an older period."""
+        _submit_score(client, "Today", 10)
+        data = client.get(
+            "/api/leaderboard/weekly", params={"period": "2001-01-03"}
+        ).json()
+        assert data["period_start"] == "2001-01-01"
+        assert data["scores"] == []
+
+    def test_unknown_window_rejected(self, client: TestClient) -> None:
+        """Only daily, weekly and all-time windows exist."""
+        assert client.get("/api/leaderboard/monthly").status_code == 422
+
+
+class TestPlayersEndpoint:
+    """Tests for per-player stats and leaderboards."""
+
+    def test_player_stats(self, client: TestClient) -> None:
+        """GET /api/players/{name} should aggregate every submission."""
+        for score in (100, 300, 200):
+            _submit_score(client, "Grinder", score)
+        data = client.get("/api/players/Grinder").json()
+        assert data["games_played"] == 3
+        assert data["total_score"] == 600
+        assert data["average_score"] == 200
+        assert data["best_score"] == 300
+
+    def test_unknown_player(self, client: TestClient) -> None:
+        """Players without scores should return 404."""
+        assert client.get("/api/players/Nobody").status_code == 404
+
+    def test_per_player_leaderboard(self, client: TestClient) -> None:
+        """per_player=true should list each player once with their best."""
+        for score in (500, 400, 300):
+            _submit_score(client, "Grinder", score)
+        _submit_score(client, "Casual", 450)
+        data = client.get("/api/scores", params={"per_player": "true"}).json()
+        assert [(s["player_name"], s["score"]) for s in data["scores"]] == [
+            ("Grinder", 500),
+            ("Casual", 450),
+        ]
+
+
+class TestAdminScoresEndpoints:
+    """Tests for bulk score export and import."""
+
+    @pytest.fixture(autouse=True)
+    def _admin(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        import main
+
+        monkeypatch.setattr(main, "ADMIN_TOKEN", "admin-secret")
+        monkeypatch.setattr(main, "SCORE_EXPORT_BATCH_SIZE", 2)
+        monkeypatch.setattr(main, "SCORE_IMPORT_BATCH_SIZE", 2)
+
+    def test_requires_admin_token(self, client: TestClient) -> None:
+        """Export and import should reject missing or wrong tokens."""
+        assert client.get("/api/admin/scores/export").status_code == 401
+        response = client.post(
+            "/api/admin/scores/import",
+            content=b"",
+            headers={"Authorization": "Bearer wrong"},
+        )
+        assert response.status_code == 401
+
+    def test_export_ndjson(self, client: TestClient, test_db: ConnectionPool) -> None:
+        """Export should stream every row across pages, in id order."""
+        _seed_scores(test_db, [30, 10, 20, 40, 50])
+        response = client.get("/api/admin/scores/export", headers=ADMIN_HEADERS)
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        assert [row["score"] for row in rows] == [30, 10, 20, 40, 50]
+
+    def test_csv_round_trip(self, client: TestClient, test_db: ConnectionPool) -> None:
+        """A CSV export should import back with the same names and dates."""
+        _seed_scores(test_db, [30, 10, 20])
+        exported = client.get(
+            "/api/admin/scores/export", params={"format": "csv"}, headers=ADMIN_HEADERS
+        ).text
+        response = client.post(
+            "/api/admin/scores/import",
+            params={"format": "csv"},
+            content=exported.encode(),
+            headers=ADMIN_HEADERS,
+        )
+        assert response.json() == {"imported": 3}
+
+        rows = list(csv.DictReader(io.StringIO(exported)))
+        data = client.get("/api/scores", params={"limit": 10}).json()["scores"]
+        assert sorted((s["player_name"], s["played_at"]) for s in data) == sorted(
+            2 * [(row["player_name"], row["played_at"]) for row in rows]
+        )
+        # Seeded rows bypass player_best; imported rows are aggregated
+        assert client.get("/api/players/P0").json()["games_played"] == 1
+
+    def test_import_rejects_bad_line(self, client: TestClient) -> None:
+        """A bad row should stop the import and report committed rows."""
+        body = b"\n".join(
+            json.dumps({"player_name": name, "score": score}).encode()
+            for name, score in [("A", 1), ("B", 2), ("C", -5)]
+        )
+        response = client.post(
+            "/api/admin/scores/import", content=body, headers=ADMIN_HEADERS
+        )
+        assert response.status_code == 400
+        assert response.json()["detail"] == ("Line 3: invalid score (2 rows imported)")
+        assert len(client.get("/api/scores").json()["scores"]) == 2
+
+    def test_import_rejects_oversized_csv_score(self, client: TestClient) -> None:
+        """A score SQLite cannot store should be a bad row, not a server error."""
+        response = client.post(
+            "/api/admin/scores/import",
+            params={"format": "csv"},
+            content=b"player_name,score\na,5\nb,99999999999999999999999\n",
+            headers=ADMIN_HEADERS,
+        )
+        assert response.status_code == 400
+        assert response.json()["detail"].endswith("invalid score (0 rows imported)")
+
+        # The rest of the failed batch must not ride along with the next commit
+        _submit_score(client, "Later", 1)
+        assert client.get("/api/players/a").status_code == 404
+        scores = client.get("/api/scores").json()["scores"]
+        assert [s["player_name"] for s in scores] == ["Later"]
+
 
 class TestRootEndpoint:
     """Tests for root endpoint."""
@@ -129,3 +398,13 @@ class TestRootEndpoint:
         response = client.get("/")
         # Either serves index.html or returns API message
         assert response.status_code == 200
+
+
+class TestHealthEndpoint:
+    """Tests for /api/health endpoint."""
+
+    def test_health_reports_database(self, client: TestClient) -> None:
+        """GET /api/health should report a healthy database."""
+        response = client.get("/api/health")
+        assert response.status_code == 200
+        assert response.json() == {"status": "ok", "database": True}
@@ -0,0 +1,148 @@
+"""Tests for the disk-cached /archives proxy."""
+
+import os
+import time
+from pathlib import Path
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+from web import ArchiveCache, ArchiveProxy
+from web.archive_proxy import CachedArchive
+
+ARCHIVES = {
+    "/archives/0.9/a.apk": b"aaaa",
+    "/archives/0.9/b.apk": b"bbbb",
+    "/archives/0.9/c.apk": b"cccc",
+    "/archives/0.9/copy-of-a.apk": b"aaaa",
+}
+
+
+class StandInCDN:
+    """Local replacement for the pygame-web CDN that counts requests."""
+
+    def __init__(self) -> None:
+        self.requests: list[str] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request.url.path)
+        body = ARCHIVES.get(request.url.path)
+        if body is None:
+            return httpx.Response(404, text="Not Found")
+        return httpx.Response(
+            200,
+            content=body,
+            headers={
+                "Content-Type": "application/octet-stream",
+                "ETag": f'"{request.url.path}"',
+                "Cache-Control": "max-age=600",
+            },
+        )
+
+
+@pytest.fixture
+def cdn(
+    client: TestClient, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> StandInCDN:
+    import main
+
+    upstream = StandInCDN()
+    monkeypatch.setattr(
+        main,
+        "archive_proxy",
+        ArchiveProxy(
+            "http://cdn.test/archives",
+            cache=ArchiveCache(tmp_path / "cache", max_bytes=10),
+            transport=httpx.MockTransport(upstream),
+        ),
+    )
+    return upstream
+
+
+class TestArchiveProxy:
+    """Tests for GET /archives/{path}."""
+
+    def test_miss_then_hit(self, client: TestClient, cdn: StandInCDN) -> None:
+        """The second request should be served from disk with the same headers."""
+        first = client.get("/archives/0.9/a.apk")
+        second = client.get("/archives/0.9/a.apk")
+        assert first.content == second.content == b"aaaa"
+        for response in (first, second):
+            assert response.headers["etag"] == '"/archives/0.9/a.apk"'
+            assert response.headers["cache-control"] == "max-age=600"
+        assert cdn.requests == ["/archives/0.9/a.apk"]
+
+    def test_if_none_match_on_hit(self, client: TestClient, cdn: StandInCDN) -> None:
+        """A cached archive should answer a matching If-None-Match with 304."""
+        etag = client.get("/archives/0.9/a.apk").headers["etag"]
+        response = client.get("/archives/0.9/a.apk", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+
+    def test_errors_are_not_cached(self, client: TestClient, cdn: StandInCDN) -> None:
+        """Upstream errors should pass through and be fetched again next time."""
+        assert client.get("/archives/missing").status_code == 404
+        assert client.get("/archives/missing").status_code == 404
+        assert len(cdn.requests) == 2
+
+    def test_lru_eviction(self, client: TestClient, cdn: StandInCDN) -> None:
+        """Going over max_bytes should evict the least recently used path."""
+        client.get("/archives/0.9/a.apk")
+        client.get("/archives/0.9/b.apk")
+        client.get("/archives/0.9/a.apk")
+        client.get("/archives/0.9/c.apk")
+        cdn.requests.clear()
+        client.get("/archives/0.9/a.apk")
+        client.get("/archives/0.9/b.apk")
+        assert cdn.requests == ["/archives/0.9/b.apk"]
+
+    def test_identical_bodies_share_a_blob(
+        self, client: TestClient, cdn: StandInCDN
+    ) -> None:
+        """Two paths with the same content should count once toward the limit."""
+        import main
+
+        client.get("/archives/0.9/a.apk")
+        client.get("/archives/0.9/copy-of-a.apk")
+        assert main.archive_proxy.cache.size == 4
+
+    def test_index_survives_restart(self, client: TestClient, cdn: StandInCDN) -> None:
+        """A new ArchiveCache on the same directory should see earlier entries."""
+        import main
+
+        client.get("/archives/0.9/a.apk")
+        reopened = ArchiveCache(main.archive_proxy.cache.root, max_bytes=10)
+        hit = reopened.get("0.9/a.apk")
+        assert hit is not None
+        assert hit[0].read_bytes() == b"aaaa"
+
+
+class TestArchiveCache:
+    """Tests for ArchiveCache's handling of in-flight downloads."""
+
+    def test_workers_keep_each_others_downloads(self, tmp_path: Path) -> None:
+        """Opening the cache in another process must not touch live downloads."""
+        first = ArchiveCache(tmp_path, max_bytes=10)
+        file, temp_path = first.open_temp()
+        file.write(b"aaaa")
+        file.close()
+
+        ArchiveCache(tmp_path, max_bytes=10)
+
+        assert temp_path.exists()
+        first.put(CachedArchive("0.9/a.apk", "ab" * 32, 4, {}), temp_path)
+        assert first.get("0.9/a.apk") is not None
+
+    def test_stale_downloads_removed(self, tmp_path: Path) -> None:
+        """Downloads abandoned by a dead process are cleared once stale."""
+        abandoned = tmp_path / "tmp" / "12345-dead"
+        abandoned.mkdir(parents=True)
+        leftover = abandoned / "partial"
+        leftover.write_bytes(b"aa")
+        stale = time.time() - ArchiveCache.STALE_DOWNLOAD_SECONDS - 60
+        os.utime(leftover, (stale, stale))
+        os.utime(abandoned, (stale, stale))
+
+        ArchiveCache(tmp_path, max_bytes=10)
+
+        assert not abandoned.exists()
@@ -0,0 +1,131 @@
+"""Tests for the pool-backed AsyncScoreRepository."""
+
+import asyncio
+import sqlite3
+import threading
+from pathlib import Path
+from unittest.mock import patch
+
+from database import ConnectionPool, DatabaseSettings, Migrator
+from database.repositories import AsyncScoreRepository, ScoreRepository
+
+
+class TestAsyncScoreRepository:
+    """Tests for AsyncScoreRepository."""
+
+    async def test_round_trip(self, test_db: ConnectionPool) -> None:
+        """Saved scores should be readable through the async facade."""
+        repository = AsyncScoreRepository(test_db)
+        try:
+            row_id = await repository.save_score("Ace", 300)
+            scores = await repository.get_top_scores(5)
+            assert [s.id for s in scores] == [row_id]
+            assert await repository.get_highest_score() == 300
+        finally:
+            repository.close()
+
+    async def test_reads_do_not_wait_on_writer(self, test_db: ConnectionPool) -> None:
+        """Reads should see the last commit while a write transaction is open."""
+        repository = AsyncScoreRepository(test_db)
+        await repository.save_score("Committed", 100)
+
+        writing = threading.Event()
+        release = threading.Event()
+
+        def hold_write_transaction() -> None:
+            with test_db.writer() as conn:
+                conn.execute(
+                    "INSERT INTO high_scores (player_name, score) VALUES ('Open', 999)"
+                )
+                writing.set()
+                release.wait(5)
+                conn.rollback()
+
+        writer = threading.Thread(target=hold_write_transaction)
+        writer.start()
+        try:
+            assert writing.wait(5)
+            scores = await repository.get_top_scores(5)
+            assert [s.player_name for s in scores] == ["Committed"]
+        finally:
+            release.set()
+            writer.join()
+            repository.close()
+
+
+class TestGroupCommit:
+    """Tests for batched score inserts."""
+
+    async def test_concurrent_saves_are_batched(self, tmp_path: Path) -> None:
+        """Concurrent saves should share commits and each get its own row ID."""
+        pool = ConnectionPool(
+            tmp_path / "batch.db",
+            DatabaseSettings(write_batch_size=8, write_batch_window=0.05),
+        )
+        with pool.writer() as conn:
+            Migrator(conn).run_migrations()
+        repository = AsyncScoreRepository(pool)
+        batches: list[int] = []
+        save_scores = ScoreRepository.save_scores
+
+        def counting_save_scores(self, entries):
+            batches.append(len(entries))
+            return save_scores(self, entries)
+
+        try:
+            with patch.object(ScoreRepository, "save_scores", counting_save_scores):
+                row_ids = await asyncio.gather(
+                    *(repository.save_score(f"P{i}", i) for i in range(20))
+                )
+            scores = await repository.get_top_scores(100)
+        finally:
+            repository.close()
+            pool.close()
+
+        assert batches == [8, 8, 4]
+        assert len(set(row_ids)) == 20
+        assert {s.id: s.score for s in scores} == dict(zip(row_ids, range(20)))
+
+    async def test_failed_batch_fails_every_caller(self, tmp_path: Path) -> None:
+        """A batch that cannot commit should raise in every waiting request."""
+        pool = ConnectionPool(
+            tmp_path / "batch.db", DatabaseSettings(write_batch_size=4)
+        )
+        repository = AsyncScoreRepository(pool)
+        try:
+            results = await asyncio.gather(
+                repository.save_score("A", 1),
+                repository.save_score("B", 2),
+                return_exceptions=True,
+            )
+        finally:
+            repository.close()
+            pool.close()
+
+        assert all(isinstance(r, sqlite3.OperationalError) for r in results)
+
+    async def test_failed_batch_commits_none_of_its_rows(self, tmp_path: Path) -> None:
+        """A row that fails outside SQLite should not leave the batch pending."""
+        pool = ConnectionPool(
+            tmp_path / "batch.db", DatabaseSettings(write_batch_size=2)
+        )
+        with pool.writer() as conn:
+            Migrator(conn).run_migrations()
+        repository = AsyncScoreRepository(pool)
+        try:
+            results = await asyncio.gather(
+                repository.save_score("A", 1),
+                repository.save_score("B", 2**70),
+                return_exceptions=True,
+            )
+            # The next batch commits on the same writer connection
+            await asyncio.gather(
+                repository.save_score("C", 3), repository.save_score("D", 4)
+            )
+            scores = await repository.get_top_scores(10)
+        finally:
+            repository.close()
+            pool.close()
+
+        assert all(isinstance(r, OverflowError) for r in results)
+        assert [s.player_name for s in scores] == ["D", "C"]
@@ -0,0 +1,144 @@
+"""Tests for the high_scores retention and compaction job."""
+
+import gzip
+import json
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+from database import CompactionSettings, Compactor, ConnectionPool
+from database.repositories import ScoreRepository
+
+
+def _compactor(pool: ConnectionPool, archive_dir: Path, **settings) -> Compactor:
+    settings.setdefault("batch_size", 3)
+    return Compactor(
+        pool, CompactionSettings(archive_dir=archive_dir, pause_seconds=0, **settings)
+    )
+
+
+class TestCompactor:
+    """Tests for Compactor."""
+
+    def test_archives_old_scores_outside_top(
+        self, test_db: ConnectionPool, tmp_path: Path
+    ) -> None:
+        """Old scores below the top N should move to the archive."""
+        with test_db.writer() as conn:
+            repository = ScoreRepository(conn)
+            added = [repository.add_score("Grinder", score) for score in range(1, 11)]
+
+        later = datetime.now(UTC) + timedelta(days=40)
+        result = _compactor(test_db, tmp_path, keep_top=3, keep_days=30).run(later)
+
+        assert result.archived == 7
+        with gzip.open(result.archive_path, "rt") as f:
+            archived = [json.loads(line) for line in f]
+        assert sorted(row["id"] for row in archived) == [s.id for s in added[:7]]
+
+        with test_db.reader() as conn:
+            repository = ScoreRepository(conn)
+            assert [s.score for s in repository.get_top_scores(10)] == [10, 9, 8]
+            windows = conn.execute("SELECT COUNT(*) FROM score_windows").fetchone()[0]
+            stats = repository.get_player_stats("Grinder")
+        assert windows == 3 * 2
+        # Aggregates keep counting archived games
+        assert (stats.games_played, stats.total_score, stats.best_score) == (10, 55, 10)
+
+    def test_recent_scores_are_kept(
+        self, test_db: ConnectionPool, tmp_path: Path
+    ) -> None:
+        """Scores inside the retention window should never be archived."""
+        with test_db.writer() as conn:
+            repository = ScoreRepository(conn)
+            for score in range(10):
+                repository.add_score("Fresh", score)
+
+        result = _compactor(test_db, tmp_path, keep_top=1, keep_days=30).run()
+
+        assert result.archived == 0
+        assert result.archive_path is None
+        with test_db.reader() as conn:
+            assert len(ScoreRepository(conn).get_top_scores(20)) == 10
+
+    def test_imported_old_scores_are_archived(
+        self, test_db: ConnectionPool, tmp_path: Path
+    ) -> None:
+        """Old rows with ids above recent ones should still be archived."""
+        with test_db.writer() as conn:
+            repository = ScoreRepository(conn)
+            for score in range(100, 105):
+                repository.add_score("Fresh", score)
+            repository.import_scores(
+                [("Restored", score, "2020-01-01 00:00:00") for score in range(5)]
+            )
+
+        result = _compactor(test_db, tmp_path, keep_top=5, keep_days=30).run()
+
+        # Every old row but the player's best, which player_best points at
+        assert result.archived == 4
+        with test_db.reader() as conn:
+            top = ScoreRepository(conn).get_top_scores(20)
+        assert [s.score for s in top if s.player_name == "Restored"] == [4]
+
+    def test_player_best_is_kept(
+        self, test_db: ConnectionPool, tmp_path: Path
+    ) -> None:
+        """A player's best should stay stored even when it is old and low."""
+        with test_db.writer() as conn:
+            repository = ScoreRepository(conn)
+            for score in range(100, 105):
+                repository.add_score("Fresh", score)
+            repository.import_scores(
+                [("Veteran", score, "2020-01-01 00:00:00") for score in (3, 9, 5)]
+            )
+
+        later = datetime.now(UTC) + timedelta(days=40)
+        _compactor(test_db, tmp_path, keep_top=2, keep_days=30).run(later)
+
+        with test_db.reader() as conn:
+            repository = ScoreRepository(conn)
+            (best,) = [
+                s for s in repository.get_top_players(10) if s.player_name == "Veteran"
+            ]
+            stored = conn.execute(
+                "SELECT score FROM high_scores WHERE id = ?", (best.id,)
+            ).fetchone()
+        assert (best.score, stored[0]) == (9, 9)
+
+    def test_delete_after_archive_keeps_archived_games(
+        self, test_db: ConnectionPool, tmp_path: Path
+    ) -> None:
+        """Deleting a stored score should not drop archived games from stats."""
+        with test_db.writer() as conn:
+            repository = ScoreRepository(conn)
+            added = [repository.add_score("Grinder", score) for score in range(1, 11)]
+
+        later = datetime.now(UTC) + timedelta(days=40)
+        _compactor(test_db, tmp_path, keep_top=3, keep_days=30).run(later)
+
+        with test_db.writer() as conn:
+            repository = ScoreRepository(conn)
+            assert repository.delete_score(added[-1].id)
+            stats = repository.get_player_stats("Grinder")
+        # Archived 1-7 still count; the best falls back to a stored score
+        assert (stats.games_played, stats.total_score, stats.best_score) == (9, 45, 9)
+        assert stats.best_score_id == added[-2].id
+
+    def test_vacuum_releases_free_pages(
+        self, test_db: ConnectionPool, tmp_path: Path
+    ) -> None:
+        """Purged pages should be returned by incremental vacuum."""
+        with test_db.writer() as conn:
+            repository = ScoreRepository(conn)
+            repository.save_scores([("x" * 200, i) for i in range(2000)])
+
+        later = datetime.now(UTC) + timedelta(days=40)
+        compactor = _compactor(
+            test_db, tmp_path, keep_top=10, vacuum_pages=16, batch_size=500
+        )
+        result = compactor.run(later)
+
+        assert result.archived == 1990
+        assert result.freed_pages > 16
+        with test_db.writer() as conn:
+            assert conn.execute("PRAGMA freelist_count").fetchone()[0] == 0
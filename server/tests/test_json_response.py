@@ -0,0 +1,40 @@
+"""Tests for the orjson response helpers."""
+
+import json
+
+from database import ConnectionPool
+from database.repositories import ScoreRepository
+from web import encode_score_rows
+
+from main import ScoreResponse, ScoresListResponse
+
+
+class TestEncodeScoreRows:
+    """Tests for encode_score_rows."""
+
+    def test_matches_pydantic_document(self, test_db: ConnectionPool) -> None:
+        """Fast encoding should produce the same document as the models."""
+        with test_db.writer() as conn:
+            repository = ScoreRepository(conn)
+            repository.save_score("Ünïcode", 10)
+            repository.save_score("Plain", 20)
+            rows = repository.get_top_score_rows(10)
+            scores = repository.get_top_scores(10)
+
+        expected = ScoresListResponse(
+            scores=[
+                ScoreResponse(
+                    id=s.id,
+                    player_name=s.player_name,
+                    score=s.score,
+                    played_at=str(s.played_at),
+                )
+                for s in scores
+            ]
+        ).model_dump()
+        assert json.loads(encode_score_rows(rows)) == expected
+
+    def test_missing_played_at_encodes_empty_string(self) -> None:
+        """Rows without a timestamp should encode played_at as ''."""
+        document = json.loads(encode_score_rows([(1, "A", 5, None)]))
+        assert document["scores"][0]["played_at"] == ""
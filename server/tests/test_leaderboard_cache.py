@@ -0,0 +1,103 @@
+"""Tests for the in-memory top-K LeaderboardCache."""
+
+import asyncio
+from unittest.mock import patch
+
+from database import ConnectionPool
+from database.repositories import AsyncScoreRepository, HighScore, LeaderboardCache
+
+
+def _score(score_id: int, score: int) -> HighScore:
+    return HighScore(id=score_id, player_name=f"P{score_id}", score=score, played_at="")
+
+
+class TestLeaderboardCache:
+    """Tests for LeaderboardCache."""
+
+    def test_cold_cache_does_not_answer(self) -> None:
+        """A cache that was never loaded should defer to the database."""
+        cache = LeaderboardCache(capacity=3)
+        cache.add(_score(1, 100))
+        assert cache.top(1) is None
+
+    def test_add_keeps_order_and_capacity(self) -> None:
+        """Inserts should keep score-desc, id-asc order and drop overflow."""
+        cache = LeaderboardCache(capacity=3)
+        cache.load([], cache.generation)
+        for score_id, score in [(1, 50), (2, 80), (3, 50), (4, 10), (5, 90)]:
+            cache.add(_score(score_id, score))
+        assert [s.id for s in cache.top(3)] == [5, 2, 1]
+        assert cache.top(4) is None
+
+    def test_add_ignores_rows_already_loaded(self) -> None:
+        """A row seen by a load and then added should appear once."""
+        cache = LeaderboardCache(capacity=3)
+        row = _score(1, 100)
+        cache.load([row], cache.generation)
+        cache.add(row)
+        assert cache.top(3) == [row]
+
+    def test_stale_load_is_rejected(self) -> None:
+        """A load that raced with a mutation should leave the cache cold."""
+        cache = LeaderboardCache(capacity=3)
+        generation = cache.generation
+        cache.add(_score(1, 100))
+        assert not cache.load([], generation)
+        assert not cache.is_warm
+
+    def test_invalidate(self) -> None:
+        """invalidate() should empty the cache until the next load."""
+        cache = LeaderboardCache(capacity=3)
+        cache.load([_score(1, 100)], cache.generation)
+        cache.invalidate()
+        assert cache.top(1) is None
+
+
+class TestCachedRepository:
+    """Tests for AsyncScoreRepository with a LeaderboardCache."""
+
+    async def test_warm_reads_skip_database(self, test_db: ConnectionPool) -> None:
+        """Once warm, top-K reads and inserts should not hit the read pool."""
+        repository = AsyncScoreRepository(test_db, cache=LeaderboardCache(10))
+        try:
+            await repository.save_score("Early", 10)
+            await repository.warm_cache()
+            await repository.save_score("Late", 20)
+            with patch.object(repository, "_run_read", side_effect=AssertionError):
+                scores = await repository.get_top_scores(5)
+            assert [s.player_name for s in scores] == ["Late", "Early"]
+        finally:
+            repository.close()
+
+    async def test_delete_invalidates(self, test_db: ConnectionPool) -> None:
+        """Deleting a score should drop it from subsequent reads."""
+        repository = AsyncScoreRepository(test_db, cache=LeaderboardCache(10))
+        try:
+            keep = await repository.save_score("Keep", 10)
+            drop = await repository.save_score("Drop", 20)
+            await repository.warm_cache()
+            assert await repository.delete_score(drop)
+            scores = await repository.get_top_scores(5)
+            assert [s.id for s in scores] == [keep]
+        finally:
+            repository.close()
+
+    async def test_concurrent_cold_reads_share_one_load(
+        self, test_db: ConnectionPool
+    ) -> None:
+        """Concurrent misses on a cold cache should trigger a single query."""
+        repository = AsyncScoreRepository(test_db, cache=LeaderboardCache(10))
+        run_read = repository._run_read
+        calls: list[str] = []
+
+        async def counting_run_read(method: str, *args: object) -> object:
+            calls.append(method)
+            return await run_read(method, *args)
+
+        try:
+            with patch.object(repository, "_run_read", counting_run_read):
+                await asyncio.gather(*(repository.get_top_scores(5) for _ in range(8)))
+        finally:
+            repository.close()
+
+        assert calls == ["get_top_scores"]
@@ -0,0 +1,110 @@
+"""Tests for queue-based logging."""
+
+import io
+import logging
+import queue
+
+from web.logs import (
+    DeferredQueueHandler,
+    SampleFilter,
+    configure_logging,
+    parse_levels,
+)
+
+
+class TestDeferredQueueHandler:
+    """Tests for DeferredQueueHandler."""
+
+    def test_message_is_not_formatted_when_enqueued(self) -> None:
+        """The logging thread should enqueue the record with its raw arguments."""
+
+        class Payload:
+            formatted = 0
+
+            def __str__(self) -> str:
+                Payload.formatted += 1
+                return "payload"
+
+        records: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        logger = logging.getLogger("tests.logs.deferred")
+        logger.propagate = False
+        logger.addHandler(DeferredQueueHandler(records))
+        logger.warning("body: %s", Payload())
+
+        record = records.get_nowait()
+        assert Payload.formatted == 0
+        assert record.msg == "body: %s"
+        assert record.getMessage() == "body: payload"
+
+    def test_exceptions_survive_the_queue(self) -> None:
+        """Tracebacks should still be formatted by the listener's handler."""
+        records: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        logger = logging.getLogger("tests.logs.exceptions")
+        logger.propagate = False
+        logger.addHandler(DeferredQueueHandler(records))
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logger.exception("failed")
+
+        stream = io.StringIO()
+        handler = logging.StreamHandler(stream)
+        handler.handle(records.get_nowait())
+        assert "ValueError: boom" in stream.getvalue()
+
+
+class TestSampleFilter:
+    """Tests for SampleFilter."""
+
+    def test_keeps_one_in_n_below_warning(self) -> None:
+        """INFO records should be sampled, warnings always kept."""
+        sample = SampleFilter(every=10)
+        info = logging.makeLogRecord({"levelno": logging.INFO})
+        warning = logging.makeLogRecord({"levelno": logging.WARNING})
+        assert sum(sample.filter(info) for _ in range(100)) == 10
+        assert all(sample.filter(warning) for _ in range(5))
+
+
+class TestParseLevels:
+    """Tests for parse_levels."""
+
+    def test_parse_levels(self) -> None:
+        """Level specs should parse into a name -> level mapping."""
+        assert parse_levels(" main.requests=warning, database=DEBUG,,bad") == {
+            "main.requests": "WARNING",
+            "database": "DEBUG",
+        }
+        assert parse_levels("") == {}
+
+
+class TestConfigureLogging:
+    """Tests for configure_logging."""
+
+    def test_repeated_calls_keep_one_handler(self) -> None:
+        """Configuring again should replace the queue handler and listener."""
+        root = logging.getLogger()
+        level = root.level
+        adopted = logging.getLogger("tests.logs.adopted")
+        adopted.addHandler(logging.StreamHandler(io.StringIO()))
+        adopted.propagate = False
+        stream = io.StringIO()
+        try:
+            first = configure_logging("INFO", stream=io.StringIO())
+            second = configure_logging(
+                "INFO", stream=stream, adopt=("tests.logs.adopted",)
+            )
+            queue_handlers = [
+                h for h in root.handlers if isinstance(h, DeferredQueueHandler)
+            ]
+            assert len(queue_handlers) == 1
+            assert first._thread is None
+            assert adopted.handlers == [] and adopted.propagate
+
+            adopted.warning("adopted record")
+            second.stop()
+            assert "tests.logs.adopted: adopted record" in stream.getvalue()
+        finally:
+            for handler in root.handlers[:]:
+                if isinstance(handler, DeferredQueueHandler):
+                    root.removeHandler(handler)
+            root.setLevel(level)
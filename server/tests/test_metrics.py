@@ -0,0 +1,115 @@
+"""Tests for the Prometheus metrics endpoint."""
+
+import threading
+
+import pytest
+from fastapi.testclient import TestClient
+from web.metrics import Histogram, MetricsRegistry
+
+
+class TestHistogram:
+    """Tests for the thread-sharded Histogram."""
+
+    def test_cumulative_buckets(self) -> None:
+        """Snapshots should be cumulative with a trailing +Inf bucket."""
+        histogram = Histogram((0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 5.0):
+            histogram.observe(value)
+        assert histogram.snapshot() == ([2, 3, 4], 5.65)
+
+    def test_threads_record_into_separate_shards(self) -> None:
+        """Observations from several threads should all be counted."""
+        histogram = Histogram((1.0,))
+
+        def record() -> None:
+            for _ in range(1000):
+                histogram.observe(0.5)
+
+        threads = [threading.Thread(target=record) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert histogram.snapshot()[0] == [4000, 4000]
+
+    def test_render(self) -> None:
+        """Families should render in the Prometheus text format."""
+        registry = MetricsRegistry()
+        family = registry.histogram("demo_seconds", "Demo.", ("route",), (0.5,))
+        family.labels('/a"b').observe(0.25)
+        registry.callback("demo_items", "Items.", "gauge", lambda: [({}, 3)])
+        assert registry.render().decode().splitlines() == [
+            "# HELP demo_seconds Demo.",
+            "# TYPE demo_seconds histogram",
+            'demo_seconds_bucket{route="/a\\"b",le="0.5"} 1',
+            'demo_seconds_bucket{route="/a\\"b",le="+Inf"} 1',
+            'demo_seconds_sum{route="/a\\"b"} 0.25',
+            'demo_seconds_count{route="/a\\"b"} 1',
+            "# HELP demo_items Items.",
+            "# TYPE demo_items gauge",
+            "demo_items 3",
+        ]
+
+
+def _samples(client: TestClient) -> dict[str, float]:
+    response = client.get("/metrics")
+    assert response.headers["content-type"].startswith("text/plain")
+    return {
+        name: float(value)
+        for name, _, value in (
+            line.rpartition(" ")
+            for line in response.text.splitlines()
+            if not line.startswith("#")
+        )
+    }
+
+
+class TestMetricsEndpoint:
+    """Tests for GET /metrics."""
+
+    def test_reports_requests_tokens_and_caches(
+        self, client: TestClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Requests, SQLite calls, tokens and cache lookups should be exposed."""
+        import main
+
+        monkeypatch.setattr(
+            main.score_repository, "observe_query", main.observe_sqlite_query
+        )
+        before = _samples(client)
+        client.post("/api/tokens")
+        client.get("/api/scores", params={"limit": 10})
+        client.get("/api/scores", params={"limit": 10})
+        client.get("/api/players/Nobody")
+        after = _samples(client)
+
+        def delta(name: str) -> float:
+            return after[name] - before.get(name, 0)
+
+        assert (
+            delta(
+                "asteroids_http_request_duration_seconds_count"
+                '{route="/api/scores",method="GET",status="200"}'
+            )
+            == 2
+        )
+        assert (
+            delta(
+                "asteroids_http_request_duration_seconds_count"
+                '{route="/api/players/{player_name}",method="GET",status="404"}'
+            )
+            == 1
+        )
+        assert (
+            delta(
+                'asteroids_sqlite_query_duration_seconds_count{method="get_player_stats"}'
+            )
+            == 1
+        )
+        assert after["asteroids_tokens"] == 1
+        assert (
+            delta(
+                'asteroids_cache_lookups_total{cache="leaderboard_response",result="hit"}'
+            )
+            == 1
+        )
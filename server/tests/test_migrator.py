@@ -0,0 +1,171 @@
+"""Tests for the schema Migrator."""
+
+import os
+import sqlite3
+from collections.abc import Generator
+from pathlib import Path
+
+import pytest
+from database import Migrator
+from database.migrator import directory_fingerprint, load_migrations
+
+
+def _write_migrations(directory: Path, files: dict[str, str]) -> Path:
+    directory.mkdir()
+    for name, sql in files.items():
+        (directory / name).write_text(sql)
+    return directory
+
+
+@pytest.fixture
+def connection() -> Generator[sqlite3.Connection, None, None]:
+    conn = sqlite3.connect(":memory:")
+    yield conn
+    conn.close()
+
+
+class TestMigrator:
+    """Tests for Migrator."""
+
+    def test_applies_pending_and_records_checksums(
+        self,
+        connection: sqlite3.Connection,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Migrations should run in order, with checksums and fingerprint stored."""
+        directory = _write_migrations(
+            tmp_path / "migrations",
+            {
+                "V2__b.sql": "INSERT INTO t VALUES (2);",
+                "V1__a.sql": "CREATE TABLE t (x INTEGER);",
+            },
+        )
+        monkeypatch.setattr(Migrator, "MIGRATIONS_DIR", directory)
+        Migrator(connection).run_migrations()
+
+        migrations = load_migrations(directory)
+        rows = connection.execute(
+            "SELECT version, description, checksum FROM schema_version ORDER BY version"
+        ).fetchall()
+        assert rows == [(m.version, m.description, m.checksum) for m in migrations]
+        assert connection.execute("SELECT x FROM t").fetchall() == [(2,)]
+        assert connection.execute("PRAGMA user_version").fetchone()[0] == (
+            directory_fingerprint(directory)
+        )
+
+    def test_matching_fingerprint_skips_schema_version(
+        self,
+        connection: sqlite3.Connection,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """An up-to-date database should not be queried beyond user_version.
+
+        Nor should the migration files be read.
+        """
+        directory = _write_migrations(
+            tmp_path / "migrations", {"V1__a.sql": "CREATE TABLE t (x INTEGER);"}
+        )
+        monkeypatch.setattr(Migrator, "MIGRATIONS_DIR", directory)
+        Migrator(connection).run_migrations()
+
+        def fail(directory: Path) -> None:
+            raise AssertionError("migrations were read")
+
+        monkeypatch.setattr("database.migrator.load_migrations", fail)
+        statements: list[str] = []
+        connection.set_trace_callback(statements.append)
+        Migrator(connection).run_migrations()
+        assert statements == ["PRAGMA user_version"]
+
+    def test_failed_migration_rolls_back_all_pending(
+        self,
+        connection: sqlite3.Connection,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Pending migrations should apply together or not at all."""
+        directory = _write_migrations(
+            tmp_path / "migrations",
+            {
+                "V1__a.sql": "CREATE TABLE t (x INTEGER);",
+                "V2__b.sql": "INSERT INTO missing VALUES (1);",
+            },
+        )
+        monkeypatch.setattr(Migrator, "MIGRATIONS_DIR", directory)
+        with pytest.raises(sqlite3.OperationalError):
+            Migrator(connection).run_migrations()
+
+        tables = connection.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table'"
+        ).fetchall()
+        assert tables == []
+        assert connection.execute("PRAGMA user_version").fetchone()[0] == 0
+
+    def test_legacy_schema_version_is_upgraded(
+        self,
+        connection: sqlite3.Connection,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Versions applied before checksums existed should get them backfilled."""
+        connection.executescript("""
+            CREATE TABLE schema_version (
+                version TEXT PRIMARY KEY,
+                applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                description TEXT
+            );
+            CREATE TABLE t (x INTEGER);
+            INSERT INTO schema_version (version, description) VALUES ('V1', 'a');
+        """)
+        directory = _write_migrations(
+            tmp_path / "migrations", {"V1__a.sql": "CREATE TABLE t (x INTEGER);"}
+        )
+        monkeypatch.setattr(Migrator, "MIGRATIONS_DIR", directory)
+        Migrator(connection).run_migrations()
+
+        (migration,) = load_migrations(directory)
+        assert connection.execute("SELECT checksum FROM schema_version").fetchall() == [
+            (migration.checksum,)
+        ]
+
+    def test_modified_migration_is_rejected(
+        self,
+        connection: sqlite3.Connection,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Editing an applied migration should fail loudly."""
+        original = _write_migrations(
+            tmp_path / "original", {"V1__a.sql": "CREATE TABLE t (x INTEGER);"}
+        )
+        edited = _write_migrations(
+            tmp_path / "edited", {"V1__a.sql": "CREATE TABLE t (y INTEGER);"}
+        )
+        monkeypatch.setattr(Migrator, "MIGRATIONS_DIR", original)
+        Migrator(connection).run_migrations()
+
+        monkeypatch.setattr(Migrator, "MIGRATIONS_DIR", edited)
+        with pytest.raises(RuntimeError, match="V1 was modified"):
+            Migrator(connection).run_migrations()
+
+    def test_migration_edited_in_place_is_rejected(
+        self,
+        connection: sqlite3.Connection,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """An edit in place should take the full path despite the fast check."""
+        directory = _write_migrations(
+            tmp_path / "migrations", {"V1__a.sql": "CREATE TABLE t (x INTEGER);"}
+        )
+        monkeypatch.setattr(Migrator, "MIGRATIONS_DIR", directory)
+        Migrator(connection).run_migrations()
+
+        path = directory / "V1__a.sql"
+        mtime_ns = path.stat().st_mtime_ns
+        path.write_text("CREATE TABLE t (y INTEGER);")
+        os.utime(path, ns=(mtime_ns + 10**9, mtime_ns + 10**9))
+        with pytest.raises(RuntimeError, match="V1 was modified"):
+            Migrator(connection).run_migrations()
@@ -0,0 +1,37 @@
+"""Tests for the SQLite ConnectionPool."""
+
+import sqlite3
+
+import pytest
+from database import ConnectionPool
+
+
+class TestConnectionPool:
+    """Tests for ConnectionPool."""
+
+    def test_writer_uses_wal(self, test_db: ConnectionPool) -> None:
+        """The writer should switch the database into WAL mode."""
+        with test_db.writer() as conn:
+            mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        assert mode == "wal"
+
+    def test_readers_are_read_only(self, test_db: ConnectionPool) -> None:
+        """Pooled readers should reject writes."""
+        with test_db.reader() as conn, pytest.raises(sqlite3.OperationalError):
+            conn.execute("INSERT INTO high_scores (player_name, score) VALUES ('x', 1)")
+
+    def test_readers_are_reused(self, test_db: ConnectionPool) -> None:
+        """Released readers should go back to the pool."""
+        with test_db.reader() as first:
+            pass
+        with test_db.reader() as second:
+            pass
+        assert first is second
+
+    def test_health_check_and_checkpoint(self, test_db: ConnectionPool) -> None:
+        """Health check and checkpoint should succeed on a live pool."""
+        with test_db.reader():
+            pass
+        assert test_db.health_check()
+        busy, _, _ = test_db.checkpoint()
+        assert busy == 0
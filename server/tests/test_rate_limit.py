@@ -0,0 +1,89 @@
+"""Tests for token-bucket rate limiting."""
+
+import pytest
+from fastapi.testclient import TestClient
+from web.rate_limit import TokenBucketLimiter
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTokenBucketLimiter:
+    """Tests for TokenBucketLimiter."""
+
+    def test_burst_then_refill(self) -> None:
+        """A client gets ``burst`` requests, then one per 1/rate seconds."""
+        clock = FakeClock()
+        limiter = TokenBucketLimiter(rate=2.0, burst=3, clock=clock)
+        assert [limiter.acquire("a") for _ in range(3)] == [0.0, 0.0, 0.0]
+        assert limiter.acquire("a") == pytest.approx(0.5)
+        clock.now = 0.5
+        assert limiter.acquire("a") == 0.0
+        assert limiter.acquire("a") > 0
+        assert limiter.rejected == 2
+
+    def test_clients_are_independent(self) -> None:
+        """Exhausting one client's bucket should not affect another."""
+        limiter = TokenBucketLimiter(rate=1.0, burst=1, clock=FakeClock())
+        assert limiter.acquire("a") == 0.0
+        assert limiter.acquire("a") > 0
+        assert limiter.acquire("b") == 0.0
+
+    def test_idle_buckets_are_evicted(self) -> None:
+        """Buckets that have had time to refill completely are dropped."""
+        clock = FakeClock()
+        limiter = TokenBucketLimiter(rate=1.0, burst=5, clock=clock)
+        limiter.acquire("a")
+        clock.now = 3.0
+        limiter.acquire("b")
+        assert len(limiter) == 2
+        clock.now = 6.0
+        limiter.acquire("c")
+        assert len(limiter) == 2  # "a" idle for 6s > 5s to refill
+
+    def test_max_clients(self) -> None:
+        """Past max_clients the least recently seen client is forgotten."""
+        limiter = TokenBucketLimiter(
+            rate=1.0, burst=1, max_clients=2, clock=FakeClock()
+        )
+        for client in ("a", "b", "a", "c"):
+            limiter.acquire(client)
+        assert len(limiter) == 2
+        assert limiter.acquire("a") > 0  # still tracked, still empty
+        assert limiter.acquire("b") == 0.0  # forgotten, so a fresh bucket
+
+
+class TestRateLimitMiddleware:
+    """Tests for rate limiting on the submission endpoints."""
+
+    @pytest.fixture(autouse=True)
+    def small_limit(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        import main
+
+        monkeypatch.setitem(
+            main.rate_limiters,
+            ("POST", "/api/tokens"),
+            TokenBucketLimiter(rate=0.01, burst=2),
+        )
+
+    def test_token_minting_is_limited(self, client: TestClient) -> None:
+        """Requests beyond the burst should get a 429 with Retry-After."""
+        import main
+
+        assert client.post("/api/tokens").status_code == 200
+        assert client.post("/api/tokens").status_code == 200
+        response = client.post("/api/tokens")
+        assert response.status_code == 429
+        assert response.json() == {"detail": "Too many requests"}
+        assert int(response.headers["retry-after"]) == 100
+        assert len(main.tokens) == 2
+
+    def test_other_endpoints_are_not_limited(self, client: TestClient) -> None:
+        """Only the configured method and path should be limited."""
+        for _ in range(5):
+            assert client.get("/api/scores").status_code == 200
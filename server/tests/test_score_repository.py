@@ -0,0 +1,66 @@
+"""Tests for ScoreRepository queries."""
+
+from datetime import date
+
+from database import ConnectionPool
+from database.repositories import ScoreRepository, window_period_start
+
+
+class TestKeysetQueries:
+    """Tests for the (score, id) keyset queries."""
+
+    def test_page_seek_uses_composite_index(self, test_db: ConnectionPool) -> None:
+        """Keyset pages should seek the composite index without a sort step."""
+        with test_db.reader() as conn:
+            plan = conn.execute(
+                "EXPLAIN QUERY PLAN "
+                "SELECT id, player_name, score, played_at FROM high_scores "
+                "WHERE score <= ? AND (score < ? OR id > ?) "
+                "ORDER BY score DESC, id ASC LIMIT ?",
+                (100, 100, 5, 10),
+            ).fetchall()
+        details = " ".join(row["detail"] for row in plan)
+        assert "idx_high_scores_score_id" in details
+        assert "TEMP B-TREE" not in details
+
+
+class TestScoreWindows:
+    """Tests for the score_windows rollup."""
+
+    def test_weekly_period_starts_on_monday(self) -> None:
+        """Weekly windows should start on the Monday of the ISO week."""
+        assert window_period_start("weekly", date(2026, 10, 25)) == "2026-10-19"
+        assert window_period_start("weekly", date(2026, 10, 19)) == "2026-10-19"
+        assert window_period_start("daily", date(2026, 10, 25)) == "2026-10-25"
+
+    def test_delete_removes_window_rows(self, test_db: ConnectionPool) -> None:
+        """Deleting a score should drop it from every window."""
+        with test_db.writer() as conn:
+            repository = ScoreRepository(conn)
+            high_score = repository.add_score("Gone", 50)
+            assert repository.delete_score(high_score.id)
+            remaining = conn.execute("SELECT COUNT(*) FROM score_windows").fetchone()
+        assert remaining[0] == 0
+
+
+class TestPlayerBest:
+    """Tests for the player_best aggregates."""
+
+    def test_delete_best_recomputes_player(self, test_db: ConnectionPool) -> None:
+        """Deleting a player's best should fall back to their next best."""
+        with test_db.writer() as conn:
+            repository = ScoreRepository(conn)
+            repository.add_score("Solo", 10)
+            best = repository.add_score("Solo", 30)
+            repository.add_score("Solo", 20)
+            repository.delete_score(best.id)
+            stats = repository.get_player_stats("Solo")
+        assert (stats.best_score, stats.games_played, stats.total_score) == (20, 2, 30)
+
+    def test_delete_last_score_removes_player(self, test_db: ConnectionPool) -> None:
+        """A player with no remaining scores should disappear."""
+        with test_db.writer() as conn:
+            repository = ScoreRepository(conn)
+            only = repository.add_score("Once", 10)
+            repository.delete_score(only.id)
+            assert repository.get_player_stats("Once") is None
@@ -0,0 +1,165 @@
+"""Tests for the indexed static bundle."""
+
+import gzip
+import os
+import threading
+import time
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+from web import StaticSite, build_manifest, rewrite_references, static_files
+
+INDEX_HTML = b"<html>" + b"asteroids " * 200 + b"</html>"
+
+
+@pytest.fixture
+def bundle(client: TestClient, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    import main
+
+    (tmp_path / "index.html").write_bytes(INDEX_HTML)
+    (tmp_path / "index.html.gz").write_bytes(gzip.compress(INDEX_HTML))
+    (tmp_path / "app.apk").write_bytes(bytes(range(256)) * 4)
+    site = StaticSite(tmp_path, check_interval=0)
+    site.reload()
+    monkeypatch.setattr(main, "static_site", site)
+    return tmp_path
+
+
+class TestStaticSite:
+    """Tests for StaticSite via the root routes."""
+
+    def test_gzip_variant(self, client: TestClient, bundle: Path) -> None:
+        """Clients accepting gzip should get the precompressed file."""
+        response = client.get("/", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["content-encoding"] == "gzip"
+        assert "Accept-Encoding" in response.headers["vary"]
+        assert response.headers["content-type"].startswith("text/html")
+        assert response.content == INDEX_HTML
+
+    def test_identity_when_not_accepted(self, client: TestClient, bundle: Path) -> None:
+        """gzip;q=0 should fall back to the uncompressed file."""
+        response = client.get(
+            "/index.html", headers={"Accept-Encoding": "gzip;q=0, identity"}
+        )
+        assert "content-encoding" not in response.headers
+        assert response.content == INDEX_HTML
+
+    def test_etag_revalidation(self, client: TestClient, bundle: Path) -> None:
+        """A matching If-None-Match should get an empty 304."""
+        etag = client.get("/app.apk").headers["etag"]
+        response = client.get("/app.apk", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+
+    def test_range(self, client: TestClient, bundle: Path) -> None:
+        """Range requests should return the requested bytes of the file."""
+        response = client.get(
+            "/index.html",
+            headers={"Range": "bytes=0-5", "Accept-Encoding": "gzip"},
+        )
+        assert response.status_code == 206
+        assert response.content == b"<html>"
+
+    def test_missing_file(self, client: TestClient, bundle: Path) -> None:
+        """Files outside the index should 404."""
+        assert client.get("/nope.js").status_code == 404
+
+    def test_redeploy_is_picked_up(self, client: TestClient, bundle: Path) -> None:
+        """Replacing the bundle should re-index on the next request."""
+        (bundle / "new.js").write_bytes(b"console.log(1)")
+        stat = bundle.stat()
+        os.utime(bundle, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        # The rebuild runs in the background; poll until it has landed
+        deadline = time.monotonic() + 5
+        while (response := client.get("/new.js")).status_code == 404:
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+        assert response.content == b"console.log(1)"
+
+    def test_old_index_served_during_rebuild(
+        self, client: TestClient, bundle: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Requests should not wait for a rebuild in progress."""
+        release = threading.Event()
+
+        def slow_index(root: Path) -> dict:
+            release.wait(5)
+            return index(root)
+
+        index = static_files._index
+        monkeypatch.setattr(static_files, "_index", slow_index)
+        (bundle / "new.js").write_bytes(b"console.log(1)")
+        stat = bundle.stat()
+        os.utime(bundle, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        try:
+            assert client.get("/new.js").status_code == 404
+            assert client.get("/app.apk").status_code == 200
+        finally:
+            release.set()
+
+
+PYGBAG_INDEX = """<html><head>
+<link rel="icon" type="image/png" href="favicon.png" sizes="16x16">
+<link rel="preload" href="./app.apk">
+<script>config = { archive : "app", cdn : "https://cdn/archives/0.9/" }</script>
+</head><body><img src='./img/favicon.png'><p>myapp.apk</p></body></html>"""
+
+
+class TestAssetManifest:
+    """Tests for content-hashed asset names."""
+
+    @pytest.fixture
+    def hashed_bundle(
+        self, client: TestClient, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> dict[str, str]:
+        import main
+
+        (tmp_path / "index.html").write_text(PYGBAG_INDEX)
+        (tmp_path / "app.apk").write_bytes(b"apk-v1")
+        (tmp_path / "favicon.png").write_bytes(b"png")
+        manifest = build_manifest(tmp_path)
+        site = StaticSite(tmp_path)
+        site.reload()
+        monkeypatch.setattr(main, "static_site", site)
+        return manifest
+
+    def test_build_manifest(self, tmp_path: Path) -> None:
+        """Assets get hashed copies; pages and re-runs are left alone."""
+        (tmp_path / "index.html").write_text("<html></html>")
+        (tmp_path / "app.apk").write_bytes(b"apk-v1")
+        manifest = build_manifest(tmp_path)
+        assert list(manifest) == ["app.apk"]
+        assert manifest["app.apk"].startswith("app.")
+        assert (tmp_path / manifest["app.apk"]).read_bytes() == b"apk-v1"
+        assert build_manifest(tmp_path) == manifest
+
+    def test_rewrite_references(self) -> None:
+        """Whole references and pygbag's archive name should be rewritten."""
+        manifest = {"app.apk": "app.abc.apk", "favicon.png": "favicon.def.png"}
+        html = rewrite_references(PYGBAG_INDEX, manifest)
+        assert 'href="favicon.def.png"' in html
+        assert 'archive : "app.abc"' in html
+        assert 'href="./app.abc.apk"' in html
+        assert "myapp.apk" in html
+        assert "'./img/favicon.png'" in html
+
+    def test_index_is_served_rewritten(
+        self, client: TestClient, hashed_bundle: dict[str, str]
+    ) -> None:
+        """GET / should reference hashed names and still revalidate."""
+        response = client.get("/", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["cache-control"] == "no-cache"
+        assert hashed_bundle["favicon.png"] in response.text
+        etag = response.headers["etag"]
+        assert client.get("/", headers={"If-None-Match": etag}).status_code == 304
+
+    def test_hashed_assets_are_immutable(
+        self, client: TestClient, hashed_bundle: dict[str, str]
+    ) -> None:
+        """Hashed names cache for a year; logical names keep revalidating."""
+        hashed = client.get(f"/{hashed_bundle['app.apk']}")
+        assert hashed.content == b"apk-v1"
+        assert hashed.headers["cache-control"] == "public, max-age=31536000, immutable"
+        assert client.get("/app.apk").headers["cache-control"] == "no-cache"
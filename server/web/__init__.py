@@ -0,0 +1,25 @@
+from .archive_proxy import ArchiveCache as ArchiveCache
+from .archive_proxy import ArchiveProxy as ArchiveProxy
+from .asset_manifest import build_manifest as build_manifest
+from .asset_manifest import rewrite_references as rewrite_references
+from .json_response import FastJSONResponse as FastJSONResponse
+from .json_response import encode_high_scores as encode_high_scores
+from .json_response import encode_score_rows as encode_score_rows
+from .leaderboard_responses import LeaderboardResponseCache as LeaderboardResponseCache
+from .leaderboard_responses import etag_matches as etag_matches
+from .logs import SampleFilter as SampleFilter
+from .logs import configure_logging as configure_logging
+from .logs import parse_levels as parse_levels
+from .metrics import METRICS_CONTENT_TYPE as METRICS_CONTENT_TYPE
+from .metrics import MetricsRegistry as MetricsRegistry
+from .metrics import RequestMetricsMiddleware as RequestMetricsMiddleware
+from .pagination import MAX_SQLITE_INTEGER as MAX_SQLITE_INTEGER
+from .pagination import decode_cursor as decode_cursor
+from .pagination import encode_cursor as encode_cursor
+from .rate_limit import RateLimitMiddleware as RateLimitMiddleware
+from .rate_limit import TokenBucketLimiter as TokenBucketLimiter
+from .score_transfer import EXPORT_MEDIA_TYPES as EXPORT_MEDIA_TYPES
+from .score_transfer import ImportRowError as ImportRowError
+from .score_transfer import iter_export as iter_export
+from .score_transfer import iter_import_rows as iter_import_rows
+from .static_files import StaticSite as StaticSite
@@ -0,0 +1,299 @@
+"""Streaming, disk-cached proxy for the pygame-web /archives CDN.
+
+Misses are streamed to the browser as they arrive from upstream and written
+to a temporary file at the same time; once complete, the body is stored
+under its SHA-256 digest so identical archives behind different paths share
+one blob. The cache is bounded by total blob size and evicts the least
+recently used paths. Archive paths are versioned upstream, so cached
+entries are served until evicted rather than revalidated.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import Counter, OrderedDict
+from collections.abc import AsyncIterator
+from contextlib import suppress
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import BinaryIO
+
+import httpx
+from fastapi.responses import FileResponse, Response, StreamingResponse
+
+from .leaderboard_responses import etag_matches
+
+# Upstream headers replayed to the browser, on misses and cached hits alike
+PASSTHROUGH_HEADERS = (
+    "content-type",
+    "cache-control",
+    "etag",
+    "last-modified",
+    "content-length",
+)
+
+
+@dataclass
+class CachedArchive:
+    path: str
+    digest: str
+    size: int
+    headers: dict[str, str]
+
+
+class ArchiveCache:
+    """Content-addressed blob store with an LRU index bounded by ``max_bytes``.
+
+    Layout under ``root``: ``blobs/<aa>/<digest>`` holds bodies, ``index/``
+    one JSON file per cached path (its mtime records recency across
+    restarts), and ``tmp/`` in-flight downloads. Each process downloads into
+    its own directory under ``tmp/``, so workers sharing the cache never
+    remove each other's files; leftovers are only cleared once stale.
+    """
+
+    # Downloads untouched for this long were abandoned by a process that died
+    STALE_DOWNLOAD_SECONDS = 24 * 3600.0
+
+    def __init__(self, root: Path, max_bytes: int) -> None:
+        self.root = root
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, CachedArchive] = OrderedDict()
+        self._refs: Counter[str] = Counter()
+        self._lock = threading.Lock()
+        for directory in ("blobs", "index", "tmp"):
+            (root / directory).mkdir(parents=True, exist_ok=True)
+        self._temp_dir = Path(
+            tempfile.mkdtemp(prefix=f"{os.getpid()}-", dir=root / "tmp")
+        )
+        self._load()
+
+    def _blob_path(self, digest: str) -> Path:
+        return self.root / "blobs" / digest[:2] / digest
+
+    def _index_path(self, path: str) -> Path:
+        return self.root / "index" / f"{hashlib.sha256(path.encode()).hexdigest()}.json"
+
+    def _load(self) -> None:
+        self._remove_stale_downloads()
+        index_files = sorted(
+            (self.root / "index").glob("*.json"), key=lambda p: p.stat().st_mtime
+        )
+        for index_file in index_files:
+            try:
+                entry = CachedArchive(**json.loads(index_file.read_text()))
+            except (OSError, ValueError, TypeError):
+                index_file.unlink(missing_ok=True)
+                continue
+            if not self._blob_path(entry.digest).exists():
+                index_file.unlink(missing_ok=True)
+                continue
+            self._add(entry)
+        self._evict()
+
+    def _remove_stale_downloads(self) -> None:
+        cutoff = time.time() - self.STALE_DOWNLOAD_SECONDS
+        for entry in (self.root / "tmp").iterdir():
+            if entry == self._temp_dir:
+                continue
+            # Judged before clearing it, which bumps the directory's mtime
+            stale = entry.stat().st_mtime < cutoff
+            leftovers = list(entry.iterdir()) if entry.is_dir() else [entry]
+            for leftover in leftovers:
+                with suppress(OSError):
+                    if leftover.stat().st_mtime < cutoff:
+                        leftover.unlink()
+            if stale and entry.is_dir():
+                with suppress(OSError):
+                    entry.rmdir()
+
+    def close(self) -> None:
+        """Remove this process's download directory if it is empty."""
+        with suppress(OSError):
+            self._temp_dir.rmdir()
+
+    def get(self, path: str) -> tuple[Path, CachedArchive] | None:
+        """Return the blob path and entry for ``path``, marking it recently used."""
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._entries.move_to_end(path)
+        try:
+            os.utime(self._index_path(path))
+        except OSError:
+            pass
+        return self._blob_path(entry.digest), entry
+
+    def open_temp(self) -> tuple[BinaryIO, Path]:
+        """Open a file for an in-flight download. Returns (file, path)."""
+        # Recreated in case it was removed as stale while this process idled
+        self._temp_dir.mkdir(exist_ok=True)
+        fd, name = tempfile.mkstemp(dir=self._temp_dir)
+        return os.fdopen(fd, "wb"), Path(name)
+
+    def put(self, entry: CachedArchive, temp_path: Path) -> None:
+        """Move a completed download into the store and index it under its path."""
+        if entry.size > self.max_bytes:
+            temp_path.unlink(missing_ok=True)
+            return
+        blob = self._blob_path(entry.digest)
+        blob.parent.mkdir(exist_ok=True)
+        with self._lock:
+            if blob.exists():
+                temp_path.unlink(missing_ok=True)
+            else:
+                os.replace(temp_path, blob)
+            self._index_path(entry.path).write_text(json.dumps(asdict(entry)))
+            previous = self._entries.pop(entry.path, None)
+            # Add before releasing so a re-put of the same blob keeps it
+            self._add(entry)
+            if previous is not None:
+                self._release(previous)
+            self._evict()
+
+    def _add(self, entry: CachedArchive) -> None:
+        if self._refs[entry.digest] == 0:
+            self.size += entry.size
+        self._refs[entry.digest] += 1
+        self._entries[entry.path] = entry
+
+    def _release(self, entry: CachedArchive) -> None:
+        self._refs[entry.digest] -= 1
+        if self._refs[entry.digest] == 0:
+            del self._refs[entry.digest]
+            self.size -= entry.size
+            self._blob_path(entry.digest).unlink(missing_ok=True)
+
+    def _evict(self) -> None:
+        while self.size > self.max_bytes and self._entries:
+            _, entry = self._entries.popitem(last=False)
+            self._index_path(entry.path).unlink(missing_ok=True)
+            self._release(entry)
+
+
+class ArchiveProxy:
+    """Proxies ``/archives`` paths to ``upstream`` through one pooled client.
+
+    Pass ``transport`` to point the client at a stand-in upstream in tests.
+    The client is created on first use and closed by ``aclose()``.
+    """
+
+    CHUNK_SIZE = 64 * 1024
+
+    def __init__(
+        self,
+        upstream: str,
+        cache: ArchiveCache | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+        timeout: float = 30.0,
+    ) -> None:
+        self.upstream = upstream.rstrip("/")
+        self.cache = cache
+        self._transport = transport
+        self._timeout = timeout
+        self._client: httpx.AsyncClient | None = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                transport=self._transport,
+                timeout=self._timeout,
+                follow_redirects=True,
+                # Keep bodies byte-for-byte so Content-Length and the cache agree
+                headers={"Accept-Encoding": "identity"},
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=8),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def get(self, path: str, if_none_match: str | None = None) -> Response:
+        """Serve ``path`` from the cache or stream it from upstream.
+
+        Raises httpx.RequestError if upstream cannot be reached.
+        """
+        if self.cache is not None and (hit := self.cache.get(path)) is not None:
+            blob, entry = hit
+            etag = entry.headers.get("etag")
+            if etag and etag_matches(if_none_match, etag):
+                return Response(status_code=304, headers=_revalidation(entry.headers))
+            # FileResponse sets Content-Length itself and answers Range requests
+            headers = {k: v for k, v in entry.headers.items() if k != "content-length"}
+            return FileResponse(
+                blob, headers=headers, media_type=headers.get("content-type")
+            )
+
+        request = self.client.build_request("GET", f"{self.upstream}/{path}")
+        upstream = await self.client.send(request, stream=True)
+        headers = {
+            name: upstream.headers[name]
+            for name in PASSTHROUGH_HEADERS
+            if name in upstream.headers
+        }
+        if "content-encoding" in upstream.headers:
+            # Upstream ignored identity; bodies are decoded, so the length differs
+            headers.pop("content-length", None)
+        if upstream.status_code != 200:
+            # Errors and redirects are small and not worth caching
+            content = await upstream.aread()
+            await upstream.aclose()
+            headers.pop("content-length", None)
+            return Response(
+                content=content, status_code=upstream.status_code, headers=headers
+            )
+        return StreamingResponse(
+            self._stream(path, upstream, headers),
+            headers=headers,
+            media_type=headers.get("content-type"),
+        )
+
+    async def _stream(
+        self, path: str, upstream: httpx.Response, headers: dict[str, str]
+    ) -> AsyncIterator[bytes]:
+        """Relay upstream chunks, teeing them into the cache when complete."""
+        digest = hashlib.sha256()
+        size = 0
+        file: BinaryIO | None = None
+        temp_path: Path | None = None
+        try:
+            if self.cache is not None:
+                file, temp_path = await asyncio.to_thread(self.cache.open_temp)
+            async for chunk in upstream.aiter_bytes(self.CHUNK_SIZE):
+                if file is not None:
+                    await asyncio.to_thread(file.write, chunk)
+                digest.update(chunk)
+                size += len(chunk)
+                yield chunk
+            if file is not None:
+                file.close()
+                entry = CachedArchive(path, digest.hexdigest(), size, headers)
+                await asyncio.to_thread(self.cache.put, entry, temp_path)
+                temp_path = None
+        finally:
+            await upstream.aclose()
+            if file is not None:
+                file.close()
+            if temp_path is not None:
+                # Client went away or upstream failed mid-body: drop the partial file
+                temp_path.unlink(missing_ok=True)
+
+
+def _revalidation(headers: dict[str, str]) -> dict[str, str]:
+    return {
+        name: value
+        for name, value in headers.items()
+        if name in ("etag", "cache-control", "last-modified")
+    }
@@ -0,0 +1,93 @@
+"""Content-hashed asset names for the deployed WASM bundle.
+
+``make deploy`` runs this module over static/game. Every asset except the
+HTML pages gets a copy named ``<stem>.<hash>.<ext>``, and ``manifest.json``
+maps logical names to those copies. The server rewrites references in
+index.html from the manifest and serves hashed names as immutable, so a
+redeploy only invalidates the files whose contents changed. The logical
+files stay in place for anything that still asks for them by name.
+
+Usage (from the server directory):
+    uv run python -m web.asset_manifest static/game
+"""
+
+import argparse
+import hashlib
+import json
+import re
+import shutil
+from pathlib import Path
+
+MANIFEST_NAME = "manifest.json"
+HASH_LENGTH = 12
+# Precompressed siblings are made after hashing, from the hashed copies too
+_SKIPPED_SUFFIXES = (".html", ".gz", ".br")
+
+# pygbag's index.html names its bundle as `archive : "app"` and the loader
+# appends ".apk", so that setting is rewritten to the hashed stem as well.
+_PYGBAG_ARCHIVE = re.compile(r'(\barchive\s*:\s*")([^"]+)(")')
+
+
+def hashed_name(name: str, content: bytes) -> str:
+    """Return ``name`` with a content hash inserted before its extension."""
+    digest = hashlib.blake2b(content, digest_size=16).hexdigest()[:HASH_LENGTH]
+    path = Path(name)
+    return path.with_name(f"{path.stem}.{digest}{path.suffix}").as_posix()
+
+
+def build_manifest(root: Path) -> dict[str, str]:
+    """Write hashed copies of the assets under ``root`` and their manifest."""
+    manifest: dict[str, str] = {}
+    previous = set(load_manifest(root).values())
+    for path in sorted(p for p in root.rglob("*") if p.is_file()):
+        name = path.relative_to(root).as_posix()
+        if (
+            name == MANIFEST_NAME
+            or name in previous
+            or name.endswith(_SKIPPED_SUFFIXES)
+        ):
+            continue
+        hashed = hashed_name(name, path.read_bytes())
+        shutil.copy2(path, root / hashed)
+        manifest[name] = hashed
+    (root / MANIFEST_NAME).write_text(json.dumps(manifest, indent=2, sort_keys=True))
+    return manifest
+
+
+def load_manifest(root: Path) -> dict[str, str]:
+    """Read ``root/manifest.json``, or return {} if the bundle has none."""
+    try:
+        return json.loads((root / MANIFEST_NAME).read_text())
+    except FileNotFoundError:
+        return {}
+
+
+def rewrite_references(html: str, manifest: dict[str, str]) -> str:
+    """Point quoted, attribute and url() references at their hashed names."""
+    if not manifest:
+        return html
+    names = sorted(manifest, key=len, reverse=True)
+    # Only names relative to the bundle root, optionally as ./name or /name
+    references = re.compile(
+        r"(?<=[\"'(=\s])(\.?/)?("
+        + "|".join(map(re.escape, names))
+        + r")(?=[\"'?#)\s]|$)"
+    )
+    html = references.sub(lambda m: (m.group(1) or "") + manifest[m.group(2)], html)
+
+    def archive(match: re.Match[str]) -> str:
+        hashed = manifest.get(f"{match.group(2)}.apk")
+        if hashed is None:
+            return match.group(0)
+        return match.group(1) + hashed.removesuffix(".apk") + match.group(3)
+
+    return _PYGBAG_ARCHIVE.sub(archive, html)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("root", type=Path)
+    args = parser.parse_args()
+    manifest = build_manifest(args.root)
+    for name, hashed in manifest.items():
+        print(f"{name} -> {hashed}")
@@ -0,0 +1,42 @@
+from collections.abc import Iterable
+from typing import Any
+
+import orjson
+from database.repositories import HighScore
+from fastapi.responses import JSONResponse
+
+ScoreRow = tuple[int, str, int, Any]
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson instead of the stdlib encoder."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
+
+
+def encode_score_rows(rows: Iterable[ScoreRow]) -> bytes:
+    """Encode (id, player_name, score, played_at) rows as a ScoresListResponse.
+
+    Produces the same document as the pydantic models without building them.
+    """
+    return orjson.dumps(
+        {
+            "scores": [
+                {
+                    "id": score_id,
+                    "player_name": player_name,
+                    "score": score,
+                    "played_at": str(played_at) if played_at else "",
+                }
+                for score_id, player_name, score, played_at in rows
+            ]
+        }
+    )
+
+
+def encode_high_scores(scores: Iterable[HighScore]) -> bytes:
+    """Encode HighScore objects as a ScoresListResponse document."""
+    return encode_score_rows(
+        (s.id, s.player_name, s.score, s.played_at) for s in scores
+    )
@@ -0,0 +1,46 @@
+import hashlib
+from collections.abc import Callable
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Evaluate an If-None-Match header against an ETag (weak comparison)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
+
+
+class LeaderboardResponseCache:
+    """Encoded GET /api/scores bodies and their ETags, one per ``limit``.
+
+    Entries are tagged with the LeaderboardCache version they were built from
+    and rebuilt only when that version moves. The ETag is a hash of the body,
+    so it stays stable across restarts and changes only with the content.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[int, tuple[int, bytes, str]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(
+        self, limit: int, version: int, encode: Callable[[], bytes]
+    ) -> tuple[bytes, str]:
+        """Return ``(body, etag)`` for ``limit``, re-encoding if out of date."""
+        entry = self._entries.get(limit)
+        if entry is not None and entry[0] == version:
+            self.hits += 1
+            return entry[1], entry[2]
+        self.misses += 1
+        body = encode()
+        etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+        self._entries[limit] = (version, body, etag)
+        return body, etag
+
+    def clear(self) -> None:
+        self._entries.clear()
@@ -0,0 +1,107 @@
+"""Logging that keeps formatting and output off the event loop.
+
+configure_logging() puts a single queue handler on the root logger; calling
+it again replaces that handler and its listener rather than adding more.
+Loggers that bring their own handlers, such as uvicorn's, can be adopted so
+they go through the queue too. The logging thread only enqueues the record, with its message and arguments
+still unformatted, and a QueueListener thread formats and writes it. Pass
+%-style arguments (``logger.info("saved id=%s", row_id)``) rather than
+f-strings, so records that are filtered out or sampled away are never
+formatted at all, and large values are only stringified when their level
+is enabled.
+
+Levels can be set per logger with a spec such as
+``"main.requests=WARNING,database=DEBUG"``. SampleFilter keeps one in N
+records from a high-volume logger.
+"""
+
+import atexit
+import itertools
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from typing import TextIO
+
+LOG_FORMAT = "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
+
+# The handler and listener installed by the last configure_logging() call
+_installed: tuple[QueueHandler, QueueListener] | None = None
+
+
+class DeferredQueueHandler(QueueHandler):
+    """A QueueHandler that leaves all formatting to the listener thread.
+
+    The stock prepare() formats the message on the logging thread so the
+    record can be pickled, which this in-process queue never needs. Log
+    arguments must therefore not be mutated after the call.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+class SampleFilter(logging.Filter):
+    """Passes one in ``every`` records below WARNING, and all others."""
+
+    def __init__(self, every: int) -> None:
+        super().__init__()
+        self.every = max(1, every)
+        self._counter = itertools.count()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+        return next(self._counter) % self.every == 0
+
+
+def parse_levels(spec: str) -> dict[str, str]:
+    """Parse ``"name=LEVEL,other=LEVEL"`` into a logger name -> level dict."""
+    levels = {}
+    for item in spec.split(","):
+        name, separator, level = item.partition("=")
+        if separator and name.strip():
+            levels[name.strip()] = level.strip().upper()
+    return levels
+
+
+def configure_logging(
+    level: str = "INFO",
+    levels: dict[str, str] | None = None,
+    stream: TextIO | None = None,
+    adopt: tuple[str, ...] = (),
+) -> QueueListener:
+    """Route the root logger through a queue to a background writer thread.
+
+    Loggers named in ``adopt`` lose their own handlers and propagate to the
+    root instead. A previous call's handler is removed and its listener
+    stopped. The listener is stopped, flushing what is queued, at
+    interpreter exit.
+    """
+    global _installed
+    root = logging.getLogger()
+    if _installed is not None:
+        previous_handler, previous_listener = _installed
+        root.removeHandler(previous_handler)
+        previous_listener.stop()
+        atexit.unregister(previous_listener.stop)
+
+    handler = logging.StreamHandler(stream)
+    handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    records: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    listener = QueueListener(records, handler, respect_handler_level=True)
+    queue_handler = DeferredQueueHandler(records)
+
+    root.addHandler(queue_handler)
+    root.setLevel(level)
+    for name, logger_level in (levels or {}).items():
+        logging.getLogger(name).setLevel(logger_level)
+    for name in adopt:
+        adopted = logging.getLogger(name)
+        for own_handler in list(adopted.handlers):
+            adopted.removeHandler(own_handler)
+        adopted.propagate = True
+
+    listener.start()
+    atexit.register(listener.stop)
+    _installed = queue_handler, listener
+    return listener
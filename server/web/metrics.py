@@ -0,0 +1,214 @@
+"""Prometheus text-format metrics with a lock-free recording path.
+
+Histograms keep one preallocated bucket array per recording thread, so the
+event loop and the SQLite worker threads never contend or take a lock to
+observe a value; shards are summed only when /metrics is scraped. Gauges
+and counters owned by other objects (token store, caches) are read through
+callbacks at scrape time and cost nothing per request.
+"""
+
+import time
+from bisect import bisect_left
+from collections.abc import Callable, Iterable
+from threading import get_ident
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+METRICS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+LATENCY_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+)
+
+Labels = tuple[str, ...]
+Sample = tuple[dict[str, str], float]
+
+
+class Histogram:
+    """Fixed-bucket histogram sharded by thread."""
+
+    __slots__ = ("_shards", "buckets")
+
+    def __init__(self, buckets: tuple[float, ...]) -> None:
+        self.buckets = buckets
+        # thread id -> [count per bucket..., count above last bucket, sum]
+        self._shards: dict[int, list[float]] = {}
+
+    def observe(self, value: float) -> None:
+        shard = self._shards.get(get_ident())
+        if shard is None:
+            shard = self._shards.setdefault(
+                get_ident(), [0] * (len(self.buckets) + 1) + [0.0]
+            )
+        shard[bisect_left(self.buckets, value)] += 1
+        shard[-1] += value
+
+    def snapshot(self) -> tuple[list[int], float]:
+        """Return cumulative bucket counts (last is +Inf) and the sum."""
+        totals = [0] * (len(self.buckets) + 1)
+        total_sum = 0.0
+        for shard in list(self._shards.values()):
+            for i in range(len(totals)):
+                totals[i] += shard[i]
+            total_sum += shard[-1]
+        cumulative, running = [], 0
+        for count in totals:
+            running += count
+            cumulative.append(running)
+        return cumulative, total_sum
+
+
+class HistogramFamily:
+    """Histograms of one metric, one per label combination."""
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Labels,
+        buckets: tuple[float, ...] = LATENCY_BUCKETS,
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self.buckets = buckets
+        self._children: dict[Labels, Histogram] = {}
+
+    def labels(self, *values: str) -> Histogram:
+        child = self._children.get(values)
+        if child is None:
+            child = self._children.setdefault(values, Histogram(self.buckets))
+        return child
+
+    def observe(self, labels: Labels, value: float) -> None:
+        self.labels(*labels).observe(value)
+
+    def render(self) -> Iterable[str]:
+        yield f"# HELP {self.name} {self.documentation}"
+        yield f"# TYPE {self.name} histogram"
+        bounds = [_format_value(b) for b in self.buckets] + ["+Inf"]
+        for values, child in sorted(self._children.items()):
+            label_text = _format_labels(dict(zip(self.labelnames, values)))
+            prefix = label_text[:-1] + "," if label_text else "{"
+            cumulative, total = child.snapshot()
+            for bound, count in zip(bounds, cumulative):
+                yield f'{self.name}_bucket{prefix}le="{bound}"}} {count}'
+            yield f"{self.name}_sum{label_text} {_format_value(total)}"
+            yield f"{self.name}_count{label_text} {cumulative[-1]}"
+
+
+class CallbackMetric:
+    """A gauge or counter whose samples are produced at scrape time."""
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        kind: str,
+        collect: Callable[[], Iterable[Sample]],
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.kind = kind
+        self.collect = collect
+
+    def render(self) -> Iterable[str]:
+        yield f"# HELP {self.name} {self.documentation}"
+        yield f"# TYPE {self.name} {self.kind}"
+        for labels, value in self.collect():
+            yield f"{self.name}{_format_labels(labels)} {_format_value(value)}"
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self._metrics: list[HistogramFamily | CallbackMetric] = []
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Labels,
+        buckets: tuple[float, ...] = LATENCY_BUCKETS,
+    ) -> HistogramFamily:
+        family = HistogramFamily(name, documentation, labelnames, buckets)
+        self._metrics.append(family)
+        return family
+
+    def callback(
+        self,
+        name: str,
+        documentation: str,
+        kind: str,
+        collect: Callable[[], Iterable[Sample]],
+    ) -> CallbackMetric:
+        metric = CallbackMetric(name, documentation, kind, collect)
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> bytes:
+        lines = [line for metric in self._metrics for line in metric.render()]
+        return ("\n".join(lines) + "\n").encode()
+
+
+class RequestMetricsMiddleware:
+    """Pure ASGI middleware timing each HTTP request by route and status.
+
+    Routes are labelled by their template (``/api/players/{player_name}``),
+    so label cardinality stays bounded by the number of routes.
+    """
+
+    def __init__(self, app: ASGIApp, histogram: HistogramFamily) -> None:
+        self.app = app
+        self.histogram = histogram
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            route = scope.get("route")
+            self.histogram.observe(
+                (
+                    route.path if route is not None else "unmatched",
+                    scope["method"],
+                    str(status),
+                ),
+                time.perf_counter() - start,
+            )
+
+
+def _format_labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+    pairs = ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items())
+    return "{" + pairs + "}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
@@ -0,0 +1,23 @@
+import base64
+import binascii
+
+# SQLite integers are signed 64-bit; larger values overflow when bound
+MAX_SQLITE_INTEGER = 2**63 - 1
+
+
+def encode_cursor(score: int, score_id: int, rank: int) -> str:
+    """Opaque cursor for the leaderboard entry after which the next page starts."""
+    raw = f"{score}:{score_id}:{rank}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[int, int, int]:
+    """Decode a cursor into (score, id, rank). Raises ValueError if malformed."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        score, score_id, rank = (int(part) for part in raw.decode().split(":"))
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        raise ValueError("Malformed cursor") from exc
+    if any(abs(part) > MAX_SQLITE_INTEGER for part in (score, score_id, rank)):
+        raise ValueError("Cursor value out of range")
+    return score, score_id, rank
@@ -0,0 +1,119 @@
+"""Per-client token-bucket rate limiting as pure ASGI middleware.
+
+Each client's bucket is two floats (tokens left, last refill time) refilled
+lazily when the client next asks, so a check is O(1) and needs no timer.
+Buckets are kept in least-recently-used order. A bucket left idle long
+enough to refill completely behaves exactly like a new one, so such buckets
+are dropped from the old end whenever a new client arrives. Rejections are
+a prebuilt 429 sent before routing and never reach a handler or the
+database.
+
+Clients are keyed by ``scope["client"]``; behind a reverse proxy, run
+uvicorn with ``--proxy-headers`` so that is the real peer address.
+"""
+
+import math
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+_REJECTED_BODY = b'{"detail":"Too many requests"}'
+
+
+class TokenBucketLimiter:
+    """Allows ``burst`` requests at once per client, refilling at ``rate``/s.
+
+    At most ``max_clients`` buckets are kept; past that the least recently
+    seen client is forgotten (and gets a full bucket on its next request).
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int,
+        max_clients: int = 100_000,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.rate = rate
+        self.burst = burst
+        self.max_clients = max_clients
+        self.rejected = 0
+        self._clock = clock
+        # Seconds for an empty bucket to refill completely
+        self._idle_seconds = burst / rate
+        # client -> [tokens, last refill], least recently used first
+        self._buckets: OrderedDict[str, list[float]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    def acquire(self, client: str) -> float:
+        """Take a token for ``client``.
+
+        Returns 0.0 if the request is allowed, otherwise the seconds until
+        the next token is available.
+        """
+        now = self._clock()
+        bucket = self._buckets.get(client)
+        if bucket is None:
+            bucket = self._buckets[client] = [float(self.burst), now]
+            self._evict(now)
+        else:
+            self._buckets.move_to_end(client)
+            bucket[0] = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+            bucket[1] = now
+        if bucket[0] >= 1:
+            bucket[0] -= 1
+            return 0.0
+        self.rejected += 1
+        return (1 - bucket[0]) / self.rate
+
+    def clear(self) -> None:
+        self._buckets.clear()
+
+    def _evict(self, now: float) -> None:
+        cutoff = now - self._idle_seconds
+        buckets = self._buckets
+        while len(buckets) > 1:
+            client, (_, last) = next(iter(buckets.items()))
+            if last > cutoff and len(buckets) <= self.max_clients:
+                break
+            del buckets[client]
+
+
+class RateLimitMiddleware:
+    """Applies a limiter per exact (method, path), answering 429 when empty."""
+
+    def __init__(
+        self, app: ASGIApp, limits: dict[tuple[str, str], TokenBucketLimiter]
+    ) -> None:
+        self.app = app
+        self.limits = limits
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            limiter = self.limits.get((scope["method"], scope["path"]))
+            if limiter is not None:
+                client = scope.get("client")
+                retry_after = limiter.acquire(client[0] if client else "")
+                if retry_after:
+                    await _reject(send, retry_after)
+                    return
+        await self.app(scope, receive, send)
+
+
+async def _reject(send: Send, retry_after: float) -> None:
+    await send(
+        {
+            "type": "http.response.start",
+            "status": 429,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(_REJECTED_BODY)).encode()),
+                (b"retry-after", str(math.ceil(retry_after)).encode()),
+            ],
+        }
+    )
+    await send({"type": "http.response.body", "body": _REJECTED_BODY})
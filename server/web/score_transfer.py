@@ -0,0 +1,152 @@
+"""NDJSON and CSV codecs for bulk score export and import.
+
+Exports page through high_scores by primary key, so each chunk is a short
+read and memory stays flat however many rows there are. Imports are parsed
+line by line from the request stream.
+"""
+
+import csv
+import io
+from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Callable
+from datetime import UTC, datetime
+
+import orjson
+
+from .json_response import ScoreRow
+from .pagination import MAX_SQLITE_INTEGER
+
+EXPORT_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+EXPORT_COLUMNS = ("id", "player_name", "score", "played_at")
+
+ImportRow = tuple[str, int, str | None]
+
+
+class ImportRowError(ValueError):
+    """A line of an import stream could not be parsed or validated."""
+
+    def __init__(self, line_number: int, reason: str) -> None:
+        super().__init__(f"Line {line_number}: {reason}")
+        self.line_number = line_number
+
+
+def encode_export_rows(rows: list[ScoreRow], fmt: str) -> bytes:
+    """Encode (id, player_name, score, played_at) rows as NDJSON or CSV lines."""
+    if fmt == "ndjson":
+        return b"".join(
+            orjson.dumps(
+                {
+                    "id": score_id,
+                    "player_name": player_name,
+                    "score": score,
+                    "played_at": str(played_at) if played_at else "",
+                }
+            )
+            + b"\n"
+            for score_id, player_name, score, played_at in rows
+        )
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    return buffer.getvalue().encode()
+
+
+async def iter_export(
+    fetch: Callable[[int, int], Awaitable[list[ScoreRow]]],
+    fmt: str,
+    batch_size: int,
+) -> AsyncIterator[bytes]:
+    """Yield encoded chunks of ``fetch(after_id, limit)`` pages in id order."""
+    if fmt == "csv":
+        buffer = io.StringIO()
+        csv.writer(buffer).writerow(EXPORT_COLUMNS)
+        yield buffer.getvalue().encode()
+    after_id = 0
+    while True:
+        rows = await fetch(after_id, batch_size)
+        if rows:
+            yield encode_export_rows(rows, fmt)
+        if len(rows) < batch_size:
+            return
+        after_id = rows[-1][0]
+
+
+async def iter_import_rows(
+    chunks: AsyncIterable[bytes], fmt: str, max_name_length: int
+) -> AsyncIterator[ImportRow]:
+    """Parse an NDJSON or CSV byte stream into validated import rows.
+
+    Raises ImportRowError on the first bad line. CSV input needs a header
+    row with at least ``player_name`` and ``score``; ``id`` is ignored so
+    imported rows get fresh IDs.
+    """
+    columns: list[str] | None = None
+    line_number = 0
+    async for line in _iter_lines(chunks, quoted=fmt == "csv"):
+        line_number += 1
+        if not line.strip():
+            continue
+        try:
+            if fmt == "ndjson":
+                record = orjson.loads(line)
+                if not isinstance(record, dict):
+                    raise ValueError("expected a JSON object")
+            else:
+                fields = next(csv.reader([line.decode()]))
+                if columns is None:
+                    columns = fields
+                    if not {"player_name", "score"} <= set(columns):
+                        raise ValueError("header needs player_name and score")
+                    continue
+                record = dict(zip(columns, fields))
+            yield _validate(record, max_name_length)
+        except (TypeError, ValueError, UnicodeDecodeError) as exc:
+            raise ImportRowError(line_number, str(exc)) from None
+
+
+async def _iter_lines(
+    chunks: AsyncIterable[bytes], quoted: bool
+) -> AsyncIterator[bytes]:
+    """Split a byte stream on newlines, keeping quoted CSV newlines together."""
+    pending = b""
+    async for chunk in chunks:
+        pending += chunk
+        # Lines are sliced out by offset; the unfinished tail is copied once
+        start = search = 0
+        while (end := pending.find(b"\n", search)) != -1:
+            search = end + 1
+            line = pending[start:end]
+            # An odd number of quotes means the newline is inside a field
+            if quoted and line.count(b'"') % 2:
+                continue
+            yield line.rstrip(b"\r")
+            start = search
+        pending = pending[start:]
+    if pending:
+        yield pending.rstrip(b"\r")
+
+
+def _validate(record: dict, max_name_length: int) -> ImportRow:
+    player_name = record.get("player_name")
+    if not isinstance(player_name, str) or not 0 < len(player_name) <= max_name_length:
+        raise ValueError("invalid player_name")
+    score = record.get("score")
+    if isinstance(score, str):
+        score = int(score)
+    if (
+        not isinstance(score, int)
+        or isinstance(score, bool)
+        or not 0 <= score <= MAX_SQLITE_INTEGER
+    ):
+        raise ValueError("invalid score")
+    return player_name, score, _normalize_played_at(record.get("played_at"))
+
+
+def _normalize_played_at(value: object) -> str | None:
+    """Return played_at in SQLite's CURRENT_TIMESTAMP form (UTC), or None."""
+    if value in (None, ""):
+        return None
+    if not isinstance(value, str):
+        raise TypeError("invalid played_at")
+    played_at = datetime.fromisoformat(value)
+    if played_at.tzinfo is not None:
+        played_at = played_at.astimezone(UTC).replace(tzinfo=None)
+    return played_at.strftime("%Y-%m-%d %H:%M:%S")
@@ -0,0 +1,213 @@
+"""Indexed, precompressed static file serving for the WASM bundle.
+
+The bundle directory is scanned once and every file's stat result and
+content ETag kept in memory, so requests are a dict lookup rather than
+filesystem checks. ``name.br`` / ``name.gz`` siblings produced by
+``make deploy`` are served to clients that accept them. The index is
+rebuilt when the directory's mtime changes (``make deploy`` replaces its
+contents), checked at most once per ``check_interval`` seconds. Rebuilds
+triggered by a request run in a background thread, and the previous index
+is served until the new one is ready.
+
+When the bundle has a manifest.json (see asset_manifest), HTML pages are
+served from memory with references rewritten to the hashed names, and the
+hashed files are served as immutable.
+"""
+
+import gzip
+import hashlib
+import mimetypes
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from fastapi.responses import FileResponse, Response
+from starlette.datastructures import Headers
+
+from .asset_manifest import load_manifest, rewrite_references
+from .leaderboard_responses import etag_matches
+
+# Content-Encoding -> file suffix, in order of preference
+ENCODINGS = {"br": ".br", "gzip": ".gz"}
+# Hashed names change whenever their content does
+IMMUTABLE = "public, max-age=31536000, immutable"
+
+
+@dataclass(frozen=True, slots=True)
+class StaticVariant:
+    """A file on disk (``path``/``stat``) or an in-memory ``content`` body."""
+
+    etag: str
+    path: Path | None = None
+    stat: os.stat_result | None = None
+    content: bytes | None = None
+
+
+@dataclass(slots=True)
+class StaticAsset:
+    media_type: str
+    identity: StaticVariant
+    encoded: dict[str, StaticVariant] = field(default_factory=dict)
+    cache_control: str | None = None
+
+
+class StaticSite:
+    """Serves files under ``root`` from an in-memory index."""
+
+    def __init__(
+        self, root: Path, cache_control: str = "no-cache", check_interval: float = 1.0
+    ) -> None:
+        self.root = root
+        self.cache_control = cache_control
+        self.check_interval = check_interval
+        self._assets: dict[str, StaticAsset] = {}
+        self._root_mtime: int | None = None
+        self._checked_at = float("-inf")
+        self._lock = threading.Lock()
+
+    def reload(self) -> None:
+        """Rebuild the index from disk."""
+        with self._lock:
+            self._rebuild()
+
+    def _rebuild(self) -> None:
+        try:
+            root_mtime = self.root.stat().st_mtime_ns
+        except FileNotFoundError:
+            self._assets, self._root_mtime = {}, None
+            return
+        assets = _index(self.root)
+        # Swapped in whole, so requests see either the old or the new index
+        self._assets = assets
+        self._root_mtime = root_mtime
+        self._checked_at = time.monotonic()
+
+    def _rebuild_and_release(self) -> None:
+        try:
+            self._rebuild()
+        finally:
+            self._lock.release()
+
+    def _refresh_if_changed(self) -> None:
+        now = time.monotonic()
+        if now - self._checked_at < self.check_interval:
+            return
+        self._checked_at = now
+        try:
+            root_mtime = self.root.stat().st_mtime_ns
+        except FileNotFoundError:
+            root_mtime = None
+        # Hashing the bundle takes a while, so never on the caller's thread;
+        # if a rebuild is already running, it will be checked again after
+        if root_mtime != self._root_mtime and self._lock.acquire(blocking=False):
+            threading.Thread(target=self._rebuild_and_release, daemon=True).start()
+
+    def get(self, path: str) -> StaticAsset | None:
+        self._refresh_if_changed()
+        return self._assets.get(path)
+
+    def response(self, path: str, headers: Headers) -> Response | None:
+        """Build the response for ``path``, or None if it is not in the bundle."""
+        asset = self.get(path)
+        if asset is None:
+            return None
+        variant, encoding = asset.identity, None
+        # Ranges are served from the identity file so offsets mean what they say
+        if asset.encoded and "range" not in headers:
+            accepted = _accepted_encodings(headers.get("accept-encoding"))
+            for name, candidate in asset.encoded.items():
+                if name in accepted or "*" in accepted:
+                    variant, encoding = candidate, name
+                    break
+
+        response_headers = {
+            "ETag": variant.etag,
+            "Cache-Control": asset.cache_control or self.cache_control,
+        }
+        if asset.encoded:
+            response_headers["Vary"] = "Accept-Encoding"
+        if encoding is not None:
+            response_headers["Content-Encoding"] = encoding
+        if etag_matches(headers.get("if-none-match"), variant.etag):
+            return Response(status_code=304, headers=response_headers)
+        if variant.content is not None:
+            return Response(
+                variant.content, media_type=asset.media_type, headers=response_headers
+            )
+        return FileResponse(
+            variant.path,
+            stat_result=variant.stat,
+            media_type=asset.media_type,
+            headers=response_headers,
+        )
+
+
+def _index(root: Path) -> dict[str, StaticAsset]:
+    assets: dict[str, StaticAsset] = {}
+    encoded_suffixes = tuple(ENCODINGS.values())
+    manifest = load_manifest(root)
+    hashed_names = set(manifest.values())
+    files = {p for p in root.rglob("*") if p.is_file()}
+    for path in sorted(files):
+        if path.name.endswith(encoded_suffixes) and path.with_suffix("") in files:
+            continue
+        name = path.relative_to(root).as_posix()
+        media_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+        if manifest and path.suffix == ".html":
+            assets[name] = _rewritten_page(path, manifest, media_type)
+            continue
+        identity = _variant(path)
+        asset = StaticAsset(media_type, identity)
+        if name in hashed_names:
+            asset.cache_control = IMMUTABLE
+        for encoding, suffix in ENCODINGS.items():
+            sibling = path.with_name(path.name + suffix)
+            if sibling.is_file():
+                variant = _variant(sibling)
+                # Only worth sending if it actually saves bytes
+                if variant.stat.st_size < identity.stat.st_size:
+                    asset.encoded[encoding] = variant
+        assets[name] = asset
+    return assets
+
+
+def _rewritten_page(
+    path: Path, manifest: dict[str, str], media_type: str
+) -> StaticAsset:
+    content = rewrite_references(path.read_text(), manifest).encode()
+    compressed = gzip.compress(content, compresslevel=9, mtime=0)
+    return StaticAsset(
+        media_type,
+        StaticVariant(_etag(content), content=content),
+        {"gzip": StaticVariant(_etag(compressed), content=compressed)},
+    )
+
+
+def _etag(content: bytes) -> str:
+    return f'"{hashlib.blake2b(content, digest_size=16).hexdigest()}"'
+
+
+def _variant(path: Path) -> StaticVariant:
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return StaticVariant(f'"{digest.hexdigest()}"', path, path.stat())
+
+
+def _accepted_encodings(header: str | None) -> set[str]:
+    accepted = set()
+    for part in (header or "").split(","):
+        name, _, params = part.partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        if quality > 0:
+            accepted.add(name.strip().lower())
+    return accepted
@@ -10,9 +10,18 @@ class Shot(CircleShape):
         super().__init__(x, y, SHOT_RADIUS)
 
     @override
-    def draw(self, screen: pygame.Surface) -> None:
-        pygame.draw.circle(screen, "blue", self.position, self.radius, LINE_WIDTH)
+    def draw(self, screen: pygame.Surface, scale: float = 1.0) -> None:
+        pygame.draw.circle(
+            screen,
+            "blue",
+            self.position * scale,
+            self.radius * scale,
+            max(1, round(LINE_WIDTH * scale)),
+        )
 
     @override
     def update(self, dt: float) -> None:
-        self.position += self.velocity * dt
+        self.previous_position.update(self.position)
+        step = self.velocity * dt
+        self.position += step
+        self.travel = step.length()
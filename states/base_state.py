@@ -19,8 +19,14 @@ class GameStateType(Enum):
 class BaseState(ABC):
     """Abstract base class for all game states."""
 
+    # Idle-aware states only change in response to input or their own
+    # update(), and set ``dirty`` when they do. Game skips rendering them
+    # while they are clean and runs them at a low tick rate.
+    idle_aware = False
+
     def __init__(self, game: "Game"):
         self.game = game
+        self.dirty = True
 
     @abstractmethod
     async def enter(self):
@@ -46,3 +52,6 @@ class BaseState(ABC):
     async def render(self, screen: pygame.Surface):
         """Render this state to the screen."""
         pass
+
+    def record_frame_time(self, work_ms: float) -> None:
+        """Called each frame with how long its update and render took, in ms."""
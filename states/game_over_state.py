@@ -20,6 +20,7 @@ class GameOverState(BaseState):
 
     MENU_OPTIONS = ["Play Again", "Main Menu"]
     MAX_NAME_LENGTH = 20
+    idle_aware = True
 
     def __init__(self, game: "Game"):
         super().__init__(game)
@@ -60,6 +61,7 @@ class GameOverState(BaseState):
 
     def _handle_name_input(self, event: pygame.event.Event) -> GameStateType | None:
         if event.type == pygame.KEYDOWN:
+            self.dirty = True
             if event.key == pygame.K_RETURN and len(self.player_name) > 0:
                 self.should_submit = True
             elif event.key == pygame.K_BACKSPACE:
@@ -77,8 +79,10 @@ class GameOverState(BaseState):
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_UP:
                 self.selected_index = (self.selected_index - 1) % len(self.MENU_OPTIONS)
+                self.dirty = True
             elif event.key == pygame.K_DOWN:
                 self.selected_index = (self.selected_index + 1) % len(self.MENU_OPTIONS)
+                self.dirty = True
             elif event.key == pygame.K_RETURN:
                 option = self.MENU_OPTIONS[self.selected_index]
                 if option == "Play Again":
@@ -94,6 +98,7 @@ class GameOverState(BaseState):
                 self.game.final_score
             )
             self.loading = False
+            self.dirty = True
 
         # Handle score submission
         if self.should_submit and not self.submitting:
@@ -104,6 +109,7 @@ class GameOverState(BaseState):
             self.submitting = False
             self.should_submit = False
             self.name_submitted = True
+            self.dirty = True
 
         return None
 
@@ -12,6 +12,8 @@ if TYPE_CHECKING:
 class HighScoresState(BaseState):
     """Display top 10 high scores."""
 
+    idle_aware = True
+
     def __init__(self, game: "Game"):
         super().__init__(game)
         self.scores = []
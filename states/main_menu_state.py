@@ -14,6 +14,7 @@ class MainMenuState(BaseState):
     """Main menu with New Game, High Scores, Quit options."""
 
     MENU_OPTIONS = ["New Game", "High Scores", "Quit"]
+    idle_aware = True
 
     def __init__(self, game: "Game"):
         super().__init__(game)
@@ -38,8 +39,10 @@ class MainMenuState(BaseState):
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_UP:
                 self.selected_index = (self.selected_index - 1) % len(self.MENU_OPTIONS)
+                self.dirty = True
             elif event.key == pygame.K_DOWN:
                 self.selected_index = (self.selected_index + 1) % len(self.MENU_OPTIONS)
+                self.dirty = True
             elif event.key == pygame.K_RETURN:
                 return self._select_option()
         return None
@@ -13,18 +13,41 @@ class PausedState(BaseState):
     """Pause menu overlay."""
 
     MENU_OPTIONS = ["Resume", "Main Menu"]
+    idle_aware = True
 
     def __init__(self, game: "Game"):
         super().__init__(game)
         self.selected_index = 0
         self.title_font = None
         self.menu_font = None
+        # The dimmed game frame and title, composited once per pause
+        self.background = None
 
     async def enter(self):
         self.selected_index = 0
         pygame.font.init()
         self.title_font = pygame.font.Font(None, FONT_SIZE_LARGE)
         self.menu_font = pygame.font.Font(None, FONT_SIZE_MEDIUM)
+        await self._snapshot_background()
+
+    async def _snapshot_background(self) -> None:
+        """Draw the frozen game, the dimming overlay and the title once."""
+        if self.background is None:
+            self.background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        playing_state = self.game.states[GameStateType.PLAYING]
+        await playing_state.render(self.background)
+
+        # Draw semi-transparent overlay
+        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        overlay.fill((0, 0, 0, 180))
+        self.background.blit(overlay, (0, 0))
+
+        # Render "PAUSED" text
+        paused_text = self.title_font.render("PAUSED", True, "white")
+        paused_rect = paused_text.get_rect(
+            center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 80)
+        )
+        self.background.blit(paused_text, paused_rect)
 
     async def exit(self):
         pass
@@ -35,8 +58,10 @@ class PausedState(BaseState):
                 return GameStateType.PLAYING  # Resume on ESC
             elif event.key == pygame.K_UP:
                 self.selected_index = (self.selected_index - 1) % len(self.MENU_OPTIONS)
+                self.dirty = True
             elif event.key == pygame.K_DOWN:
                 self.selected_index = (self.selected_index + 1) % len(self.MENU_OPTIONS)
+                self.dirty = True
             elif event.key == pygame.K_RETURN:
                 return self._select_option()
         return None
@@ -53,21 +78,9 @@ class PausedState(BaseState):
         return None
 
     async def render(self, screen: pygame.Surface):
-        # First render the frozen game underneath (from playing state)
-        playing_state = self.game.states[GameStateType.PLAYING]
-        await playing_state.render(screen)
-
-        # Draw semi-transparent overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        screen.blit(overlay, (0, 0))
-
-        # Render "PAUSED" text
-        paused_text = self.title_font.render("PAUSED", True, "white")
-        paused_rect = paused_text.get_rect(
-            center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 80)
-        )
-        screen.blit(paused_text, paused_rect)
+        # Only redrawn when the selection changes; the game underneath is
+        # the frame captured on enter
+        screen.blit(self.background, (0, 0))
 
         # Render menu options
         start_y = SCREEN_HEIGHT // 2
@@ -14,7 +14,9 @@ from constants import (
     SCREEN_WIDTH,
     STARTING_LIVES,
 )
+from particles import ParticleSystem
 from player import Player
+from resolution import ResolutionScaler
 from shot import Shot
 from ui.hud import HUD
 from .base_state import BaseState, GameStateType
@@ -38,6 +40,8 @@ class PlayingState(BaseState):
         self.player = None
         self.asteroid_field = None
         self.hud = None
+        self.particles = ParticleSystem()
+        self.resolution = ResolutionScaler()
 
     def _reset_game_session(self) -> None:
         """Initialize/reset all game session variables."""
@@ -59,6 +63,9 @@ class PlayingState(BaseState):
         Asteroid.containers = (self.asteroids, self.updatable, self.drawable)
         AsteroidField.containers = (self.updatable,)
         Shot.containers = (self.shots, self.drawable, self.updatable)
+        self.particles.clear()
+        Asteroid.particles = self.particles
+        Player.particles = self.particles
 
         # Create game objects
         self.asteroid_field = AsteroidField()
@@ -81,6 +88,7 @@ class PlayingState(BaseState):
 
     async def update(self, dt: float) -> GameStateType | None:
         self.updatable.update(dt)
+        self.particles.update(dt)
 
         # Check player-asteroid collisions
         for asteroid in list(self.asteroids):
@@ -89,9 +97,10 @@ class PlayingState(BaseState):
                 if result:
                     return result
 
-            # Check shot-asteroid collisions
+            # Check shot-asteroid collisions along the whole frame's movement,
+            # so fast shots cannot skip over an asteroid on a long frame
             for shot in list(self.shots):
-                if shot.collide_with(asteroid):
+                if shot.sweep_collides_with(asteroid):
                     shot.kill()
                     points = self._get_asteroid_points(asteroid)
                     self.score += points
@@ -139,8 +148,17 @@ class PlayingState(BaseState):
             self.lives += 1
             self.extra_life_threshold += EXTRA_LIFE_POINTS
 
+    def record_frame_time(self, work_ms: float) -> None:
+        self.resolution.record(work_ms)
+
     async def render(self, screen: pygame.Surface):
-        screen.fill("black")
+        # The playfield is drawn at the adaptive resolution and stretched to
+        # the screen; the HUD goes on top at full resolution to stay sharp.
+        playfield = self.resolution.target(screen)
+        scale = playfield.get_width() / SCREEN_WIDTH
+        playfield.fill("black")
+        self.particles.draw(playfield, scale)
         for obj in self.drawable:
-            obj.draw(screen)
+            obj.draw(playfield, scale)
+        self.resolution.present(playfield, screen)
         self.hud.render(screen, self.score, self.lives)
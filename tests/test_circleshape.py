@@ -0,0 +1,61 @@
+"""Tests for CircleShape collision checks."""
+
+import pygame
+
+from asteroid import Asteroid
+from constants import ASTEROID_MIN_RADIUS, SHOT_RADIUS
+from shot import Shot
+
+DT = 0.2
+SHOT_SPEED = 500
+SUM_RADIUS = ASTEROID_MIN_RADIUS + SHOT_RADIUS
+
+
+def _shot_past(asteroid: Asteroid, offset: float) -> Shot:
+    """A shot that flies past ``asteroid`` in one step, ``offset`` off centre."""
+    shot = Shot(asteroid.position.x - 60, asteroid.position.y + offset)
+    shot.velocity = pygame.Vector2(SHOT_SPEED, 0)
+    shot.update(DT)
+    return shot
+
+
+class TestSweepCollidesWith:
+    """Tests for CircleShape.sweep_collides_with."""
+
+    def test_catches_shot_tunnelling_through(self) -> None:
+        """A hit between two frames should count even if neither frame overlaps."""
+        asteroid = Asteroid(300, 300, ASTEROID_MIN_RADIUS)
+        asteroid.update(DT)
+        shot = _shot_past(asteroid, 0)
+
+        assert shot.position.x - asteroid.position.x == 40
+        assert not shot.collide_with(asteroid)
+        assert shot.sweep_collides_with(asteroid)
+        assert asteroid.sweep_collides_with(shot)
+
+    def test_near_miss(self) -> None:
+        """A path that passes just outside the radii should not collide."""
+        asteroid = Asteroid(300, 300, ASTEROID_MIN_RADIUS)
+        asteroid.update(DT)
+
+        assert not _shot_past(asteroid, SUM_RADIUS + 1).sweep_collides_with(asteroid)
+        assert _shot_past(asteroid, SUM_RADIUS - 1).sweep_collides_with(asteroid)
+
+    def test_zero_relative_motion(self) -> None:
+        """Shapes moving together should collide only if they already overlap."""
+        asteroid = Asteroid(300, 300, ASTEROID_MIN_RADIUS)
+        touching = Shot(300 + SUM_RADIUS - 1, 300)
+        apart = Shot(300 + SUM_RADIUS + 1, 300)
+        for shape in (asteroid, touching, apart):
+            shape.velocity = pygame.Vector2(SHOT_SPEED, 0)
+            shape.update(DT)
+
+        assert touching.sweep_collides_with(asteroid)
+        assert not apart.sweep_collides_with(asteroid)
+
+    def test_stationary_shapes(self) -> None:
+        """Without any motion the sweep should match collide_with."""
+        asteroid = Asteroid(300, 300, ASTEROID_MIN_RADIUS)
+        for x in (300 + SUM_RADIUS - 1, 300 + SUM_RADIUS + 1):
+            shot = Shot(x, 300)
+            assert shot.sweep_collides_with(asteroid) == shot.collide_with(asteroid)
@@ -0,0 +1,79 @@
+"""Tests for the adaptive ResolutionScaler."""
+
+import pygame
+
+from constants import (
+    FRAME_BUDGET_MS,
+    RENDER_SCALE_DOWN_FRAMES,
+    RENDER_SCALE_LEVELS,
+    RENDER_SCALE_UP_FRAMES,
+    SCREEN_HEIGHT,
+    SCREEN_WIDTH,
+)
+from resolution import ResolutionScaler
+
+SLOW_MS = FRAME_BUDGET_MS * 1.5
+FAST_MS = FRAME_BUDGET_MS * 0.25
+
+
+class TestResolutionScaler:
+    """Tests for ResolutionScaler."""
+
+    def test_steps_down_after_sustained_overrun(self) -> None:
+        """Frames over budget should lower the scale after a few in a row."""
+        scaler = ResolutionScaler()
+        for _ in range(RENDER_SCALE_DOWN_FRAMES - 1):
+            scaler.record(SLOW_MS)
+        assert scaler.scale == RENDER_SCALE_LEVELS[0]
+
+        scaler.record(SLOW_MS)
+        assert scaler.scale == RENDER_SCALE_LEVELS[1]
+
+    def test_single_spike_keeps_scale(self) -> None:
+        """One slow frame among fast ones should not change the level."""
+        scaler = ResolutionScaler()
+        for _ in range(10):
+            scaler.record(FAST_MS)
+        scaler.record(FRAME_BUDGET_MS * 6)
+        for _ in range(RENDER_SCALE_DOWN_FRAMES * 2):
+            scaler.record(FAST_MS)
+        assert scaler.level == 0
+
+    def test_steps_up_only_after_long_headroom(self) -> None:
+        """A lowered scale should recover only after many fast frames."""
+        scaler = ResolutionScaler()
+        for _ in range(RENDER_SCALE_DOWN_FRAMES):
+            scaler.record(SLOW_MS)
+        assert scaler.level == 1
+
+        for _ in range(RENDER_SCALE_UP_FRAMES - 1):
+            scaler.record(FAST_MS)
+        assert scaler.level == 1
+
+        scaler.record(FAST_MS)
+        assert scaler.level == 0
+
+    def test_level_stays_in_range(self) -> None:
+        """The scale should stop at the first and last levels."""
+        scaler = ResolutionScaler()
+        for _ in range(RENDER_SCALE_UP_FRAMES):
+            scaler.record(FAST_MS)
+        assert scaler.level == 0
+
+        for _ in range(RENDER_SCALE_DOWN_FRAMES * (len(RENDER_SCALE_LEVELS) + 2)):
+            scaler.record(SLOW_MS)
+        assert scaler.scale == RENDER_SCALE_LEVELS[-1]
+
+    def test_target_is_screen_at_full_scale(self) -> None:
+        """At full scale the playfield is drawn straight onto the screen."""
+        scaler = ResolutionScaler(levels=(1.0, 0.5))
+        screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        assert scaler.target(screen) is screen
+
+        scaler.level = 1
+        target = scaler.target(screen)
+        assert target.get_size() == (
+            round(SCREEN_WIDTH * 0.5),
+            round(SCREEN_HEIGHT * 0.5),
+        )
+        assert scaler.target(screen) is target